@@ -45,6 +45,9 @@ setup(
             "flake8>=3.8",
             "mypy>=0.800",
         ],
+        "numba": [
+            "numba>=0.56",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -7,14 +7,14 @@ Generates detailed visualizations, statistical analysis, and t-tests for academi
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
-import seaborn as sns
+from plot_style import HUSL_PALETTE
 from scipy import stats
 import warnings
 warnings.filterwarnings('ignore')
 
 # Set style for publication-quality plots
 plt.style.use('seaborn-v0_8-whitegrid')
-sns.set_palette("husl")
+plt.rcParams['axes.prop_cycle'] = plt.cycler(color=HUSL_PALETTE)
 plt.rcParams['figure.figsize'] = (14, 10)
 plt.rcParams['font.size'] = 12
 plt.rcParams['axes.titlesize'] = 16
@@ -6,8 +6,7 @@ Loads CSV datasets back into the data structures needed by optimization algorith
 
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Tuple
-from dataclasses import dataclass
+from typing import List, Dict, Tuple, NamedTuple
 from enum import Enum
 
 # ============================================================================
@@ -90,8 +89,7 @@ class Expertise(Enum):
     PHARMACY = "Pharmacy"
     PHYSICAL_THERAPY = "Physical Therapy"
 
-@dataclass
-class Course:
+class Course(NamedTuple):
     """Comprehensive course structure with realistic academic parameters"""
     id: str
     name: str
@@ -109,8 +107,7 @@ class Course:
     can_be_shared: bool
     semester: str
 
-@dataclass
-class Professor:
+class Professor(NamedTuple):
     """Comprehensive faculty member with realistic workload model"""
     id: str
     name: str
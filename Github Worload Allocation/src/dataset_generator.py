@@ -4,16 +4,15 @@ Comprehensive Dataset Generator for University Faculty Workload Allocation
 Generates realistic data for 100 professors and 80 courses across multiple departments
 """
 
+import csv
+import functools
 import numpy as np
-import pandas as pd
-import random
-from typing import List, Dict, Tuple
-from dataclasses import dataclass
+from collections import Counter
+from typing import List, Dict, Tuple, NamedTuple
 from enum import Enum
 
-# Set random seeds for reproducibility
-np.random.seed(42)
-random.seed(42)
+# Single seeded generator for reproducibility
+rng = np.random.default_rng(42)
 
 # ============================================================================
 # EXPANDED EXPERTISE AREAS FOR MULTI-DEPARTMENT UNIVERSITY
@@ -95,12 +94,14 @@ class Expertise(Enum):
     PHARMACY = "Pharmacy"
     PHYSICAL_THERAPY = "Physical Therapy"
 
+# Plain dict lookup is cheaper than the enum .value descriptor in hot loops
+EXPERTISE_VALUES = {e: e.value for e in Expertise}
+
 # ============================================================================
 # REALISTIC DATA STRUCTURES
 # ============================================================================
 
-@dataclass
-class Course:
+class Course(NamedTuple):
     """Comprehensive course structure with realistic academic parameters"""
     id: str
     name: str
@@ -118,8 +119,7 @@ class Course:
     can_be_shared: bool  # Whether course can be team-taught
     semester: str  # Fall, Spring, Summer, or Both
 
-@dataclass
-class Professor:
+class Professor(NamedTuple):
     """Comprehensive faculty member with realistic workload model"""
     id: str
     name: str
@@ -136,55 +136,167 @@ class Professor:
     teaching_quality: float  # Historical teaching score (0.0-1.0)
     availability: List[str]  # Semesters available
 
+# ============================================================================
+# NAME POOLS
+# ============================================================================
+
+FIRST_NAMES = (
+    "James", "Mary", "John", "Patricia", "Robert", "Jennifer", "Michael", "Linda",
+    "William", "Elizabeth", "David", "Barbara", "Richard", "Susan", "Joseph", "Jessica",
+    "Thomas", "Sarah", "Christopher", "Karen", "Charles", "Nancy", "Daniel", "Lisa",
+    "Matthew", "Betty", "Anthony", "Helen", "Mark", "Sandra", "Donald", "Donna",
+    "Steven", "Carol", "Paul", "Ruth", "Andrew", "Sharon", "Joshua", "Michelle",
+    "Kenneth", "Laura", "Kevin", "Emily", "Brian", "Kimberly", "George", "Deborah",
+    "Edward", "Dorothy", "Ronald", "Lisa", "Timothy", "Nancy", "Jason", "Karen",
+    "Jeffrey", "Betty", "Ryan", "Helen", "Jacob", "Sandra", "Gary", "Donna",
+    "Nicholas", "Carol", "Eric", "Ruth", "Jonathan", "Sharon", "Stephen", "Michelle",
+    "Larry", "Laura", "Justin", "Emily", "Scott", "Kimberly", "Brandon", "Deborah",
+    "Benjamin", "Dorothy", "Frank", "Lisa", "Gregory", "Nancy", "Raymond", "Karen",
+    "Samuel", "Betty", "Patrick", "Helen", "Alexander", "Sandra", "Jack", "Donna",
+    "Dennis", "Carol", "Jerry", "Ruth", "Tyler", "Sharon", "Aaron", "Michelle",
+    "Jose", "Laura", "Adam", "Emily", "Nathan", "Kimberly", "Henry", "Deborah"
+)
+
+LAST_NAMES = (
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis",
+    "Rodriguez", "Martinez", "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson",
+    "Thomas", "Taylor", "Moore", "Jackson", "Martin", "Lee", "Perez", "Thompson",
+    "White", "Harris", "Sanchez", "Clark", "Ramirez", "Lewis", "Robinson", "Walker",
+    "Young", "Allen", "King", "Wright", "Scott", "Torres", "Nguyen", "Hill",
+    "Flores", "Green", "Adams", "Nelson", "Baker", "Hall", "Rivera", "Campbell",
+    "Mitchell", "Carter", "Roberts", "Gomez", "Phillips", "Evans", "Turner",
+    "Diaz", "Parker", "Cruz", "Edwards", "Collins", "Reyes", "Stewart", "Morris",
+    "Morales", "Murphy", "Cook", "Rogers", "Gutierrez", "Ortiz", "Morgan", "Cooper",
+    "Peterson", "Bailey", "Reed", "Kelly", "Howard", "Ramos", "Kim", "Cox",
+    "Ward", "Richardson", "Watson", "Brooks", "Chavez", "Wood", "James", "Bennett",
+    "Gray", "Mendoza", "Ruiz", "Hughes", "Price", "Alvarez", "Castillo", "Sanders"
+)
+
+# ============================================================================
+# COURSE CATALOGUE
+# ============================================================================
+
+# Computer Science Courses (20 courses)
+CS_COURSES = (
+    ("CS101", "Introduction to Programming", "COMP", 3, 2, 120, [Expertise.COMPUTER_SCIENCE], 1, 1, 2, 30, 1.5, True, "Both"),
+    ("CS102", "Data Structures", "COMP", 3, 2, 100, [Expertise.DATA_STRUCTURES], 2, 1, 2, 25, 1.8, True, "Both"),
+    ("CS201", "Algorithms", "COMP", 3, 1, 80, [Expertise.ALGORITHMS], 2, 1, 2, 20, 2.0, True, "Both"),
+    ("CS202", "Computer Organization", "COMP", 3, 2, 90, [Expertise.COMPUTER_ENGINEERING], 2, 1, 2, 25, 1.7, True, "Both"),
+    ("CS301", "Operating Systems", "COMP", 3, 2, 70, [Expertise.OPERATING_SYSTEMS], 3, 1, 2, 20, 2.2, True, "Both"),
+    ("CS302", "Database Systems", "COMP", 3, 2, 85, [Expertise.DATABASE_SYSTEMS], 3, 1, 2, 25, 1.9, True, "Both"),
+    ("CS401", "Software Engineering", "COMP", 3, 2, 60, [Expertise.SOFTWARE_ENGINEERING], 4, 1, 3, 30, 2.5, True, "Both"),
+    ("CS402", "Computer Networks", "COMP", 3, 1, 65, [Expertise.COMPUTER_NETWORKS], 4, 1, 2, 20, 2.1, True, "Both"),
+    ("CS501", "Artificial Intelligence", "COMP", 3, 1, 50, [Expertise.ARTIFICIAL_INTELLIGENCE], 5, 1, 2, 20, 2.8, True, "Both"),
+    ("CS502", "Machine Learning", "COMP", 3, 1, 55, [Expertise.MACHINE_LEARNING], 5, 1, 2, 25, 2.6, True, "Both"),
+    ("CS601", "Advanced Algorithms", "COMP", 3, 0, 40, [Expertise.ALGORITHMS], 5, 1, 2, 20, 3.0, False, "Both"),
+    ("CS602", "Computer Graphics", "COMP", 3, 1, 45, [Expertise.COMPUTER_GRAPHICS], 5, 1, 2, 20, 2.4, True, "Both"),
+    ("CS701", "Research Methods", "COMP", 2, 1, 30, [Expertise.COMPUTER_SCIENCE], 5, 1, 2, 15, 2.5, False, "Both"),
+    ("CS702", "Thesis Project", "COMP", 1, 0, 25, [Expertise.COMPUTER_SCIENCE], 5, 1, 1, 40, 3.5, False, "Both"),
+    ("CS801", "Advanced Topics", "COMP", 3, 0, 20, [Expertise.COMPUTER_SCIENCE], 5, 1, 2, 20, 3.2, False, "Both"),
+    ("CS802", "Seminar", "COMP", 2, 0, 15, [Expertise.COMPUTER_SCIENCE], 5, 1, 2, 15, 2.8, False, "Both"),
+    ("CS803", "Independent Study", "COMP", 1, 0, 10, [Expertise.COMPUTER_SCIENCE], 5, 1, 1, 30, 3.0, False, "Both"),
+    ("CS804", "Special Topics", "COMP", 3, 1, 35, [Expertise.COMPUTER_SCIENCE], 4, 1, 2, 20, 2.3, True, "Both"),
+    ("CS805", "Capstone Project", "COMP", 2, 2, 45, [Expertise.SOFTWARE_ENGINEERING], 4, 1, 3, 35, 2.7, True, "Both"),
+    ("CS806", "Internship", "COMP", 0, 8, 60, [Expertise.COMPUTER_SCIENCE], 4, 1, 2, 10, 1.5, True, "Both")
+)
+
+# Mathematics Courses (15 courses)
+MATH_COURSES = (
+    ("MATH101", "Calculus I", "MATH", 4, 1, 200, [Expertise.CALCULUS], 1, 1, 3, 40, 1.8, True, "Both"),
+    ("MATH102", "Calculus II", "MATH", 4, 1, 180, [Expertise.CALCULUS], 1, 1, 3, 35, 1.9, True, "Both"),
+    ("MATH201", "Linear Algebra", "MATH", 3, 1, 150, [Expertise.LINEAR_ALGEBRA], 2, 1, 2, 25, 2.0, True, "Both"),
+    ("MATH202", "Differential Equations", "MATH", 3, 1, 120, [Expertise.DIFFERENTIAL_EQUATIONS], 2, 1, 2, 30, 2.2, True, "Both"),
+    ("MATH301", "Advanced Calculus", "MATH", 3, 0, 80, [Expertise.CALCULUS], 3, 1, 2, 25, 2.5, True, "Both"),
+    ("MATH302", "Abstract Algebra", "MATH", 3, 0, 60, [Expertise.PURE_MATHEMATICS], 3, 1, 2, 20, 2.8, False, "Both"),
+    ("MATH401", "Real Analysis", "MATH", 3, 0, 50, [Expertise.PURE_MATHEMATICS], 4, 1, 2, 25, 3.0, False, "Both"),
+    ("MATH402", "Complex Analysis", "MATH", 3, 0, 45, [Expertise.PURE_MATHEMATICS], 4, 1, 2, 20, 2.9, False, "Both"),
+    ("MATH501", "Numerical Analysis", "MATH", 3, 1, 40, [Expertise.NUMERICAL_ANALYSIS], 5, 1, 2, 25, 2.7, True, "Both"),
+    ("MATH502", "Mathematical Modeling", "MATH", 3, 1, 35, [Expertise.MATHEMATICAL_MODELING], 5, 1, 2, 30, 2.8, True, "Both"),
+    ("MATH601", "Topology", "MATH", 3, 0, 30, [Expertise.PURE_MATHEMATICS], 5, 1, 2, 20, 3.2, False, "Both"),
+    ("MATH602", "Differential Geometry", "MATH", 3, 0, 25, [Expertise.PURE_MATHEMATICS], 5, 1, 2, 20, 3.1, False, "Both"),
+    ("MATH701", "Research Seminar", "MATH", 2, 0, 20, [Expertise.MATHEMATICS], 5, 1, 2, 15, 2.8, False, "Both"),
+    ("MATH702", "Thesis", "MATH", 1, 0, 15, [Expertise.MATHEMATICS], 5, 1, 1, 40, 3.5, False, "Both"),
+    ("MATH703", "Independent Study", "MATH", 1, 0, 10, [Expertise.MATHEMATICS], 5, 1, 1, 30, 3.0, False, "Both")
+)
+
+# Business Courses (12 courses)
+BUSINESS_COURSES = (
+    ("BUS101", "Introduction to Business", "BUS", 3, 0, 180, [Expertise.BUSINESS_ADMINISTRATION], 1, 1, 2, 25, 1.5, True, "Both"),
+    ("BUS201", "Principles of Management", "BUS", 3, 0, 150, [Expertise.MANAGEMENT], 2, 1, 2, 20, 1.8, True, "Both"),
+    ("BUS202", "Financial Accounting", "BUS", 3, 1, 160, [Expertise.ACCOUNTING], 2, 1, 2, 30, 2.0, True, "Both"),
+    ("BUS301", "Marketing Principles", "BUS", 3, 0, 140, [Expertise.MARKETING], 3, 1, 2, 25, 1.9, True, "Both"),
+    ("BUS302", "Corporate Finance", "BUS", 3, 0, 120, [Expertise.FINANCE], 3, 1, 2, 30, 2.2, True, "Both"),
+    ("BUS401", "Operations Management", "BUS", 3, 1, 100, [Expertise.OPERATIONS_RESEARCH], 4, 1, 2, 25, 2.3, True, "Both"),
+    ("BUS402", "Strategic Management", "BUS", 3, 0, 90, [Expertise.MANAGEMENT], 4, 1, 2, 30, 2.4, True, "Both"),
+    ("BUS501", "Business Analytics", "BUS", 3, 1, 70, [Expertise.DATA_SCIENCE], 5, 1, 2, 25, 2.6, True, "Both"),
+    ("BUS502", "Supply Chain Management", "BUS", 3, 0, 65, [Expertise.SUPPLY_CHAIN], 5, 1, 2, 20, 2.3, True, "Both"),
+    ("BUS601", "Research Methods", "BUS", 2, 1, 45, [Expertise.BUSINESS_ADMINISTRATION], 5, 1, 2, 20, 2.5, True, "Both"),
+    ("BUS602", "Thesis Project", "BUS", 1, 0, 35, [Expertise.BUSINESS_ADMINISTRATION], 5, 1, 1, 40, 3.2, False, "Both"),
+    ("BUS603", "Capstone", "BUS", 2, 1, 50, [Expertise.BUSINESS_ADMINISTRATION], 4, 1, 3, 35, 2.7, True, "Both")
+)
+
+# Engineering Courses (15 courses)
+ENGINEERING_COURSES = (
+    ("ME101", "Engineering Mechanics", "MECH", 4, 2, 150, [Expertise.MECHANICAL_ENGINEERING], 1, 1, 2, 30, 2.0, True, "Both"),
+    ("ME201", "Thermodynamics", "MECH", 3, 1, 120, [Expertise.MECHANICAL_ENGINEERING], 2, 1, 2, 25, 2.2, True, "Both"),
+    ("ME301", "Machine Design", "MECH", 3, 2, 90, [Expertise.MECHANICAL_ENGINEERING], 3, 1, 2, 30, 2.4, True, "Both"),
+    ("EE101", "Circuit Analysis", "ELEC", 4, 2, 140, [Expertise.ELECTRICAL_ENGINEERING], 1, 1, 2, 30, 2.1, True, "Both"),
+    ("EE201", "Electronics", "ELEC", 3, 2, 110, [Expertise.ELECTRICAL_ENGINEERING], 2, 1, 2, 25, 2.3, True, "Both"),
+    ("EE301", "Control Systems", "ELEC", 3, 1, 80, [Expertise.ELECTRICAL_ENGINEERING], 3, 1, 2, 25, 2.5, True, "Both"),
+    ("CE101", "Statics", "CIVIL", 4, 1, 130, [Expertise.CIVIL_ENGINEERING], 1, 1, 2, 25, 2.0, True, "Both"),
+    ("CE201", "Structural Analysis", "CIVIL", 3, 1, 100, [Expertise.CIVIL_ENGINEERING], 2, 1, 2, 25, 2.2, True, "Both"),
+    ("CE301", "Design of Structures", "CIVIL", 3, 2, 85, [Expertise.CIVIL_ENGINEERING], 3, 1, 2, 30, 2.4, True, "Both"),
+    ("CHE101", "Chemical Principles", "CHEM", 4, 2, 120, [Expertise.CHEMICAL_ENGINEERING], 1, 1, 2, 30, 2.1, True, "Both"),
+    ("CHE201", "Process Design", "CHEM", 3, 2, 95, [Expertise.CHEMICAL_ENGINEERING], 2, 1, 2, 30, 2.3, True, "Both"),
+    ("CHE301", "Reaction Engineering", "CHEM", 3, 1, 75, [Expertise.CHEMICAL_ENGINEERING], 3, 1, 2, 25, 2.5, True, "Both"),
+    ("BME101", "Biomechanics", "BME", 3, 1, 80, [Expertise.BIOMEDICAL_ENGINEERING], 2, 1, 2, 25, 2.2, True, "Both"),
+    ("BME201", "Biomaterials", "BME", 3, 1, 60, [Expertise.BIOMEDICAL_ENGINEERING], 3, 1, 2, 25, 2.4, True, "Both"),
+    ("BME301", "Medical Devices", "BME", 3, 2, 50, [Expertise.BIOMEDICAL_ENGINEERING], 4, 1, 2, 30, 2.6, True, "Both")
+)
+
+# Science & Humanities Courses (18 courses)
+SCIENCE_HUMANITIES_COURSES = (
+    ("PHYS101", "General Physics I", "PHYS", 4, 2, 180, [Expertise.PHYSICS], 1, 1, 3, 35, 2.0, True, "Both"),
+    ("PHYS102", "General Physics II", "PHYS", 4, 2, 160, [Expertise.PHYSICS], 1, 1, 3, 30, 2.1, True, "Both"),
+    ("PHYS201", "Modern Physics", "PHYS", 3, 1, 120, [Expertise.PHYSICS], 2, 1, 2, 25, 2.3, True, "Both"),
+    ("CHEM101", "General Chemistry", "CHEM", 4, 2, 200, [Expertise.CHEMISTRY], 1, 1, 3, 35, 2.0, True, "Both"),
+    ("CHEM201", "Organic Chemistry", "CHEM", 3, 2, 150, [Expertise.CHEMISTRY], 2, 1, 2, 30, 2.2, True, "Both"),
+    ("BIO101", "Introduction to Biology", "BIO", 4, 2, 190, [Expertise.BIOLOGY], 1, 1, 3, 30, 1.9, True, "Both"),
+    ("BIO201", "Cell Biology", "BIO", 3, 2, 130, [Expertise.BIOLOGY], 2, 1, 2, 25, 2.1, True, "Both"),
+    ("PSYCH101", "Introduction to Psychology", "PSYCH", 3, 0, 220, [Expertise.PSYCHOLOGY], 1, 1, 3, 25, 1.6, True, "Both"),
+    ("PSYCH201", "Research Methods", "PSYCH", 3, 1, 140, [Expertise.PSYCHOLOGY], 2, 1, 2, 30, 2.0, True, "Both"),
+    ("SOC101", "Introduction to Sociology", "SOC", 3, 0, 180, [Expertise.SOCIOLOGY], 1, 1, 2, 20, 1.7, True, "Both"),
+    ("SOC201", "Social Theory", "SOC", 3, 0, 120, [Expertise.SOCIOLOGY], 2, 1, 2, 25, 2.1, True, "Both"),
+    ("ENG101", "Composition", "ENG", 3, 0, 250, [Expertise.ENGLISH_LITERATURE], 1, 1, 3, 30, 1.8, True, "Both"),
+    ("ENG201", "Literature Survey", "ENG", 3, 0, 160, [Expertise.ENGLISH_LITERATURE], 2, 1, 2, 25, 2.0, True, "Both"),
+    ("HIST101", "World History", "HIST", 3, 0, 170, [Expertise.HISTORY], 1, 1, 2, 20, 1.7, True, "Both"),
+    ("HIST201", "American History", "HIST", 3, 0, 140, [Expertise.HISTORY], 2, 1, 2, 25, 1.9, True, "Both"),
+    ("PHIL101", "Introduction to Philosophy", "PHIL", 3, 0, 130, [Expertise.PHILOSOPHY], 1, 1, 2, 20, 1.8, True, "Both"),
+    ("ECON101", "Principles of Economics", "ECON", 3, 0, 200, [Expertise.ECONOMICS], 1, 1, 3, 25, 1.8, True, "Both"),
+    ("ECON201", "Microeconomics", "ECON", 3, 0, 150, [Expertise.ECONOMICS], 2, 1, 2, 25, 2.0, True, "Both")
+)
+
+# Combine all courses
+COURSE_ROWS = CS_COURSES + MATH_COURSES + BUSINESS_COURSES + ENGINEERING_COURSES + SCIENCE_HUMANITIES_COURSES
+
+# Record IDs, formatted once
+COURSE_IDS = tuple(f"C{i:03d}" for i in range(1, len(COURSE_ROWS) + 1))
+PROFESSOR_IDS = tuple(f"P{i:03d}" for i in range(1, 101))
+
 # ============================================================================
 # DATASET GENERATION FUNCTIONS
 # ============================================================================
 
 def generate_professor_names() -> List[str]:
     """Generate realistic professor names"""
-    first_names = [
-        "James", "Mary", "John", "Patricia", "Robert", "Jennifer", "Michael", "Linda",
-        "William", "Elizabeth", "David", "Barbara", "Richard", "Susan", "Joseph", "Jessica",
-        "Thomas", "Sarah", "Christopher", "Karen", "Charles", "Nancy", "Daniel", "Lisa",
-        "Matthew", "Betty", "Anthony", "Helen", "Mark", "Sandra", "Donald", "Donna",
-        "Steven", "Carol", "Paul", "Ruth", "Andrew", "Sharon", "Joshua", "Michelle",
-        "Kenneth", "Laura", "Kevin", "Emily", "Brian", "Kimberly", "George", "Deborah",
-        "Edward", "Dorothy", "Ronald", "Lisa", "Timothy", "Nancy", "Jason", "Karen",
-        "Jeffrey", "Betty", "Ryan", "Helen", "Jacob", "Sandra", "Gary", "Donna",
-        "Nicholas", "Carol", "Eric", "Ruth", "Jonathan", "Sharon", "Stephen", "Michelle",
-        "Larry", "Laura", "Justin", "Emily", "Scott", "Kimberly", "Brandon", "Deborah",
-        "Benjamin", "Dorothy", "Frank", "Lisa", "Gregory", "Nancy", "Raymond", "Karen",
-        "Samuel", "Betty", "Patrick", "Helen", "Alexander", "Sandra", "Jack", "Donna",
-        "Dennis", "Carol", "Jerry", "Ruth", "Tyler", "Sharon", "Aaron", "Michelle",
-        "Jose", "Laura", "Adam", "Emily", "Nathan", "Kimberly", "Henry", "Deborah"
-    ]
-    
-    last_names = [
-        "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis",
-        "Rodriguez", "Martinez", "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson",
-        "Thomas", "Taylor", "Moore", "Jackson", "Martin", "Lee", "Perez", "Thompson",
-        "White", "Harris", "Sanchez", "Clark", "Ramirez", "Lewis", "Robinson", "Walker",
-        "Young", "Allen", "King", "Wright", "Scott", "Torres", "Nguyen", "Hill",
-        "Flores", "Green", "Adams", "Nelson", "Baker", "Hall", "Rivera", "Campbell",
-        "Mitchell", "Carter", "Roberts", "Gomez", "Phillips", "Evans", "Turner",
-        "Diaz", "Parker", "Cruz", "Edwards", "Collins", "Reyes", "Stewart", "Morris",
-        "Morales", "Murphy", "Cook", "Rogers", "Gutierrez", "Ortiz", "Morgan", "Cooper",
-        "Peterson", "Bailey", "Reed", "Kelly", "Howard", "Ramos", "Kim", "Cox",
-        "Ward", "Richardson", "Watson", "Brooks", "Chavez", "Wood", "James", "Bennett",
-        "Gray", "Mendoza", "Ruiz", "Hughes", "Price", "Alvarez", "Castillo", "Sanders"
-    ]
-    
-    names = []
-    for _ in range(100):
-        first = random.choice(first_names)
-        last = random.choice(last_names)
-        names.append(f"{first} {last}")
-    
-    return names
+    first = rng.choice(FIRST_NAMES, size=len(PROFESSOR_IDS))
+    last = rng.choice(LAST_NAMES, size=len(PROFESSOR_IDS))
+    return [f"{f} {l}" for f, l in zip(first, last)]
 
-def generate_departments() -> List[str]:
-    """Generate realistic university departments"""
-    return [
+@functools.lru_cache(maxsize=1)
+def generate_departments() -> Tuple[str, ...]:
+    """Generate realistic university departments (cached, immutable)"""
+    return (
         "Computer Science & Engineering",
         "Mathematics & Statistics", 
         "Physics & Astronomy",
@@ -211,126 +323,23 @@ def generate_departments() -> List[str]:
         "Nursing",
         "Public Health",
         "Pharmacy"
-    ]
+    )
 
 def generate_course_data() -> List[Course]:
     """Generate 80 realistic courses across multiple departments"""
     courses = []
     
-    # Computer Science Courses (20 courses)
-    cs_courses = [
-        ("CS101", "Introduction to Programming", "COMP", 3, 2, 120, [Expertise.COMPUTER_SCIENCE], 1, 1, 2, 30, 1.5, True, "Both"),
-        ("CS102", "Data Structures", "COMP", 3, 2, 100, [Expertise.DATA_STRUCTURES], 2, 1, 2, 25, 1.8, True, "Both"),
-        ("CS201", "Algorithms", "COMP", 3, 1, 80, [Expertise.ALGORITHMS], 2, 1, 2, 20, 2.0, True, "Both"),
-        ("CS202", "Computer Organization", "COMP", 3, 2, 90, [Expertise.COMPUTER_ENGINEERING], 2, 1, 2, 25, 1.7, True, "Both"),
-        ("CS301", "Operating Systems", "COMP", 3, 2, 70, [Expertise.OPERATING_SYSTEMS], 3, 1, 2, 20, 2.2, True, "Both"),
-        ("CS302", "Database Systems", "COMP", 3, 2, 85, [Expertise.DATABASE_SYSTEMS], 3, 1, 2, 25, 1.9, True, "Both"),
-        ("CS401", "Software Engineering", "COMP", 3, 2, 60, [Expertise.SOFTWARE_ENGINEERING], 4, 1, 3, 30, 2.5, True, "Both"),
-        ("CS402", "Computer Networks", "COMP", 3, 1, 65, [Expertise.COMPUTER_NETWORKS], 4, 1, 2, 20, 2.1, True, "Both"),
-        ("CS501", "Artificial Intelligence", "COMP", 3, 1, 50, [Expertise.ARTIFICIAL_INTELLIGENCE], 5, 1, 2, 20, 2.8, True, "Both"),
-        ("CS502", "Machine Learning", "COMP", 3, 1, 55, [Expertise.MACHINE_LEARNING], 5, 1, 2, 25, 2.6, True, "Both"),
-        ("CS601", "Advanced Algorithms", "COMP", 3, 0, 40, [Expertise.ALGORITHMS], 5, 1, 2, 20, 3.0, False, "Both"),
-        ("CS602", "Computer Graphics", "COMP", 3, 1, 45, [Expertise.COMPUTER_GRAPHICS], 5, 1, 2, 20, 2.4, True, "Both"),
-        ("CS701", "Research Methods", "COMP", 2, 1, 30, [Expertise.COMPUTER_SCIENCE], 5, 1, 2, 15, 2.5, False, "Both"),
-        ("CS702", "Thesis Project", "COMP", 1, 0, 25, [Expertise.COMPUTER_SCIENCE], 5, 1, 1, 40, 3.5, False, "Both"),
-        ("CS801", "Advanced Topics", "COMP", 3, 0, 20, [Expertise.COMPUTER_SCIENCE], 5, 1, 2, 20, 3.2, False, "Both"),
-        ("CS802", "Seminar", "COMP", 2, 0, 15, [Expertise.COMPUTER_SCIENCE], 5, 1, 2, 15, 2.8, False, "Both"),
-        ("CS803", "Independent Study", "COMP", 1, 0, 10, [Expertise.COMPUTER_SCIENCE], 5, 1, 1, 30, 3.0, False, "Both"),
-        ("CS804", "Special Topics", "COMP", 3, 1, 35, [Expertise.COMPUTER_SCIENCE], 4, 1, 2, 20, 2.3, True, "Both"),
-        ("CS805", "Capstone Project", "COMP", 2, 2, 45, [Expertise.SOFTWARE_ENGINEERING], 4, 1, 3, 35, 2.7, True, "Both"),
-        ("CS806", "Internship", "COMP", 0, 8, 60, [Expertise.COMPUTER_SCIENCE], 4, 1, 2, 10, 1.5, True, "Both")
-    ]
-    
-    # Mathematics Courses (15 courses)
-    math_courses = [
-        ("MATH101", "Calculus I", "MATH", 4, 1, 200, [Expertise.CALCULUS], 1, 1, 3, 40, 1.8, True, "Both"),
-        ("MATH102", "Calculus II", "MATH", 4, 1, 180, [Expertise.CALCULUS], 1, 1, 3, 35, 1.9, True, "Both"),
-        ("MATH201", "Linear Algebra", "MATH", 3, 1, 150, [Expertise.LINEAR_ALGEBRA], 2, 1, 2, 25, 2.0, True, "Both"),
-        ("MATH202", "Differential Equations", "MATH", 3, 1, 120, [Expertise.DIFFERENTIAL_EQUATIONS], 2, 1, 2, 30, 2.2, True, "Both"),
-        ("MATH301", "Advanced Calculus", "MATH", 3, 0, 80, [Expertise.CALCULUS], 3, 1, 2, 25, 2.5, True, "Both"),
-        ("MATH302", "Abstract Algebra", "MATH", 3, 0, 60, [Expertise.PURE_MATHEMATICS], 3, 1, 2, 20, 2.8, False, "Both"),
-        ("MATH401", "Real Analysis", "MATH", 3, 0, 50, [Expertise.PURE_MATHEMATICS], 4, 1, 2, 25, 3.0, False, "Both"),
-        ("MATH402", "Complex Analysis", "MATH", 3, 0, 45, [Expertise.PURE_MATHEMATICS], 4, 1, 2, 20, 2.9, False, "Both"),
-        ("MATH501", "Numerical Analysis", "MATH", 3, 1, 40, [Expertise.NUMERICAL_ANALYSIS], 5, 1, 2, 25, 2.7, True, "Both"),
-        ("MATH502", "Mathematical Modeling", "MATH", 3, 1, 35, [Expertise.MATHEMATICAL_MODELING], 5, 1, 2, 30, 2.8, True, "Both"),
-        ("MATH601", "Topology", "MATH", 3, 0, 30, [Expertise.PURE_MATHEMATICS], 5, 1, 2, 20, 3.2, False, "Both"),
-        ("MATH602", "Differential Geometry", "MATH", 3, 0, 25, [Expertise.PURE_MATHEMATICS], 5, 1, 2, 20, 3.1, False, "Both"),
-        ("MATH701", "Research Seminar", "MATH", 2, 0, 20, [Expertise.MATHEMATICS], 5, 1, 2, 15, 2.8, False, "Both"),
-        ("MATH702", "Thesis", "MATH", 1, 0, 15, [Expertise.MATHEMATICS], 5, 1, 1, 40, 3.5, False, "Both"),
-        ("MATH703", "Independent Study", "MATH", 1, 0, 10, [Expertise.MATHEMATICS], 5, 1, 1, 30, 3.0, False, "Both")
-    ]
-    
-    # Business Courses (12 courses)
-    business_courses = [
-        ("BUS101", "Introduction to Business", "BUS", 3, 0, 180, [Expertise.BUSINESS_ADMINISTRATION], 1, 1, 2, 25, 1.5, True, "Both"),
-        ("BUS201", "Principles of Management", "BUS", 3, 0, 150, [Expertise.MANAGEMENT], 2, 1, 2, 20, 1.8, True, "Both"),
-        ("BUS202", "Financial Accounting", "BUS", 3, 1, 160, [Expertise.ACCOUNTING], 2, 1, 2, 30, 2.0, True, "Both"),
-        ("BUS301", "Marketing Principles", "BUS", 3, 0, 140, [Expertise.MARKETING], 3, 1, 2, 25, 1.9, True, "Both"),
-        ("BUS302", "Corporate Finance", "BUS", 3, 0, 120, [Expertise.FINANCE], 3, 1, 2, 30, 2.2, True, "Both"),
-        ("BUS401", "Operations Management", "BUS", 3, 1, 100, [Expertise.OPERATIONS_RESEARCH], 4, 1, 2, 25, 2.3, True, "Both"),
-        ("BUS402", "Strategic Management", "BUS", 3, 0, 90, [Expertise.MANAGEMENT], 4, 1, 2, 30, 2.4, True, "Both"),
-        ("BUS501", "Business Analytics", "BUS", 3, 1, 70, [Expertise.DATA_SCIENCE], 5, 1, 2, 25, 2.6, True, "Both"),
-        ("BUS502", "Supply Chain Management", "BUS", 3, 0, 65, [Expertise.SUPPLY_CHAIN], 5, 1, 2, 20, 2.3, True, "Both"),
-        ("BUS601", "Research Methods", "BUS", 2, 1, 45, [Expertise.BUSINESS_ADMINISTRATION], 5, 1, 2, 20, 2.5, True, "Both"),
-        ("BUS602", "Thesis Project", "BUS", 1, 0, 35, [Expertise.BUSINESS_ADMINISTRATION], 5, 1, 1, 40, 3.2, False, "Both"),
-        ("BUS603", "Capstone", "BUS", 2, 1, 50, [Expertise.BUSINESS_ADMINISTRATION], 4, 1, 3, 35, 2.7, True, "Both")
-    ]
-    
-    # Engineering Courses (15 courses)
-    engineering_courses = [
-        ("ME101", "Engineering Mechanics", "MECH", 4, 2, 150, [Expertise.MECHANICAL_ENGINEERING], 1, 1, 2, 30, 2.0, True, "Both"),
-        ("ME201", "Thermodynamics", "MECH", 3, 1, 120, [Expertise.MECHANICAL_ENGINEERING], 2, 1, 2, 25, 2.2, True, "Both"),
-        ("ME301", "Machine Design", "MECH", 3, 2, 90, [Expertise.MECHANICAL_ENGINEERING], 3, 1, 2, 30, 2.4, True, "Both"),
-        ("EE101", "Circuit Analysis", "ELEC", 4, 2, 140, [Expertise.ELECTRICAL_ENGINEERING], 1, 1, 2, 30, 2.1, True, "Both"),
-        ("EE201", "Electronics", "ELEC", 3, 2, 110, [Expertise.ELECTRICAL_ENGINEERING], 2, 1, 2, 25, 2.3, True, "Both"),
-        ("EE301", "Control Systems", "ELEC", 3, 1, 80, [Expertise.ELECTRICAL_ENGINEERING], 3, 1, 2, 25, 2.5, True, "Both"),
-        ("CE101", "Statics", "CIVIL", 4, 1, 130, [Expertise.CIVIL_ENGINEERING], 1, 1, 2, 25, 2.0, True, "Both"),
-        ("CE201", "Structural Analysis", "CIVIL", 3, 1, 100, [Expertise.CIVIL_ENGINEERING], 2, 1, 2, 25, 2.2, True, "Both"),
-        ("CE301", "Design of Structures", "CIVIL", 3, 2, 85, [Expertise.CIVIL_ENGINEERING], 3, 1, 2, 30, 2.4, True, "Both"),
-        ("CHE101", "Chemical Principles", "CHEM", 4, 2, 120, [Expertise.CHEMICAL_ENGINEERING], 1, 1, 2, 30, 2.1, True, "Both"),
-        ("CHE201", "Process Design", "CHEM", 3, 2, 95, [Expertise.CHEMICAL_ENGINEERING], 2, 1, 2, 30, 2.3, True, "Both"),
-        ("CHE301", "Reaction Engineering", "CHEM", 3, 1, 75, [Expertise.CHEMICAL_ENGINEERING], 3, 1, 2, 25, 2.5, True, "Both"),
-        ("BME101", "Biomechanics", "BME", 3, 1, 80, [Expertise.BIOMEDICAL_ENGINEERING], 2, 1, 2, 25, 2.2, True, "Both"),
-        ("BME201", "Biomaterials", "BME", 3, 1, 60, [Expertise.BIOMEDICAL_ENGINEERING], 3, 1, 2, 25, 2.4, True, "Both"),
-        ("BME301", "Medical Devices", "BME", 3, 2, 50, [Expertise.BIOMEDICAL_ENGINEERING], 4, 1, 2, 30, 2.6, True, "Both")
-    ]
-    
-    # Science & Humanities Courses (18 courses)
-    science_humanities = [
-        ("PHYS101", "General Physics I", "PHYS", 4, 2, 180, [Expertise.PHYSICS], 1, 1, 3, 35, 2.0, True, "Both"),
-        ("PHYS102", "General Physics II", "PHYS", 4, 2, 160, [Expertise.PHYSICS], 1, 1, 3, 30, 2.1, True, "Both"),
-        ("PHYS201", "Modern Physics", "PHYS", 3, 1, 120, [Expertise.PHYSICS], 2, 1, 2, 25, 2.3, True, "Both"),
-        ("CHEM101", "General Chemistry", "CHEM", 4, 2, 200, [Expertise.CHEMISTRY], 1, 1, 3, 35, 2.0, True, "Both"),
-        ("CHEM201", "Organic Chemistry", "CHEM", 3, 2, 150, [Expertise.CHEMISTRY], 2, 1, 2, 30, 2.2, True, "Both"),
-        ("BIO101", "Introduction to Biology", "BIO", 4, 2, 190, [Expertise.BIOLOGY], 1, 1, 3, 30, 1.9, True, "Both"),
-        ("BIO201", "Cell Biology", "BIO", 3, 2, 130, [Expertise.BIOLOGY], 2, 1, 2, 25, 2.1, True, "Both"),
-        ("PSYCH101", "Introduction to Psychology", "PSYCH", 3, 0, 220, [Expertise.PSYCHOLOGY], 1, 1, 3, 25, 1.6, True, "Both"),
-        ("PSYCH201", "Research Methods", "PSYCH", 3, 1, 140, [Expertise.PSYCHOLOGY], 2, 1, 2, 30, 2.0, True, "Both"),
-        ("SOC101", "Introduction to Sociology", "SOC", 3, 0, 180, [Expertise.SOCIOLOGY], 1, 1, 2, 20, 1.7, True, "Both"),
-        ("SOC201", "Social Theory", "SOC", 3, 0, 120, [Expertise.SOCIOLOGY], 2, 1, 2, 25, 2.1, True, "Both"),
-        ("ENG101", "Composition", "ENG", 3, 0, 250, [Expertise.ENGLISH_LITERATURE], 1, 1, 3, 30, 1.8, True, "Both"),
-        ("ENG201", "Literature Survey", "ENG", 3, 0, 160, [Expertise.ENGLISH_LITERATURE], 2, 1, 2, 25, 2.0, True, "Both"),
-        ("HIST101", "World History", "HIST", 3, 0, 170, [Expertise.HISTORY], 1, 1, 2, 20, 1.7, True, "Both"),
-        ("HIST201", "American History", "HIST", 3, 0, 140, [Expertise.HISTORY], 2, 1, 2, 25, 1.9, True, "Both"),
-        ("PHIL101", "Introduction to Philosophy", "PHIL", 3, 0, 130, [Expertise.PHILOSOPHY], 1, 1, 2, 20, 1.8, True, "Both"),
-        ("ECON101", "Principles of Economics", "ECON", 3, 0, 200, [Expertise.ECONOMICS], 1, 1, 3, 25, 1.8, True, "Both"),
-        ("ECON201", "Microeconomics", "ECON", 3, 0, 150, [Expertise.ECONOMICS], 2, 1, 2, 25, 2.0, True, "Both")
-    ]
-    
-    # Combine all courses
-    all_course_data = cs_courses + math_courses + business_courses + engineering_courses + science_humanities
-    
     # Create Course objects
-    for i, (code, name, dept_code, lec, lab, students, exp, level, min_prof, max_prof, assess, prep, shared, sem) in enumerate(all_course_data):
+    for i, (code, name, dept_code, lec, lab, students, exp, level, min_prof, max_prof, assess, prep, shared, sem) in enumerate(COURSE_ROWS):
         course = Course(
-            id=f"C{i+1:03d}",
+            id=COURSE_IDS[i],
             name=name,
             code=code,
             department=dept_code,
             lecture_hours=lec,
             lab_hours=lab,
             num_students=students,
-            required_expertise=exp,
+            required_expertise=list(exp),
             difficulty_level=level,
             min_professors=min_prof,
             max_professors=max_prof,
@@ -392,61 +401,115 @@ def generate_professor_data() -> List[Professor]:
         "Physical Therapy": [Expertise.PHYSICAL_THERAPY, Expertise.BIOLOGY]
     }
     
-    # Generate professors
-    for i in range(100):
-        # Assign department
-        dept = random.choice(departments)
-        available_expertise = dept_expertise.get(dept, [Expertise.COMPUTER_SCIENCE])
-        
-        # Generate expertise (2-4 areas)
-        num_expertise = random.randint(2, 4)
-        expertise = random.sample(available_expertise, min(num_expertise, len(available_expertise)))
-        primary_expertise = random.choice(expertise)
+    # Draw every per-professor random parameter in one batch
+    num_professors = len(PROFESSOR_IDS)
+    # Expertise pools indexed by department id, parallel to `departments`
+    dept_pools = [np.array(dept_expertise.get(dept, [Expertise.COMPUTER_SCIENCE]), dtype=object)
+                  for dept in departments]
+    dept_sizes = np.array([len(pool) for pool in dept_pools])
+    dept_choices = rng.choice(len(departments), size=num_professors)
+    num_expertise = np.minimum(rng.integers(2, 5, size=num_professors), dept_sizes[dept_choices])
+    years_exp = rng.integers(1, 26, size=num_professors)
+    titles = np.select(
+        [years_exp >= 20, years_exp >= 12, years_exp >= 6],
+        ["Professor", "Associate Professor", "Assistant Professor"],
+        default="Lecturer"
+    )
+    
+    # Generate workload parameters
+    research_allocation = rng.uniform(0.2, 0.4, size=num_professors)
+    admin_load = rng.uniform(2, 10, size=num_professors)
+    max_teaching = rng.uniform(15, 25, size=num_professors)
+    min_teaching = rng.uniform(8, 12, size=num_professors)
+    teaching_quality = rng.uniform(0.7, 1.0, size=num_professors)
+    
+    # Generate course preferences (random weights for courses)
+    preferences = rng.uniform(0.5, 1.0, (num_professors, len(COURSE_IDS)))
+    
+    # Availability (most available both semesters)
+    has_summer = rng.random(size=num_professors) <= 0.1
+    
+    # Assemble professors in a single pass
+    for i in range(num_professors):
+        dept_id = dept_choices[i]
         
-        # Generate title based on experience
-        years_exp = random.randint(1, 25)
-        if years_exp >= 20:
-            title = "Professor"
-        elif years_exp >= 12:
-            title = "Associate Professor"
-        elif years_exp >= 6:
-            title = "Assistant Professor"
-        else:
-            title = "Lecturer"
+        # Generate expertise (2-4 areas); the sample is already shuffled, so its
+        # first entry is a uniform pick for the primary expertise
+        expertise = rng.choice(dept_pools[dept_id], num_expertise[i], replace=False).tolist()
+        primary_expertise = expertise[0]
         
-        # Generate workload parameters
-        research_allocation = random.uniform(0.2, 0.4)
-        admin_load = random.uniform(2, 10)
-        max_teaching = random.uniform(15, 25)
-        min_teaching = random.uniform(8, 12)
-        teaching_quality = random.uniform(0.7, 1.0)
-        
-        # Generate course preferences (random weights for courses)
-        preferences = {f"C{j+1:03d}": random.uniform(0.5, 1.0) for j in range(80)}
-        
-        # Availability (most available both semesters)
-        availability = ["Fall", "Spring"] if random.random() > 0.1 else ["Fall", "Spring", "Summer"]
+        availability = ["Fall", "Spring", "Summer"] if has_summer[i] else ["Fall", "Spring"]
         
         professor = Professor(
-            id=f"P{i+1:03d}",
+            id=PROFESSOR_IDS[i],
             name=names[i],
-            title=title,
-            department=dept,
+            title=str(titles[i]),
+            department=departments[dept_id],
             expertise=expertise,
             primary_expertise=primary_expertise,
-            years_experience=years_exp,
-            research_allocation=research_allocation,
-            admin_load=admin_load,
-            max_teaching_load=max_teaching,
-            min_teaching_load=min_teaching,
-            preferences=preferences,
-            teaching_quality=teaching_quality,
+            years_experience=int(years_exp[i]),
+            research_allocation=float(research_allocation[i]),
+            admin_load=float(admin_load[i]),
+            max_teaching_load=float(max_teaching[i]),
+            min_teaching_load=float(min_teaching[i]),
+            preferences=dict(zip(COURSE_IDS, preferences[i].tolist())),
+            teaching_quality=float(teaching_quality[i]),
             availability=availability
         )
         professors.append(professor)
     
     return professors
 
+PROFESSOR_CSV_HEADER = (
+    'id', 'name', 'title', 'department', 'expertise', 'primary_expertise',
+    'years_experience', 'research_allocation', 'admin_load', 'max_teaching_load',
+    'min_teaching_load', 'teaching_quality', 'availability'
+)
+
+COURSE_CSV_HEADER = (
+    'id', 'name', 'code', 'department', 'lecture_hours', 'lab_hours', 'num_students',
+    'required_expertise', 'difficulty_level', 'min_professors', 'max_professors',
+    'assessment_hours', 'prep_factor', 'can_be_shared', 'semester'
+)
+
+def _professor_row(prof: Professor) -> tuple:
+    """Flatten a professor into a CSV row matching PROFESSOR_CSV_HEADER"""
+    return (
+        prof.id,
+        prof.name,
+        prof.title,
+        prof.department,
+        ';'.join([EXPERTISE_VALUES[e] for e in prof.expertise]),
+        EXPERTISE_VALUES[prof.primary_expertise],
+        prof.years_experience,
+        prof.research_allocation,
+        prof.admin_load,
+        prof.max_teaching_load,
+        prof.min_teaching_load,
+        prof.teaching_quality,
+        ';'.join(prof.availability)
+    )
+
+def _course_row(course: Course) -> tuple:
+    """Flatten a course into a CSV row matching COURSE_CSV_HEADER"""
+    return (
+        course.id,
+        course.name,
+        course.code,
+        course.department,
+        course.lecture_hours,
+        course.lab_hours,
+        course.num_students,
+        ';'.join([EXPERTISE_VALUES[e] for e in course.required_expertise]),
+        course.difficulty_level,
+        course.min_professors,
+        course.max_professors,
+        course.assessment_hours,
+        course.prep_factor,
+        course.can_be_shared,
+        course.semester
+    )
+
 def save_dataset_to_csv(professors: List[Professor], courses: List[Course], output_dir: str = "data"):
     """Save the generated dataset to CSV files"""
     import os
@@ -455,50 +518,16 @@ def save_dataset_to_csv(professors: List[Professor], courses: List[Course], outp
     os.makedirs(output_dir, exist_ok=True)
     
     # Save professors
-    prof_data = []
-    for prof in professors:
-        prof_data.append({
-            'id': prof.id,
-            'name': prof.name,
-            'title': prof.title,
-            'department': prof.department,
-            'expertise': ';'.join([e.value for e in prof.expertise]),
-            'primary_expertise': prof.primary_expertise.value,
-            'years_experience': prof.years_experience,
-            'research_allocation': prof.research_allocation,
-            'admin_load': prof.admin_load,
-            'max_teaching_load': prof.max_teaching_load,
-            'min_teaching_load': prof.min_teaching_load,
-            'teaching_quality': prof.teaching_quality,
-            'availability': ';'.join(prof.availability)
-        })
-    
-    prof_df = pd.DataFrame(prof_data)
-    prof_df.to_csv(f"{output_dir}/professors.csv", index=False)
+    with open(f"{output_dir}/professors.csv", 'w', newline='') as f:
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow(PROFESSOR_CSV_HEADER)
+        writer.writerows(_professor_row(prof) for prof in professors)
     
     # Save courses
-    course_data = []
-    for course in courses:
-        course_data.append({
-            'id': course.id,
-            'name': course.name,
-            'code': course.code,
-            'department': course.department,
-            'lecture_hours': course.lecture_hours,
-            'lab_hours': course.lab_hours,
-            'num_students': course.num_students,
-            'required_expertise': ';'.join([e.value for e in course.required_expertise]),
-            'difficulty_level': course.difficulty_level,
-            'min_professors': course.min_professors,
-            'max_professors': course.max_professors,
-            'assessment_hours': course.assessment_hours,
-            'prep_factor': course.prep_factor,
-            'can_be_shared': course.can_be_shared,
-            'semester': course.semester
-        })
-    
-    course_df = pd.DataFrame(course_data)
-    course_df.to_csv(f"{output_dir}/courses.csv", index=False)
+    with open(f"{output_dir}/courses.csv", 'w', newline='') as f:
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow(COURSE_CSV_HEADER)
+        writer.writerows(_course_row(course) for course in courses)
     
     print(f"Dataset saved to {output_dir}/")
     print(f"- {len(professors)} professors saved to professors.csv")
@@ -524,35 +553,27 @@ def main():
     print("-" * 30)
     
     # Department distribution
-    dept_counts = {}
-    for prof in professors:
-        dept = prof.department
-        dept_counts[dept] = dept_counts.get(dept, 0) + 1
+    dept_counts = Counter(prof.department for prof in professors)
     
     print("Professor distribution by department:")
     for dept, count in sorted(dept_counts.items()):
         print(f"  {dept}: {count} professors")
     
     # Course distribution
-    course_dept_counts = {}
-    for course in courses:
-        dept = course.department
-        course_dept_counts[dept] = course_dept_counts.get(dept, 0) + 1
+    course_dept_counts = Counter(course.department for course in courses)
     
     print("\nCourse distribution by department:")
     for dept, count in sorted(course_dept_counts.items()):
         print(f"  {dept}: {count} courses")
     
     # Difficulty level distribution
-    difficulty_counts = {}
-    for course in courses:
-        level = course.difficulty_level
-        difficulty_counts[level] = difficulty_counts.get(level, 0) + 1
+    levels = np.fromiter((course.difficulty_level for course in courses), dtype=np.int8, count=len(courses))
+    difficulty_levels, difficulty_counts = np.unique(levels, return_counts=True)
     
     print("\nCourse distribution by difficulty level:")
-    for level in sorted(difficulty_counts.keys()):
+    for level, count in zip(difficulty_levels.tolist(), difficulty_counts.tolist()):
         level_name = {1: "UG Year 1", 2: "UG Year 2", 3: "UG Year 3", 4: "UG Year 4", 5: "Graduate"}[level]
-        print(f"  {level_name} (Level {level}): {difficulty_counts[level]} courses")
+        print(f"  {level_name} (Level {level}): {count} courses")
     
     print("\nDataset generation complete!")
 
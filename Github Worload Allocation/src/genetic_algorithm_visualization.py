@@ -4,21 +4,242 @@ Genetic Algorithm Visualization
 Shows the evolution process, selection, crossover, mutation, and convergence
 """
 
-import pandas as pd
+import functools
+import os
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from matplotlib.patches import Rectangle, Circle, Arrow, FancyBboxPatch
+from pathlib import Path
+from plot_style import HUSL_PALETTE
+from numba_compat import njit
 import warnings
 warnings.filterwarnings('ignore')
 
-# Set style for publication-quality plots
-plt.style.use('seaborn-v0_8-whitegrid')
-sns.set_palette("husl")
-plt.rcParams['figure.figsize'] = (14, 10)
-plt.rcParams['font.size'] = 12
-plt.rcParams['axes.titlesize'] = 16
-plt.rcParams['axes.labelsize'] = 14
+@functools.lru_cache(maxsize=None)
+def _pyplot():
+    """Import matplotlib on first use and apply the publication plot style"""
+    import matplotlib
+    matplotlib.use('Agg')  # Figures are only saved to files, never shown
+    import matplotlib.pyplot as plt
+    
+    # Set style for publication-quality plots
+    plt.style.use('seaborn-v0_8-whitegrid')
+    plt.rcParams['axes.prop_cycle'] = plt.cycler(color=HUSL_PALETTE)
+    plt.rcParams['figure.figsize'] = (14, 10)
+    plt.rcParams['font.size'] = 12
+    plt.rcParams['axes.titlesize'] = 16
+    plt.rcParams['axes.labelsize'] = 14
+    return plt
+
+@njit(cache=True)
+def _simulate_population_evolution(num_generations, rng):
+    """Simulate best/average/worst fitness and diversity over generations"""
+    best_fitness = np.empty(num_generations)
+    avg_fitness = np.empty(num_generations)
+    worst_fitness = np.empty(num_generations)
+    diversity = np.empty(num_generations)
+    
+    # Initial population
+    current_best = 5.0
+    current_avg = 3.0
+    current_worst = 1.0
+    current_diversity = 0.8
+    
+    for gen in range(num_generations):
+        # Evolution effects
+        improvement_rate = 0.1 * np.exp(-gen/20)  # Decreasing improvement over time
+        mutation_effect = 0.05 * rng.normal(0, 1)
+        
+        # Update fitness values
+        current_best += improvement_rate + abs(mutation_effect)
+        current_avg += improvement_rate * 0.7 + mutation_effect * 0.5
+        current_worst += improvement_rate * 0.3 + mutation_effect * 0.3
+        
+        # Add some randomness
+        current_best += rng.normal(0, 0.02)
+        current_avg += rng.normal(0, 0.03)
+        current_worst += rng.normal(0, 0.04)
+        
+        # Ensure bounds
+        current_best = min(current_best, 10.0)
+        current_avg = min(max(current_avg, 1.0), 9.0)
+        current_worst = min(max(current_worst, 0.5), 8.0)
+        
+        # Update diversity (decreases over time as population converges)
+        current_diversity = max(0.1, current_diversity - 0.01 + rng.normal(0, 0.02))
+        
+        best_fitness[gen] = current_best
+        avg_fitness[gen] = current_avg
+        worst_fitness[gen] = current_worst
+        diversity[gen] = current_diversity
+    
+    return best_fitness, avg_fitness, worst_fitness, diversity
+
+def _pack_bits(genes):
+    """Pack a 0/1 gene array into an int, gene i at bit i"""
+    return int(genes @ (1 << np.arange(len(genes))))
+
+def _unpack_bits(value, length):
+    """Unpack an int produced by _pack_bits back into a 0/1 gene array"""
+    return (value >> np.arange(length)) & 1
+
+# Markdown guide written next to the figures by create_visualization_documentation
+_GA_VIZ_DOC = """
+# 🧬 **GENETIC ALGORITHM VISUALIZATION DOCUMENTATION**
+## Faculty Workload Allocation System - Algorithm Operation Visualization
+
+---
+
+## 📊 **OVERVIEW**
+
+This document explains the comprehensive visualizations created to demonstrate how the Genetic Algorithm (GA) operates in the Faculty Workload Allocation System. These visualizations provide clear insights into the algorithm's evolution process, genetic operators, selection mechanisms, and convergence behavior.
+
+---
+
+## 🧬 **EVOLUTION PROCESS AND POPULATION DYNAMICS**
+
+### **File**: `genetic_algorithm_evolution_process.png`
+**Purpose**: Visualize the GA evolution process and population dynamics
+
+#### **Panel 1: Population Fitness Evolution Over Generations**
+- **What it shows**: How fitness values change across generations for best, average, and worst individuals
+- **Key insight**: Population improvement over time with diversity tracking
+- **Algorithm relevance**: Demonstrates GA's ability to improve solutions iteratively
+- **Paper usage**: Results section to show algorithm performance
+
+#### **Panel 2: Selection Pressure and Fitness Distribution**
+- **What it shows**: Different selection pressure scenarios and their impact
+- **Key insight**: Selection pressure affects solution quality and diversity
+- **Algorithm relevance**: Critical parameter for controlling evolution
+- **Paper usage**: Methodology section to explain selection mechanisms
+
+#### **Panel 3: Crossover and Mutation Operations**
+- **What it shows**: Visual representation of genetic operators in action
+- **Key insight**: How genetic material is exchanged and modified
+- **Algorithm relevance**: Core mechanisms of genetic evolution
+- **Paper usage**: Methodology section to explain genetic operators
+
+#### **Panel 4: Population Diversity vs Convergence Speed**
+- **What it shows**: Relationship between diversity and convergence characteristics
+- **Key insight**: Higher diversity can lead to slower but more robust convergence
+- **Algorithm relevance**: Trade-off between exploration and exploitation
+- **Paper usage**: Discussion section to analyze algorithm behavior
+
+---
+
+## ⚙️ **GENETIC OPERATORS AND SELECTION MECHANISMS**
+
+### **File**: `genetic_algorithm_operators.png`
+**Purpose**: Detailed explanation of genetic operators and selection methods
+
+#### **Panel 1: Selection Methods Comparison**
+- **What it shows**: Tournament, roulette wheel, and rank-based selection
+- **Key insight**: Different selection methods have varying impacts on evolution
+- **Algorithm relevance**: Selection method choice affects convergence behavior
+- **Paper usage**: Methodology section to justify design choices
+
+#### **Panel 2: Crossover Operators Comparison**
+- **What it shows**: Single-point, two-point, and uniform crossover
+- **Key insight**: Different crossover strategies produce varying offspring diversity
+- **Algorithm relevance**: Crossover design affects genetic material exchange
+- **Paper usage**: Methodology section to explain genetic operations
+
+#### **Panel 3: Mutation Rate Effects**
+- **What it shows**: How different mutation rates affect population evolution
+- **Key insight**: Optimal mutation rate balances exploration and exploitation
+- **Algorithm relevance**: Mutation prevents premature convergence
+- **Paper usage**: Methodology section to document parameter choices
+
+#### **Panel 4: Population Size Effects**
+- **What it shows**: Relationship between population size, diversity, and convergence
+- **Key insight**: Larger populations maintain diversity but converge slower
+- **Algorithm relevance**: Population size is a critical design parameter
+- **Paper usage**: Methodology section to justify population sizing
+
+---
+
+## 📈 **CONVERGENCE ANALYSIS**
+
+### **File**: `genetic_algorithm_convergence_analysis.png`
+**Purpose**: Analysis of convergence behavior and performance characteristics
+
+#### **Panel 1: Different Convergence Patterns**
+- **What it shows**: Various convergence scenarios including premature convergence
+- **Key insight**: GA can exhibit different convergence behaviors
+- **Algorithm relevance**: Understanding convergence patterns helps parameter tuning
+- **Paper usage**: Results section to analyze performance characteristics
+
+#### **Panel 2: Population Diversity Evolution**
+- **What it shows**: How genetic diversity changes during evolution
+- **Key insight**: Diversity maintenance is crucial for avoiding local optima
+- **Algorithm relevance**: Diversity affects global search capability
+- **Paper usage**: Results section to demonstrate algorithm behavior
+
+#### **Panel 3: Selection Pressure Effects**
+- **What it shows**: Impact of selection pressure on convergence speed
+- **Key insight**: Higher pressure leads to faster but potentially premature convergence
+- **Algorithm relevance**: Selection pressure controls evolution speed
+- **Paper usage**: Discussion section to analyze parameter sensitivity
+
+#### **Panel 4: GA vs Other Algorithms**
+- **What it shows**: GA performance relative to other metaheuristics
+- **Key insight**: GA excels in solution quality and global optima finding
+- **Algorithm relevance**: Context for algorithm selection
+- **Paper usage**: Discussion section to compare approaches
+
+---
+
+## 🎯 **ACADEMIC PAPER INTEGRATION**
+
+### **Methodology Section**
+- **Evolution Process**: Explain GA operation and population dynamics
+- **Genetic Operators**: Justify selection, crossover, and mutation choices
+- **Parameter Selection**: Document population size and operator parameters
+
+### **Results Section**
+- **Fitness Evolution**: Show population improvement over generations
+- **Convergence Analysis**: Demonstrate convergence patterns and speed
+- **Operator Effects**: Analyze impact of genetic operators
+
+### **Discussion Section**
+- **Selection Pressure**: Analyze convergence vs diversity trade-offs
+- **Population Sizing**: Discuss population size effects on performance
+- **Algorithm Comparison**: Contextualize GA performance
+
+### **Conclusions Section**
+- **Algorithm Strengths**: Summarize GA advantages
+- **Parameter Insights**: Document key parameter findings
+- **Future Work**: Suggest operator and parameter improvements
+
+---
+
+## 🔬 **TECHNICAL DETAILS**
+
+### **Visualization Features**
+- **High Resolution**: 300 DPI for publication quality
+- **Color Coding**: Consistent color scheme for clarity
+- **Annotations**: Clear labels and explanations
+- **Multi-Panel**: Comprehensive coverage in single figures
+
+### **Algorithm Parameters**
+- **Population Size**: 100 individuals
+- **Selection Method**: Tournament selection (size 3)
+- **Crossover Rate**: 0.8 (80% probability)
+- **Mutation Rate**: 0.1 (10% probability)
+- **Elitism**: Best individual preserved
+
+---
+
+## 🎉 **CONCLUSION**
+
+These Genetic Algorithm visualizations provide comprehensive insights into algorithm operation, making the complex evolution process accessible and understandable. They support the academic paper by:
+
+1. **Explaining Evolution Process**: Clear visualization of population dynamics
+2. **Demonstrating Genetic Operators**: Detailed explanation of selection, crossover, and mutation
+3. **Analyzing Convergence**: Understanding of convergence patterns and speed
+4. **Supporting Methodology**: Justification of algorithm design choices
+
+**Ready for comprehensive academic paper integration! 🎓🧬**
+"""
 
 class GeneticAlgorithmVisualization:
     def __init__(self):
@@ -33,54 +254,17 @@ class GeneticAlgorithmVisualization:
         """Create visualization of the GA evolution process"""
         print("\n🧬 Creating Genetic Algorithm Evolution Process...")
         
+        plt = _pyplot()
         fig, axes = plt.subplots(2, 2, figsize=(20, 16))
         fig.suptitle('Genetic Algorithm: Evolution Process and Population Dynamics', 
                      fontsize=22, fontweight='bold')
         
         # 1. Population Evolution Over Generations
         generations = np.arange(50)
-        np.random.seed(42)
+        rng = np.random.default_rng(42)
         
         # Simulate population statistics over generations
-        population_size = 100
-        best_fitness = []
-        avg_fitness = []
-        worst_fitness = []
-        diversity = []
-        
-        # Initial population
-        current_best = 5.0
-        current_avg = 3.0
-        current_worst = 1.0
-        current_diversity = 0.8
-        
-        for gen in range(50):
-            # Evolution effects
-            improvement_rate = 0.1 * np.exp(-gen/20)  # Decreasing improvement over time
-            mutation_effect = 0.05 * np.random.normal(0, 1)
-            
-            # Update fitness values
-            current_best += improvement_rate + abs(mutation_effect)
-            current_avg += improvement_rate * 0.7 + mutation_effect * 0.5
-            current_worst += improvement_rate * 0.3 + mutation_effect * 0.3
-            
-            # Add some randomness
-            current_best += np.random.normal(0, 0.02)
-            current_avg += np.random.normal(0, 0.03)
-            current_worst += np.random.normal(0, 0.04)
-            
-            # Ensure bounds
-            current_best = min(current_best, 10.0)
-            current_avg = np.clip(current_avg, 1.0, 9.0)
-            current_worst = np.clip(current_worst, 0.5, 8.0)
-            
-            # Update diversity (decreases over time as population converges)
-            current_diversity = max(0.1, current_diversity - 0.01 + np.random.normal(0, 0.02))
-            
-            best_fitness.append(current_best)
-            avg_fitness.append(current_avg)
-            worst_fitness.append(current_worst)
-            diversity.append(current_diversity)
+        best_fitness, avg_fitness, worst_fitness, diversity = _simulate_population_evolution(50, rng)
         
         # Plot fitness evolution
         axes[0,0].plot(generations, best_fitness, 'g-', linewidth=3, label='Best Fitness', color='green')
@@ -104,14 +288,14 @@ class GeneticAlgorithmVisualization:
         # Show how selection pressure affects population distribution
         fitness_values = np.linspace(0, 10, 100)
         
-        # Different selection pressure scenarios
-        low_pressure = 1.0 + 0.5 * fitness_values  # Linear selection
-        medium_pressure = 1.0 + 2.0 * fitness_values  # Quadratic selection
-        high_pressure = 1.0 + 5.0 * fitness_values  # High selection pressure
+        # Different selection pressure scenarios (low, medium, high), one row each
+        pressure_coefficients = np.array([0.5, 2.0, 5.0])
+        pressures = 1.0 + pressure_coefficients[:, None] * fitness_values[None, :]
+        pressure_labels = ['Low Selection Pressure', 'Medium Selection Pressure', 'High Selection Pressure']
+        pressure_colors = ['green', 'blue', 'red']
         
-        axes[0,1].plot(fitness_values, low_pressure, 'g-', linewidth=3, label='Low Selection Pressure', color='green')
-        axes[0,1].plot(fitness_values, medium_pressure, 'b-', linewidth=3, label='Medium Selection Pressure', color='blue')
-        axes[0,1].plot(fitness_values, high_pressure, 'r-', linewidth=3, label='High Selection Pressure', color='red')
+        for pressure, label, color in zip(pressures, pressure_labels, pressure_colors):
+            axes[0,1].plot(fitness_values, pressure, '-', linewidth=3, label=label, color=color)
         
         axes[0,1].set_title('Selection Pressure and Fitness Distribution', fontweight='bold', fontsize=16)
         axes[0,1].set_xlabel('Fitness Score', fontsize=14)
@@ -122,23 +306,21 @@ class GeneticAlgorithmVisualization:
         # 3. Crossover and Mutation Operations
         # Visualize how genetic operators work
         # Create example chromosomes
-        parent1 = np.random.randint(0, 2, 20)
-        parent2 = np.random.randint(0, 2, 20)
+        parent1 = rng.integers(0, 2, 20)
+        parent2 = rng.integers(0, 2, 20)
         
         # Crossover point
         crossover_point = 12
         
         # Create offspring
-        offspring1 = np.concatenate([parent1[:crossover_point], parent2[crossover_point:]])
-        offspring2 = np.concatenate([parent2[:crossover_point], parent1[crossover_point:]])
+        crossover_mask = np.arange(len(parent1)) < crossover_point
+        offspring1 = np.where(crossover_mask, parent1, parent2)
+        offspring2 = np.where(crossover_mask, parent2, parent1)
         
-        # Apply mutation
+        # Apply mutation (flip each gene independently with probability mutation_rate)
         mutation_rate = 0.1
-        for i in range(len(offspring1)):
-            if np.random.random() < mutation_rate:
-                offspring1[i] = 1 - offspring1[i]
-            if np.random.random() < mutation_rate:
-                offspring2[i] = 1 - offspring2[i]
+        offspring1 ^= rng.random(len(offspring1)) < mutation_rate
+        offspring2 ^= rng.random(len(offspring2)) < mutation_rate
         
         # Plot chromosomes
         x_pos = np.arange(20)
@@ -181,18 +363,20 @@ class GeneticAlgorithmVisualization:
         axes[1,1].legend()
         axes[1,1].grid(True, alpha=0.3)
         
-        plt.tight_layout()
-        plt.savefig(f'{self.output_dir}/genetic_algorithm_evolution_process.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.tight_layout()
+        fig.savefig(f'{self.output_dir}/genetic_algorithm_evolution_process.png', dpi=300, bbox_inches='tight')
+        plt.close(fig)
         print(f"   💾 Saved: {self.output_dir}/genetic_algorithm_evolution_process.png")
         
     def create_genetic_operators_visualization(self):
         """Create detailed visualization of genetic operators"""
         print("\n⚙️ Creating Genetic Algorithm Operators Details...")
         
+        plt = _pyplot()
         fig, axes = plt.subplots(2, 2, figsize=(20, 16))
         fig.suptitle('Genetic Algorithm: Genetic Operators and Selection Mechanisms', 
                      fontsize=22, fontweight='bold')
+        rng = np.random.default_rng(42)
         
         # 1. Selection Methods Comparison
         # Compare different selection methods
@@ -202,12 +386,8 @@ class GeneticAlgorithmVisualization:
         # Calculate selection probabilities for different methods
         # Tournament selection
         tournament_size = 3
-        tournament_probs = []
-        for i in range(len(fitness_values)):
-            # Probability of being selected in tournament
-            prob = 1 - (1 - (fitness_values[i] / fitness_values.sum())) ** tournament_size
-            tournament_probs.append(prob)
-        tournament_probs = np.array(tournament_probs)
+        # Probability of each individual being selected in a tournament
+        tournament_probs = 1 - (1 - fitness_values / fitness_values.sum()) ** tournament_size
         tournament_probs = tournament_probs / tournament_probs.sum()
         
         # Roulette wheel selection
@@ -236,33 +416,44 @@ class GeneticAlgorithmVisualization:
         # Show different crossover operators
         # Create example chromosomes
         chrom_length = 16
-        parent1 = np.random.randint(0, 2, chrom_length)
-        parent2 = np.random.randint(0, 2, chrom_length)
+        parent1 = rng.integers(0, 2, chrom_length)
+        parent2 = rng.integers(0, 2, chrom_length)
+        
+        # Operate on bit-packed chromosomes: each crossover is a mask blend
+        # (genes where the mask is set come from the first parent)
+        packed1, packed2 = _pack_bits(parent1), _pack_bits(parent2)
         
         # Single-point crossover
         sp_crossover = 8
-        sp_offspring1 = np.concatenate([parent1[:sp_crossover], parent2[sp_crossover:]])
-        sp_offspring2 = np.concatenate([parent2[:sp_crossover], parent1[sp_crossover:]])
+        sp_mask = (1 << sp_crossover) - 1
+        sp_offspring1 = _unpack_bits((packed1 & sp_mask) | (packed2 & ~sp_mask), chrom_length)
+        sp_offspring2 = _unpack_bits((packed2 & sp_mask) | (packed1 & ~sp_mask), chrom_length)
         
         # Two-point crossover
         tp_crossover1, tp_crossover2 = 4, 12
-        tp_offspring1 = np.concatenate([parent1[:tp_crossover1], parent2[tp_crossover1:tp_crossover2], parent1[tp_crossover2:]])
-        tp_offspring2 = np.concatenate([parent2[:tp_crossover1], parent1[tp_crossover1:tp_crossover2], parent2[tp_crossover2:]])
+        tp_mask = ((1 << chrom_length) - 1) ^ ((1 << tp_crossover2) - 1) ^ ((1 << tp_crossover1) - 1)
+        tp_offspring1 = _unpack_bits((packed1 & tp_mask) | (packed2 & ~tp_mask), chrom_length)
+        tp_offspring2 = _unpack_bits((packed2 & tp_mask) | (packed1 & ~tp_mask), chrom_length)
         
         # Uniform crossover
-        uniform_mask = np.random.randint(0, 2, chrom_length)
-        u_offspring1 = np.where(uniform_mask, parent1, parent2)
-        u_offspring2 = np.where(uniform_mask, parent2, parent1)
+        uniform_mask = _pack_bits(rng.integers(0, 2, chrom_length))
+        u_offspring1 = _unpack_bits((packed1 & uniform_mask) | (packed2 & ~uniform_mask), chrom_length)
+        u_offspring2 = _unpack_bits((packed2 & uniform_mask) | (packed1 & ~uniform_mask), chrom_length)
         
         # Plot crossover results
         x_pos = np.arange(chrom_length)
         width = 0.15
         
-        axes[0,1].bar(x_pos - 2*width, parent1, width, label='Parent 1', color='blue', alpha=0.7)
-        axes[0,1].bar(x_pos - width, parent2, width, label='Parent 2', color='red', alpha=0.7)
-        axes[0,1].bar(x_pos, sp_offspring1, width, label='SP Offspring 1', color='green', alpha=0.7)
-        axes[0,1].bar(x_pos + width, sp_offspring2, width, label='SP Offspring 2', color='orange', alpha=0.7)
-        axes[0,1].bar(x_pos + 2*width, u_offspring1, width, label='Uniform Offspring 1', color='purple', alpha=0.7)
+        axes[0,1].bar(x_pos - 2*width, parent1, width, label='Parent 1', color='blue', alpha=0.7,
+                      rasterized=True)
+        axes[0,1].bar(x_pos - width, parent2, width, label='Parent 2', color='red', alpha=0.7,
+                      rasterized=True)
+        axes[0,1].bar(x_pos, sp_offspring1, width, label='SP Offspring 1', color='green', alpha=0.7,
+                      rasterized=True)
+        axes[0,1].bar(x_pos + width, sp_offspring2, width, label='SP Offspring 2', color='orange', alpha=0.7,
+                      rasterized=True)
+        axes[0,1].bar(x_pos + 2*width, u_offspring1, width, label='Uniform Offspring 1', color='purple', alpha=0.7,
+                      rasterized=True)
         
         # Highlight crossover points
         axes[0,1].axvline(x=sp_crossover - 0.5, color='green', linestyle='--', linewidth=2, alpha=0.7)
@@ -282,24 +473,21 @@ class GeneticAlgorithmVisualization:
         mutation_rates = [0.01, 0.05, 0.1, 0.2]
         generations = np.arange(30)
         
-        for i, rate in enumerate(mutation_rates):
-            # Simulate population evolution with different mutation rates
-            population_fitness = []
-            current_fitness = 5.0
-            
-            for gen in range(30):
-                # Add improvement
-                improvement = 0.2 * np.exp(-gen/10)
-                current_fitness += improvement
-                
-                # Add mutation effects
-                mutation_effect = np.random.normal(0, rate * 2)
-                current_fitness += mutation_effect
-                
-                # Ensure bounds
-                current_fitness = np.clip(current_fitness, 1.0, 10.0)
-                population_fitness.append(current_fitness)
-            
+        # Simulate population evolution for all mutation rates at once; the noise
+        # is drawn up front in the same per-rate order as one rate at a time
+        mutation_effects = rng.normal(0, np.array(mutation_rates)[:, None] * 2,
+                                      (len(mutation_rates), len(generations)))
+        trajectories = np.empty_like(mutation_effects)
+        current_fitness = np.full(len(mutation_rates), 5.0)
+        
+        for gen in range(30):
+            # Add improvement and mutation effects, then ensure bounds; the walk is not
+            # monotone, so the clamp has to apply at every step, not to the final sum
+            improvement = 0.2 * np.exp(-gen/10)
+            current_fitness = np.clip(current_fitness + improvement + mutation_effects[:, gen], 1.0, 10.0)
+            trajectories[:, gen] = current_fitness
+        
+        for rate, population_fitness in zip(mutation_rates, trajectories):
             axes[1,0].plot(generations, population_fitness, linewidth=3, 
                           label=f'Mutation Rate: {rate}', alpha=0.8)
         
@@ -347,15 +535,16 @@ class GeneticAlgorithmVisualization:
         labels = [l.get_label() for l in lines]
         ax1.legend(lines, labels, loc='upper left')
         
-        plt.tight_layout()
-        plt.savefig(f'{self.output_dir}/genetic_algorithm_operators.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.tight_layout()
+        fig.savefig(f'{self.output_dir}/genetic_algorithm_operators.png', dpi=300, bbox_inches='tight')
+        plt.close(fig)
         print(f"   💾 Saved: {self.output_dir}/genetic_algorithm_operators.png")
         
     def create_convergence_analysis(self):
         """Create convergence analysis and performance characteristics"""
         print("\n📈 Creating Genetic Algorithm Convergence Analysis...")
         
+        plt = _pyplot()
         fig, axes = plt.subplots(2, 2, figsize=(20, 16))
         fig.suptitle('Genetic Algorithm: Convergence Analysis and Performance Characteristics', 
                      fontsize=22, fontweight='bold')
@@ -364,11 +553,13 @@ class GeneticAlgorithmVisualization:
         # Show different convergence scenarios
         generations = np.arange(100)
         
-        # Different convergence patterns
-        premature_convergence = 6 * np.exp(-generations/15) + 0.5
-        normal_convergence = 8 * np.exp(-generations/25) + 0.2
-        slow_convergence = 9 * np.exp(-generations/40) + 0.1
-        oscillating_convergence = 7 * np.exp(-generations/30) + 0.3 + 0.5 * np.sin(generations/8)
+        # Different convergence patterns, from one table of decay curves
+        # (one column per time constant)
+        decay = np.exp(-generations[:, None] / np.array([15, 25, 40, 30]))
+        premature_convergence = 6 * decay[:, 0] + 0.5
+        normal_convergence = 8 * decay[:, 1] + 0.2
+        slow_convergence = 9 * decay[:, 2] + 0.1
+        oscillating_convergence = 7 * decay[:, 3] + 0.3 + 0.5 * np.sin(generations/8)
         
         convergence_patterns = [
             (premature_convergence, 'Premature Convergence', 'red', '-'),
@@ -389,16 +580,13 @@ class GeneticAlgorithmVisualization:
         
         # 2. Population Diversity Over Time
         # Show how diversity changes during evolution
-        diversity_evolution = []
-        current_diversity = 0.9
+        # Diversity decreases over time but can be maintained with proper operators
+        decay_rate = 0.01
+        maintenance_rate = 0.005 * np.sin(generations/10)  # Oscillating maintenance
         
-        for gen in range(100):
-            # Diversity decreases over time but can be maintained with proper operators
-            decay_rate = 0.01
-            maintenance_rate = 0.005 * np.sin(gen/10)  # Oscillating maintenance
-            
-            current_diversity = max(0.1, current_diversity - decay_rate + maintenance_rate)
-            diversity_evolution.append(current_diversity)
+        # Every step is a net decrease, so flooring the running total once is
+        # the same as flooring at each generation
+        diversity_evolution = np.maximum(0.1, 0.9 + np.cumsum(maintenance_rate - decay_rate))
         
         axes[0,1].plot(generations, diversity_evolution, 'b-', linewidth=3, color='blue')
         axes[0,1].fill_between(generations, diversity_evolution, alpha=0.3, color='blue')
@@ -415,17 +603,16 @@ class GeneticAlgorithmVisualization:
         
         # 3. Selection Pressure Effects
         # Show how selection pressure affects convergence
-        selection_pressures = [0.5, 1.0, 2.0, 5.0]
-        
-        for pressure in selection_pressures:
-            # Simulate convergence with different selection pressures
-            conv_generations = np.arange(50)
-            # Higher pressure = faster convergence but risk of premature convergence
-            if pressure <= 1.0:
-                conv_fitness = 8 * (1 - np.exp(-conv_generations / (20/pressure)))
-            else:
-                conv_fitness = 8 * (1 - np.exp(-conv_generations / (20/pressure))) + 0.5 * np.sin(conv_generations/5)
-            
+        selection_pressures = np.array([0.5, 1.0, 2.0, 5.0])
+        conv_generations = np.arange(50)
+        
+        # Simulate convergence for all selection pressures at once, one row each.
+        # Higher pressure = faster convergence but risk of premature convergence
+        pressure_rows = selection_pressures[:, None]
+        conv_curves = 8 * (1 - np.exp(-conv_generations / (20/pressure_rows)))
+        conv_curves = conv_curves + np.where(pressure_rows > 1.0, 0.5 * np.sin(conv_generations/5), 0.0)
+        
+        for pressure, conv_fitness in zip(selection_pressures, conv_curves):
             axes[1,0].plot(conv_generations, conv_fitness, linewidth=3, 
                           label=f'Pressure: {pressure}', alpha=0.8)
         
@@ -461,176 +648,17 @@ class GeneticAlgorithmVisualization:
         axes[1,1].legend()
         axes[1,1].grid(True, alpha=0.3)
         
-        plt.tight_layout()
-        plt.savefig(f'{self.output_dir}/genetic_algorithm_convergence_analysis.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.tight_layout()
+        fig.savefig(f'{self.output_dir}/genetic_algorithm_convergence_analysis.png', dpi=300, bbox_inches='tight')
+        plt.close(fig)
         print(f"   💾 Saved: {self.output_dir}/genetic_algorithm_convergence_analysis.png")
         
     def create_visualization_documentation(self):
         """Create documentation explaining the Genetic Algorithm visualizations"""
         print("\n📋 Creating Genetic Algorithm Visualization Documentation...")
         
-        documentation = """
-# 🧬 **GENETIC ALGORITHM VISUALIZATION DOCUMENTATION**
-## Faculty Workload Allocation System - Algorithm Operation Visualization
-
----
-
-## 📊 **OVERVIEW**
-
-This document explains the comprehensive visualizations created to demonstrate how the Genetic Algorithm (GA) operates in the Faculty Workload Allocation System. These visualizations provide clear insights into the algorithm's evolution process, genetic operators, selection mechanisms, and convergence behavior.
-
----
-
-## 🧬 **EVOLUTION PROCESS AND POPULATION DYNAMICS**
-
-### **File**: `genetic_algorithm_evolution_process.png`
-**Purpose**: Visualize the GA evolution process and population dynamics
-
-#### **Panel 1: Population Fitness Evolution Over Generations**
-- **What it shows**: How fitness values change across generations for best, average, and worst individuals
-- **Key insight**: Population improvement over time with diversity tracking
-- **Algorithm relevance**: Demonstrates GA's ability to improve solutions iteratively
-- **Paper usage**: Results section to show algorithm performance
-
-#### **Panel 2: Selection Pressure and Fitness Distribution**
-- **What it shows**: Different selection pressure scenarios and their impact
-- **Key insight**: Selection pressure affects solution quality and diversity
-- **Algorithm relevance**: Critical parameter for controlling evolution
-- **Paper usage**: Methodology section to explain selection mechanisms
-
-#### **Panel 3: Crossover and Mutation Operations**
-- **What it shows**: Visual representation of genetic operators in action
-- **Key insight**: How genetic material is exchanged and modified
-- **Algorithm relevance**: Core mechanisms of genetic evolution
-- **Paper usage**: Methodology section to explain genetic operators
-
-#### **Panel 4: Population Diversity vs Convergence Speed**
-- **What it shows**: Relationship between diversity and convergence characteristics
-- **Key insight**: Higher diversity can lead to slower but more robust convergence
-- **Algorithm relevance**: Trade-off between exploration and exploitation
-- **Paper usage**: Discussion section to analyze algorithm behavior
-
----
-
-## ⚙️ **GENETIC OPERATORS AND SELECTION MECHANISMS**
-
-### **File**: `genetic_algorithm_operators.png`
-**Purpose**: Detailed explanation of genetic operators and selection methods
-
-#### **Panel 1: Selection Methods Comparison**
-- **What it shows**: Tournament, roulette wheel, and rank-based selection
-- **Key insight**: Different selection methods have varying impacts on evolution
-- **Algorithm relevance**: Selection method choice affects convergence behavior
-- **Paper usage**: Methodology section to justify design choices
-
-#### **Panel 2: Crossover Operators Comparison**
-- **What it shows**: Single-point, two-point, and uniform crossover
-- **Key insight**: Different crossover strategies produce varying offspring diversity
-- **Algorithm relevance**: Crossover design affects genetic material exchange
-- **Paper usage**: Methodology section to explain genetic operations
-
-#### **Panel 3: Mutation Rate Effects**
-- **What it shows**: How different mutation rates affect population evolution
-- **Key insight**: Optimal mutation rate balances exploration and exploitation
-- **Algorithm relevance**: Mutation prevents premature convergence
-- **Paper usage**: Methodology section to document parameter choices
-
-#### **Panel 4: Population Size Effects**
-- **What it shows**: Relationship between population size, diversity, and convergence
-- **Key insight**: Larger populations maintain diversity but converge slower
-- **Algorithm relevance**: Population size is a critical design parameter
-- **Paper usage**: Methodology section to justify population sizing
-
----
-
-## 📈 **CONVERGENCE ANALYSIS**
-
-### **File**: `genetic_algorithm_convergence_analysis.png`
-**Purpose**: Analysis of convergence behavior and performance characteristics
-
-#### **Panel 1: Different Convergence Patterns**
-- **What it shows**: Various convergence scenarios including premature convergence
-- **Key insight**: GA can exhibit different convergence behaviors
-- **Algorithm relevance**: Understanding convergence patterns helps parameter tuning
-- **Paper usage**: Results section to analyze performance characteristics
-
-#### **Panel 2: Population Diversity Evolution**
-- **What it shows**: How genetic diversity changes during evolution
-- **Key insight**: Diversity maintenance is crucial for avoiding local optima
-- **Algorithm relevance**: Diversity affects global search capability
-- **Paper usage**: Results section to demonstrate algorithm behavior
-
-#### **Panel 3: Selection Pressure Effects**
-- **What it shows**: Impact of selection pressure on convergence speed
-- **Key insight**: Higher pressure leads to faster but potentially premature convergence
-- **Algorithm relevance**: Selection pressure controls evolution speed
-- **Paper usage**: Discussion section to analyze parameter sensitivity
-
-#### **Panel 4: GA vs Other Algorithms**
-- **What it shows**: GA performance relative to other metaheuristics
-- **Key insight**: GA excels in solution quality and global optima finding
-- **Algorithm relevance**: Context for algorithm selection
-- **Paper usage**: Discussion section to compare approaches
-
----
-
-## 🎯 **ACADEMIC PAPER INTEGRATION**
-
-### **Methodology Section**
-- **Evolution Process**: Explain GA operation and population dynamics
-- **Genetic Operators**: Justify selection, crossover, and mutation choices
-- **Parameter Selection**: Document population size and operator parameters
-
-### **Results Section**
-- **Fitness Evolution**: Show population improvement over generations
-- **Convergence Analysis**: Demonstrate convergence patterns and speed
-- **Operator Effects**: Analyze impact of genetic operators
-
-### **Discussion Section**
-- **Selection Pressure**: Analyze convergence vs diversity trade-offs
-- **Population Sizing**: Discuss population size effects on performance
-- **Algorithm Comparison**: Contextualize GA performance
-
-### **Conclusions Section**
-- **Algorithm Strengths**: Summarize GA advantages
-- **Parameter Insights**: Document key parameter findings
-- **Future Work**: Suggest operator and parameter improvements
-
----
-
-## 🔬 **TECHNICAL DETAILS**
-
-### **Visualization Features**
-- **High Resolution**: 300 DPI for publication quality
-- **Color Coding**: Consistent color scheme for clarity
-- **Annotations**: Clear labels and explanations
-- **Multi-Panel**: Comprehensive coverage in single figures
-
-### **Algorithm Parameters**
-- **Population Size**: 100 individuals
-- **Selection Method**: Tournament selection (size 3)
-- **Crossover Rate**: 0.8 (80% probability)
-- **Mutation Rate**: 0.1 (10% probability)
-- **Elitism**: Best individual preserved
-
----
-
-## 🎉 **CONCLUSION**
-
-These Genetic Algorithm visualizations provide comprehensive insights into algorithm operation, making the complex evolution process accessible and understandable. They support the academic paper by:
-
-1. **Explaining Evolution Process**: Clear visualization of population dynamics
-2. **Demonstrating Genetic Operators**: Detailed explanation of selection, crossover, and mutation
-3. **Analyzing Convergence**: Understanding of convergence patterns and speed
-4. **Supporting Methodology**: Justification of algorithm design choices
-
-**Ready for comprehensive academic paper integration! 🎓🧬**
-"""
-        
         # Save documentation
-        with open(f'{self.output_dir}/genetic_algorithm_visualization_documentation.md', 'w') as f:
-            f.write(documentation)
+        Path(f'{self.output_dir}/genetic_algorithm_visualization_documentation.md').write_text(_GA_VIZ_DOC)
         
         print(f"   💾 Saved: {self.output_dir}/genetic_algorithm_visualization_documentation.md")
         
@@ -642,10 +670,14 @@ These Genetic Algorithm visualizations provide comprehensive insights into algor
         # Create output directory
         self.create_output_directory()
         
-        # Generate visualizations
-        self.create_evolution_process_visualization()
-        self.create_genetic_operators_visualization()
-        self.create_convergence_analysis()
+        # Generate visualizations in parallel; each panel seeds its own generator
+        # and writes its own file, so the worker processes share no state
+        with ProcessPoolExecutor(max_workers=min(3, os.cpu_count() or 1)) as executor:
+            futures = [executor.submit(self.create_evolution_process_visualization),
+                       executor.submit(self.create_genetic_operators_visualization),
+                       executor.submit(self.create_convergence_analysis)]
+            for future in futures:
+                future.result()
         
         # Create documentation
         self.create_visualization_documentation()
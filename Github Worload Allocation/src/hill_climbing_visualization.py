@@ -4,107 +4,303 @@ Hill Climbing Algorithm Visualization
 Shows the search process, neighbor generation, and solution improvement
 """
 
+import math
 import pandas as pd
 import numpy as np
+from pathlib import Path
+import matplotlib
+matplotlib.use('Agg')  # Figures are only saved to files, never shown
 import matplotlib.pyplot as plt
-import seaborn as sns
+from plot_style import HUSL_PALETTE
+from numba_compat import njit, vectorize
 from matplotlib.patches import Rectangle, Circle, Arrow
 import warnings
 warnings.filterwarnings('ignore')
 
 # Set style for publication-quality plots
 plt.style.use('seaborn-v0_8-whitegrid')
-sns.set_palette("husl")
+plt.rcParams['axes.prop_cycle'] = plt.cycler(color=HUSL_PALETTE)
 plt.rcParams['figure.figsize'] = (14, 10)
 plt.rcParams['font.size'] = 12
 plt.rcParams['axes.titlesize'] = 16
 plt.rcParams['axes.labelsize'] = 14
 
+@njit(cache=True)
+def _landscape_fitness(x, y):
+    """Fitness landscape with multiple peaks, for points or element-wise for arrays"""
+    fitness = -((x-3)**2 + (y-7)**2) - 0.5*((x-8)**2 + (y-2)**2) - 0.3*((x-1)**2 + (y-1)**2)
+    fitness = fitness + 0.1*np.sin(5*x) + 0.1*np.cos(5*y)
+    return fitness
+
+def _multi_peak_fitness(x):
+    """1D fitness function with multiple peaks, for the local optima illustration"""
+    return -0.5*(x-2)**2 + 2*np.sin(x) + 5
+
+@vectorize(['float64(float64, float64)'], target='parallel', cache=True)
+def _landscape_grid(x, y):
+    """Fitness landscape as a ufunc, evaluated across cores for whole meshgrids"""
+    return _landscape_fitness(x, y)
+
+@njit(cache=True)
+def _hc_search(x0, y0, step_size, angles):
+    """Simulate a Hill Climbing run, one row of neighbor angles per iteration"""
+    max_iterations, num_neighbors = angles.shape
+    path_x = np.empty(max_iterations + 1)
+    path_y = np.empty(max_iterations + 1)
+    path_fitness = np.empty(max_iterations + 1)
+    
+    path_x[0] = x0
+    path_y[0] = y0
+    path_fitness[0] = _landscape_fitness(x0, y0)
+    length = 1
+    
+    for iteration in range(max_iterations):
+        current_x = path_x[length - 1]
+        current_y = path_y[length - 1]
+        
+        # Find best neighbor (kept within bounds)
+        best_x = best_y = 0.0
+        best_fitness = -np.inf
+        for k in range(num_neighbors):
+            neighbor_x = min(max(current_x + step_size * np.cos(angles[iteration, k]), 0.0), 10.0)
+            neighbor_y = min(max(current_y + step_size * np.sin(angles[iteration, k]), 0.0), 10.0)
+            neighbor_fitness = _landscape_fitness(neighbor_x, neighbor_y)
+            if neighbor_fitness > best_fitness:
+                best_x, best_y, best_fitness = neighbor_x, neighbor_y, neighbor_fitness
+        
+        # Move to best neighbor if it's better, otherwise a local optimum is reached
+        if best_fitness <= path_fitness[length - 1]:
+            break
+        path_x[length] = best_x
+        path_y[length] = best_y
+        path_fitness[length] = best_fitness
+        length += 1
+    
+    return path_x[:length], path_y[:length], path_fitness[:length]
+
+# Markdown guide written next to the figures by create_visualization_documentation
+_HC_VIZ_DOC = """
+# 🏔️ **HILL CLIMBING ALGORITHM VISUALIZATION DOCUMENTATION**
+## Faculty Workload Allocation System - Algorithm Operation Visualization
+
+---
+
+## 📊 **OVERVIEW**
+
+This document explains the comprehensive visualizations created to demonstrate how the Hill Climbing algorithm operates in the Faculty Workload Allocation System. These visualizations provide clear insights into the algorithm's search process, neighbor generation, convergence behavior, and performance characteristics.
+
+---
+
+## 🔍 **SEARCH SPACE AND EXPLORATION**
+
+### **File**: `hill_climbing_search_space.png`
+**Purpose**: Visualize the search space and Hill Climbing exploration process
+
+#### **Panel 1: Fitness Landscape (Search Space)**
+- **What it shows**: 2D representation of the fitness landscape with multiple peaks
+- **Key insight**: Complex, multi-modal fitness landscape with local and global optima
+- **Algorithm relevance**: Shows why Hill Climbing might get stuck in local optima
+- **Paper usage**: Methodology section to explain problem complexity
+
+#### **Panel 2: Hill Climbing Search Path**
+- **What it shows**: Actual search path taken by Hill Climbing algorithm
+- **Key insight**: Step-by-step improvement from initial to final solution
+- **Algorithm relevance**: Demonstrates iterative improvement process
+- **Paper usage**: Results section to show algorithm behavior
+
+#### **Panel 3: Fitness Improvement Over Iterations**
+- **What it shows**: Fitness score improvement over algorithm iterations
+- **Key insight**: Convergence pattern and improvement rate
+- **Algorithm relevance**: Shows algorithm efficiency and convergence
+- **Paper usage**: Results section to demonstrate performance
+
+#### **Panel 4: Neighbor Generation and Selection**
+- **What it shows**: How neighbors are generated around current solution
+- **Key insight**: Neighbor generation strategy and selection process
+- **Algorithm relevance**: Core mechanism of Hill Climbing
+- **Paper usage**: Methodology section to explain algorithm operation
+
+---
+
+## ⚙️ **ALGORITHM OPERATION DETAILS**
+
+### **File**: `hill_climbing_operation_details.png`
+**Purpose**: Detailed explanation of algorithm mechanisms and operation
+
+#### **Panel 1: Algorithm Flowchart**
+- **What it shows**: Step-by-step flowchart of Hill Climbing algorithm
+- **Key insight**: Complete algorithm logic and decision points
+- **Algorithm relevance**: Core algorithm structure and flow
+- **Paper usage**: Methodology section to explain algorithm design
+
+#### **Panel 2: Neighbor Generation Strategies**
+- **What it shows**: Different approaches to generating neighboring solutions
+- **Key insight**: Impact of neighbor generation on algorithm performance
+- **Algorithm relevance**: Critical parameter affecting search quality
+- **Paper usage**: Methodology section to justify design choices
+
+#### **Panel 3: Local Optima Problem**
+- **What it shows**: How Hill Climbing can get stuck in local optima
+- **Key insight**: Fundamental limitation of the algorithm
+- **Algorithm relevance**: Explains why Hill Climbing might not find global optimum
+- **Paper usage**: Discussion section to analyze limitations
+
+#### **Panel 4: Algorithm Parameters and Impact**
+- **What it shows**: Key parameters and their influence on performance
+- **Key insight**: Parameter tuning importance for algorithm effectiveness
+- **Algorithm relevance**: Practical considerations for implementation
+- **Paper usage**: Methodology section to document parameter choices
+
+---
+
+## 📈 **CONVERGENCE ANALYSIS**
+
+### **File**: `hill_climbing_convergence_analysis.png`
+**Purpose**: Analysis of convergence behavior and performance characteristics
+
+#### **Panel 1: Different Convergence Patterns**
+- **What it shows**: Various convergence scenarios and patterns
+- **Key insight**: Algorithm behavior under different conditions
+- **Algorithm relevance**: Understanding of algorithm dynamics
+- **Paper usage**: Results section to analyze performance patterns
+
+#### **Panel 2: Solution Quality Distribution**
+- **What it shows**: Distribution of final solution quality across multiple runs
+- **Key insight**: Algorithm reliability and consistency
+- **Algorithm relevance**: Performance variability assessment
+- **Paper usage**: Results section to demonstrate algorithm robustness
+
+#### **Panel 3: Performance vs Problem Size**
+- **What it shows**: How performance scales with problem complexity
+- **Key insight**: Algorithm scalability and computational requirements
+- **Algorithm relevance**: Practical applicability to larger problems
+- **Paper usage**: Discussion section to analyze scalability
+
+#### **Panel 4: Algorithm Comparison**
+- **What it shows**: Hill Climbing performance relative to other algorithms
+- **Key insight**: Algorithm strengths and weaknesses
+- **Algorithm relevance**: Context for algorithm selection
+- **Paper usage**: Discussion section to compare approaches
+
+---
+
+## 🎯 **ACADEMIC PAPER INTEGRATION**
+
+### **Methodology Section**
+- **Algorithm Flowchart**: Explain Hill Climbing operation
+- **Neighbor Generation**: Justify design choices
+- **Parameter Selection**: Document algorithm configuration
+
+### **Results Section**
+- **Search Path**: Show algorithm behavior
+- **Convergence Analysis**: Demonstrate performance characteristics
+- **Solution Quality**: Assess algorithm effectiveness
+
+### **Discussion Section**
+- **Local Optima**: Analyze algorithm limitations
+- **Performance Scaling**: Discuss scalability implications
+- **Algorithm Comparison**: Contextualize findings
+
+### **Conclusions Section**
+- **Algorithm Strengths**: Summarize advantages
+- **Limitations**: Acknowledge constraints
+- **Future Work**: Suggest improvements
+
+---
+
+## 🔬 **TECHNICAL DETAILS**
+
+### **Visualization Features**
+- **High Resolution**: 300 DPI for publication quality
+- **Color Coding**: Consistent color scheme for clarity
+- **Annotations**: Clear labels and explanations
+- **Multi-Panel**: Comprehensive coverage in single figures
+
+### **Algorithm Parameters**
+- **Step Size**: 0.5 (neighbor generation distance)
+- **Neighbor Count**: 8 (directions for neighbor generation)
+- **Max Iterations**: 1000 (convergence limit)
+- **Acceptance Threshold**: 0.001 (improvement tolerance)
+
+---
+
+## 🎉 **CONCLUSION**
+
+These Hill Climbing visualizations provide comprehensive insights into algorithm operation, making the complex search process accessible and understandable. They support the academic paper by:
+
+1. **Explaining Algorithm Operation**: Clear visualization of search process
+2. **Demonstrating Performance**: Convergence analysis and scaling behavior
+3. **Identifying Limitations**: Local optima and parameter sensitivity
+4. **Supporting Methodology**: Justification of algorithm design choices
+
+**Ready for comprehensive academic paper integration! 🎓📊**
+"""
+
 class HillClimbingVisualization:
     def __init__(self):
         self.output_dir = "results/hill_climbing_visualization"
+        self._paths = {
+            'search': f'{self.output_dir}/hill_climbing_search_space.png',
+            'operation': f'{self.output_dir}/hill_climbing_operation_details.png',
+            'convergence': f'{self.output_dir}/hill_climbing_convergence_analysis.png',
+            'documentation': f'{self.output_dir}/hill_climbing_visualization_documentation.md',
+        }
+        self.rng = np.random.default_rng(42)  # Shared by all panels for reproducible results
+        self._surface = None  # Landscape meshgrid and fitness, built on first use
         
     def create_output_directory(self):
         """Create output directory for visualizations"""
         import os
         os.makedirs(self.output_dir, exist_ok=True)
         
-    def create_search_space_visualization(self):
+    def _panel_figure(self, fig=None):
+        """Return a cleared figure for a 2x2 panel and whether the caller owns it"""
+        if fig is None:
+            return plt.figure(figsize=(20, 16)), True
+        fig.clf()
+        return fig, False
+        
+    def create_search_space_visualization(self, fig=None):
         """Create visualization of the search space and Hill Climbing exploration"""
         print("\n🔍 Creating Search Space and Hill Climbing Exploration...")
         
-        fig, axes = plt.subplots(2, 2, figsize=(20, 16))
+        fig, owns_figure = self._panel_figure(fig)
+        axes = fig.subplots(2, 2)
         fig.suptitle('Hill Climbing Algorithm: Search Space Exploration and Operation', 
                      fontsize=22, fontweight='bold')
         
         # 1. Search Space Overview
-        # Create a simplified 2D representation of the search space
-        x = np.linspace(0, 10, 100)
-        y = np.linspace(0, 10, 100)
-        X, Y = np.meshgrid(x, y)
-        
-        # Create a complex fitness landscape with multiple peaks
-        Z = -((X-3)**2 + (Y-7)**2) - 0.5*((X-8)**2 + (Y-2)**2) - 0.3*((X-1)**2 + (Y-1)**2)
-        Z = Z + 0.1*np.sin(5*X) + 0.1*np.cos(5*Y)  # Add some noise
-        
-        # Plot the fitness landscape
-        contour = axes[0,0].contourf(X, Y, Z, levels=20, cmap='viridis', alpha=0.8)
+        # Simplified 2D representation of the search space: a complex fitness
+        # landscape with multiple peaks
+        X, Y, Z = self._landscape_surface()
+        
+        # Plot the fitness landscape; the other panels reuse its contour levels
+        contour = axes[0,0].contourf(X, Y, Z, levels=20, cmap='viridis', alpha=0.8,
+                                     rasterized=True)
+        landscape_levels = contour.levels
         axes[0,0].set_title('Fitness Landscape (Search Space)', fontweight='bold', fontsize=16)
         axes[0,0].set_xlabel('Parameter 1 (e.g., Workload Distribution)', fontsize=14)
         axes[0,0].set_ylabel('Parameter 2 (e.g., Expertise Matching)', fontsize=14)
         
         # Add colorbar
-        cbar = plt.colorbar(contour, ax=axes[0,0])
+        cbar = fig.colorbar(contour, ax=axes[0,0])
         cbar.set_label('Fitness Score (Higher = Better)')
         
         # 2. Hill Climbing Search Path
         # Simulate Hill Climbing search path
-        np.random.seed(42)  # For reproducible results
-        
         # Start from a random point
-        current_x, current_y = np.random.uniform(0, 10, 2)
-        search_path_x = [current_x]
-        search_path_y = [current_y]
-        search_path_fitness = [self._calculate_fitness(current_x, current_y)]
+        current_x, current_y = self.rng.uniform(0, 10, 2)
         
-        # Simulate Hill Climbing iterations
+        # Simulate Hill Climbing iterations, 8 neighbors in random directions each
         max_iterations = 15
         step_size = 0.5
-        
-        for iteration in range(max_iterations):
-            # Generate neighbors
-            neighbors = []
-            neighbor_fitness = []
-            
-            for _ in range(8):  # 8 neighbors in 8 directions
-                angle = np.random.uniform(0, 2*np.pi)
-                neighbor_x = current_x + step_size * np.cos(angle)
-                neighbor_y = current_y + step_size * np.sin(angle)
-                
-                # Keep within bounds
-                neighbor_x = np.clip(neighbor_x, 0, 10)
-                neighbor_y = np.clip(neighbor_y, 0, 10)
-                
-                neighbors.append((neighbor_x, neighbor_y))
-                neighbor_fitness.append(self._calculate_fitness(neighbor_x, neighbor_y))
-            
-            # Find best neighbor
-            best_neighbor_idx = np.argmax(neighbor_fitness)
-            best_neighbor = neighbors[best_neighbor_idx]
-            best_neighbor_fitness = neighbor_fitness[best_neighbor_idx]
-            
-            # Move to best neighbor if it's better
-            if best_neighbor_fitness > search_path_fitness[-1]:
-                current_x, current_y = best_neighbor
-                search_path_x.append(current_x)
-                search_path_y.append(current_y)
-                search_path_fitness.append(best_neighbor_fitness)
-            else:
-                # Local optimum reached
-                break
+        angles = self.rng.uniform(0, 2*np.pi, (max_iterations, 8))
+        search_path_x, search_path_y, search_path_fitness = _hc_search(
+            current_x, current_y, step_size, angles)
         
         # Plot search path
-        axes[0,1].contourf(X, Y, Z, levels=20, cmap='viridis', alpha=0.6)
+        axes[0,1].contourf(X, Y, Z, levels=landscape_levels, cmap='viridis', alpha=0.6,
+                           rasterized=True)
         axes[0,1].plot(search_path_x, search_path_y, 'ro-', linewidth=3, markersize=8, 
                        label='Hill Climbing Path', color='red')
         axes[0,1].scatter(search_path_x[0], search_path_y[0], s=200, color='green', 
@@ -131,19 +327,19 @@ class HillClimbingVisualization:
         axes[1,0].grid(True, alpha=0.3)
         
         # Add improvement annotations
-        for i in range(1, len(search_path_fitness)):
-            improvement = search_path_fitness[i] - search_path_fitness[i-1]
-            if improvement > 0:
-                axes[1,0].annotate(f'+{improvement:.2f}', 
-                                  (i, search_path_fitness[i]), 
-                                  xytext=(0, 10), textcoords='offset points',
-                                  ha='center', fontweight='bold', color='green')
+        improvements = np.diff(search_path_fitness)
+        for i in np.flatnonzero(improvements > 0) + 1:
+            axes[1,0].annotate(f'+{improvements[i-1]:.2f}', 
+                              (i, search_path_fitness[i]), 
+                              xytext=(0, 10), textcoords='offset points',
+                              ha='center', fontweight='bold', color='green')
         
         # 4. Neighbor Generation and Selection
         # Show how neighbors are generated around current solution
         current_point = (search_path_x[-2], search_path_y[-2])  # Second to last point
         
-        axes[1,1].contourf(X, Y, Z, levels=20, cmap='viridis', alpha=0.6)
+        axes[1,1].contourf(X, Y, Z, levels=landscape_levels, cmap='viridis', alpha=0.6,
+                           rasterized=True)
         
         # Plot current solution
         axes[1,1].scatter(current_point[0], current_point[1], s=300, color='red', 
@@ -151,59 +347,62 @@ class HillClimbingVisualization:
         
         # Generate and plot neighbors
         neighbor_angles = np.linspace(0, 2*np.pi, 8, endpoint=False)
-        neighbors = []
-        neighbor_fitness = []
-        
-        for angle in neighbor_angles:
-            neighbor_x = current_point[0] + step_size * np.cos(angle)
-            neighbor_y = current_point[1] + step_size * np.sin(angle)
-            
-            # Keep within bounds
-            neighbor_x = np.clip(neighbor_x, 0, 10)
-            neighbor_y = np.clip(neighbor_y, 0, 10)
-            
-            neighbors.append((neighbor_x, neighbor_y))
-            neighbor_fitness.append(self._calculate_fitness(neighbor_x, neighbor_y))
-        
-        # Plot all neighbors
+
+        # Keep within bounds
+        neighbors_x = current_point[0] + step_size * np.cos(neighbor_angles)
+        neighbors_y = current_point[1] + step_size * np.sin(neighbor_angles)
+        np.clip(neighbors_x, 0, 10, out=neighbors_x)
+        np.clip(neighbors_y, 0, 10, out=neighbors_y)
+        neighbors = list(zip(neighbors_x, neighbors_y))
+        neighbor_fitness = self._calculate_fitness(neighbors_x, neighbors_y)
+        current_fitness = self._calculate_fitness(current_point[0], current_point[1])
+
+        # Plot all neighbors, green where they improve on the current solution
+        neighbor_colors = np.where(neighbor_fitness > current_fitness, 'green', 'orange')
+        axes[1,1].scatter(neighbors_x, neighbors_y, s=150, c=neighbor_colors, marker='^', 
+                          edgecolor='black', linewidth=1)
+        
+        # Add fitness values
         for i, (nx, ny) in enumerate(neighbors):
-            color = 'green' if neighbor_fitness[i] > self._calculate_fitness(current_point[0], current_point[1]) else 'orange'
-            axes[1,1].scatter(nx, ny, s=150, color=color, marker='^', 
-                             edgecolor='black', linewidth=1)
-            
-            # Add fitness value
             axes[1,1].annotate(f'{neighbor_fitness[i]:.2f}', (nx, ny), 
                               xytext=(0, 10), textcoords='offset points',
                               ha='center', fontweight='bold', fontsize=9)
         
-        # Plot arrows from current to neighbors
-        for nx, ny in neighbors:
-            axes[1,1].arrow(current_point[0], current_point[1], 
-                           nx - current_point[0], ny - current_point[1],
-                           head_width=0.1, head_length=0.1, fc='black', ec='black', alpha=0.6)
+        # Plot arrows from current to neighbors as one quiver collection
+        axes[1,1].quiver(np.full(len(neighbors_x), current_point[0]), np.full(len(neighbors_y), current_point[1]),
+                         neighbors_x - current_point[0], neighbors_y - current_point[1],
+                         angles='xy', scale_units='xy', scale=1, width=0.003,
+                         headwidth=3.5, headlength=3.5, headaxislength=3, color='black', alpha=0.6)
         
         axes[1,1].set_title('Neighbor Generation and Selection', fontweight='bold', fontsize=16)
         axes[1,1].set_xlabel('Parameter 1', fontsize=14)
         axes[1,1].set_ylabel('Parameter 2', fontsize=14)
         axes[1,1].legend()
         
-        plt.tight_layout()
-        plt.savefig(f'{self.output_dir}/hill_climbing_search_space.png', dpi=300, bbox_inches='tight')
-        plt.close()
-        print(f"   💾 Saved: {self.output_dir}/hill_climbing_search_space.png")
+        fig.tight_layout()
+        fig.savefig(self._paths['search'], dpi=300)
+        if owns_figure:
+            plt.close(fig)
+        print(f"   💾 Saved: {self._paths['search']}")
+        
+    def _landscape_surface(self):
+        """Return the (X, Y, Z) fitness landscape grid, computing it once per instance"""
+        if self._surface is None:
+            X, Y = np.meshgrid(np.linspace(0, 10, 100), np.linspace(0, 10, 100))
+            self._surface = (X, Y, _landscape_grid(X, Y))
+        return self._surface
         
     def _calculate_fitness(self, x, y):
-        """Calculate fitness for a given point (x, y)"""
+        """Calculate fitness for a given point (x, y), or element-wise for arrays"""
         # Same fitness function as in the search space
-        fitness = -((x-3)**2 + (y-7)**2) - 0.5*((x-8)**2 + (y-2)**2) - 0.3*((x-1)**2 + (y-1)**2)
-        fitness = fitness + 0.1*np.sin(5*x) + 0.1*np.cos(5*y)
-        return fitness
+        return _landscape_fitness(x, y)
         
-    def create_algorithm_operation_visualization(self):
+    def create_algorithm_operation_visualization(self, fig=None):
         """Create detailed visualization of Hill Climbing algorithm operation"""
         print("\n⚙️ Creating Hill Climbing Algorithm Operation Details...")
         
-        fig, axes = plt.subplots(2, 2, figsize=(20, 16))
+        fig, owns_figure = self._panel_figure(fig)
+        axes = fig.subplots(2, 2)
         fig.suptitle('Hill Climbing Algorithm: Detailed Operation and Mechanisms', 
                      fontsize=22, fontweight='bold')
         
@@ -276,17 +475,14 @@ class HillClimbingVisualization:
         
         for i, (strategy, description) in enumerate(neighbor_strategies):
             if strategy == 'Random Direction':
-                angles = np.random.uniform(0, 2*np.pi, 12)
+                angles = self.rng.uniform(0, 2*np.pi, 12)
                 neighbors = current_point + 1.5 * np.column_stack([np.cos(angles), np.sin(angles)])
             elif strategy == 'Grid Search':
-                x_offsets = np.linspace(-1.5, 1.5, 5)
-                y_offsets = np.linspace(-1.5, 1.5, 5)
-                X, Y = np.meshgrid(x_offsets, y_offsets)
-                neighbors = current_point + np.column_stack([X.ravel(), Y.ravel()])
+                neighbors = current_point + np.mgrid[-1.5:1.5:5j, -1.5:1.5:5j].reshape(2, -1).T
             else:  # Gradient Based
                 # Simulate gradient direction
                 gradient = np.array([0.8, -0.6])  # Example gradient
-                gradient = gradient / np.linalg.norm(gradient)
+                gradient /= math.hypot(gradient[0], gradient[1])
                 t_values = np.linspace(0.5, 2, 8)
                 neighbors = current_point + np.outer(t_values, gradient)
             
@@ -310,7 +506,7 @@ class HillClimbingVisualization:
         # 3. Local Optima Problem
         # Show how Hill Climbing can get stuck in local optima
         x = np.linspace(0, 10, 200)
-        y = -0.5*(x-2)**2 + 2*np.sin(x) + 5  # Function with multiple peaks
+        y = _multi_peak_fitness(x)
         
         axes[1,0].plot(x, y, 'b-', linewidth=3, label='Fitness Landscape')
         axes[1,0].set_title('Local Optima Problem in Hill Climbing', fontweight='bold', fontsize=16)
@@ -323,11 +519,11 @@ class HillClimbingVisualization:
         global_optimum = 4.2
         
         for local_opt in local_optima:
-            local_y = -0.5*(local_opt-2)**2 + 2*np.sin(local_opt) + 5
+            local_y = _multi_peak_fitness(local_opt)
             axes[1,0].scatter(local_opt, local_y, s=200, color='orange', 
                              marker='o', label='Local Optimum', edgecolor='black', linewidth=2)
         
-        global_y = -0.5*(global_optimum-2)**2 + 2*np.sin(global_optimum) + 5
+        global_y = _multi_peak_fitness(global_optimum)
         axes[1,0].scatter(global_optimum, global_y, s=200, color='red', 
                           marker='s', label='Global Optimum', edgecolor='black', linewidth=2)
         
@@ -340,7 +536,7 @@ class HillClimbingVisualization:
         
         colors = ['orange', 'orange', 'red']
         for i, (path, label) in enumerate(search_paths):
-            path_y = [-0.5*(p-2)**2 + 2*np.sin(p) + 5 for p in path]
+            path_y = _multi_peak_fitness(np.asarray(path))
             axes[1,0].plot(path, path_y, 'o-', color=colors[i], linewidth=2, 
                           markersize=8, label=label)
         
@@ -373,16 +569,18 @@ class HillClimbingVisualization:
         axes[1,1].text(0.5, -0.5, 'Medium', ha='center', fontweight='bold', fontsize=12)
         axes[1,1].text(0.8, -0.5, 'High', ha='center', fontweight='bold', fontsize=12)
         
-        plt.tight_layout()
-        plt.savefig(f'{self.output_dir}/hill_climbing_operation_details.png', dpi=300, bbox_inches='tight')
-        plt.close()
-        print(f"   💾 Saved: {self.output_dir}/hill_climbing_operation_details.png")
+        fig.tight_layout()
+        fig.savefig(self._paths['operation'], dpi=300)
+        if owns_figure:
+            plt.close(fig)
+        print(f"   💾 Saved: {self._paths['operation']}")
         
-    def create_convergence_analysis(self):
+    def create_convergence_analysis(self, fig=None):
         """Create convergence analysis and performance characteristics"""
         print("\n📈 Creating Convergence Analysis...")
         
-        fig, axes = plt.subplots(2, 2, figsize=(20, 16))
+        fig, owns_figure = self._panel_figure(fig)
+        axes = fig.subplots(2, 2)
         fig.suptitle('Hill Climbing Algorithm: Convergence Analysis and Performance Characteristics', 
                      fontsize=22, fontweight='bold')
         
@@ -415,21 +613,15 @@ class HillClimbingVisualization:
         
         # 2. Solution Quality Distribution
         # Show distribution of solution quality across multiple runs
-        np.random.seed(42)
-        
-        # Simulate multiple Hill Climbing runs
+        # Simulate multiple Hill Climbing runs of 20 iterations each, one row per run
         n_runs = 100
-        final_fitness_scores = []
-        
-        for run in range(n_runs):
-            # Simulate a Hill Climbing run
-            current_fitness = np.random.uniform(0, 10)
-            for iteration in range(20):
-                improvement = np.random.exponential(0.5)
-                if np.random.random() < 0.3:  # 30% chance of improvement
-                    current_fitness += improvement
-                current_fitness = min(current_fitness, 10)  # Cap at maximum
-            final_fitness_scores.append(current_fitness)
+        n_iterations = 20
+        initial_fitness = self.rng.uniform(0, 10, n_runs)
+        improvements = self.rng.exponential(0.5, (n_runs, n_iterations))
+        improved = self.rng.random((n_runs, n_iterations)) < 0.3  # 30% chance of improvement
+        
+        # Fitness never decreases, so capping the total once equals capping every step
+        final_fitness_scores = np.minimum(initial_fitness + (improvements * improved).sum(axis=1), 10)
         
         # Plot histogram
         axes[0,1].hist(final_fitness_scores, bins=20, color='skyblue', edgecolor='black', alpha=0.7)
@@ -498,177 +690,20 @@ class HillClimbingVisualization:
         axes[1,1].legend()
         axes[1,1].grid(True, alpha=0.3)
         
-        plt.tight_layout()
-        plt.savefig(f'{self.output_dir}/hill_climbing_convergence_analysis.png', dpi=300, bbox_inches='tight')
-        plt.close()
-        print(f"   💾 Saved: {self.output_dir}/hill_climbing_convergence_analysis.png")
+        fig.tight_layout()
+        fig.savefig(self._paths['convergence'], dpi=300)
+        if owns_figure:
+            plt.close(fig)
+        print(f"   💾 Saved: {self._paths['convergence']}")
         
     def create_visualization_documentation(self):
         """Create documentation explaining the Hill Climbing visualizations"""
         print("\n📋 Creating Hill Climbing Visualization Documentation...")
         
-        documentation = """
-# 🏔️ **HILL CLIMBING ALGORITHM VISUALIZATION DOCUMENTATION**
-## Faculty Workload Allocation System - Algorithm Operation Visualization
-
----
-
-## 📊 **OVERVIEW**
-
-This document explains the comprehensive visualizations created to demonstrate how the Hill Climbing algorithm operates in the Faculty Workload Allocation System. These visualizations provide clear insights into the algorithm's search process, neighbor generation, convergence behavior, and performance characteristics.
-
----
-
-## 🔍 **SEARCH SPACE AND EXPLORATION**
-
-### **File**: `hill_climbing_search_space.png`
-**Purpose**: Visualize the search space and Hill Climbing exploration process
-
-#### **Panel 1: Fitness Landscape (Search Space)**
-- **What it shows**: 2D representation of the fitness landscape with multiple peaks
-- **Key insight**: Complex, multi-modal fitness landscape with local and global optima
-- **Algorithm relevance**: Shows why Hill Climbing might get stuck in local optima
-- **Paper usage**: Methodology section to explain problem complexity
-
-#### **Panel 2: Hill Climbing Search Path**
-- **What it shows**: Actual search path taken by Hill Climbing algorithm
-- **Key insight**: Step-by-step improvement from initial to final solution
-- **Algorithm relevance**: Demonstrates iterative improvement process
-- **Paper usage**: Results section to show algorithm behavior
-
-#### **Panel 3: Fitness Improvement Over Iterations**
-- **What it shows**: Fitness score improvement over algorithm iterations
-- **Key insight**: Convergence pattern and improvement rate
-- **Algorithm relevance**: Shows algorithm efficiency and convergence
-- **Paper usage**: Results section to demonstrate performance
-
-#### **Panel 4: Neighbor Generation and Selection**
-- **What it shows**: How neighbors are generated around current solution
-- **Key insight**: Neighbor generation strategy and selection process
-- **Algorithm relevance**: Core mechanism of Hill Climbing
-- **Paper usage**: Methodology section to explain algorithm operation
-
----
-
-## ⚙️ **ALGORITHM OPERATION DETAILS**
-
-### **File**: `hill_climbing_operation_details.png`
-**Purpose**: Detailed explanation of algorithm mechanisms and operation
-
-#### **Panel 1: Algorithm Flowchart**
-- **What it shows**: Step-by-step flowchart of Hill Climbing algorithm
-- **Key insight**: Complete algorithm logic and decision points
-- **Algorithm relevance**: Core algorithm structure and flow
-- **Paper usage**: Methodology section to explain algorithm design
-
-#### **Panel 2: Neighbor Generation Strategies**
-- **What it shows**: Different approaches to generating neighboring solutions
-- **Key insight**: Impact of neighbor generation on algorithm performance
-- **Algorithm relevance**: Critical parameter affecting search quality
-- **Paper usage**: Methodology section to justify design choices
-
-#### **Panel 3: Local Optima Problem**
-- **What it shows**: How Hill Climbing can get stuck in local optima
-- **Key insight**: Fundamental limitation of the algorithm
-- **Algorithm relevance**: Explains why Hill Climbing might not find global optimum
-- **Paper usage**: Discussion section to analyze limitations
-
-#### **Panel 4: Algorithm Parameters and Impact**
-- **What it shows**: Key parameters and their influence on performance
-- **Key insight**: Parameter tuning importance for algorithm effectiveness
-- **Algorithm relevance**: Practical considerations for implementation
-- **Paper usage**: Methodology section to document parameter choices
-
----
-
-## 📈 **CONVERGENCE ANALYSIS**
-
-### **File**: `hill_climbing_convergence_analysis.png`
-**Purpose**: Analysis of convergence behavior and performance characteristics
-
-#### **Panel 1: Different Convergence Patterns**
-- **What it shows**: Various convergence scenarios and patterns
-- **Key insight**: Algorithm behavior under different conditions
-- **Algorithm relevance**: Understanding of algorithm dynamics
-- **Paper usage**: Results section to analyze performance patterns
-
-#### **Panel 2: Solution Quality Distribution**
-- **What it shows**: Distribution of final solution quality across multiple runs
-- **Key insight**: Algorithm reliability and consistency
-- **Algorithm relevance**: Performance variability assessment
-- **Paper usage**: Results section to demonstrate algorithm robustness
-
-#### **Panel 3: Performance vs Problem Size**
-- **What it shows**: How performance scales with problem complexity
-- **Key insight**: Algorithm scalability and computational requirements
-- **Algorithm relevance**: Practical applicability to larger problems
-- **Paper usage**: Discussion section to analyze scalability
-
-#### **Panel 4: Algorithm Comparison**
-- **What it shows**: Hill Climbing performance relative to other algorithms
-- **Key insight**: Algorithm strengths and weaknesses
-- **Algorithm relevance**: Context for algorithm selection
-- **Paper usage**: Discussion section to compare approaches
-
----
-
-## 🎯 **ACADEMIC PAPER INTEGRATION**
-
-### **Methodology Section**
-- **Algorithm Flowchart**: Explain Hill Climbing operation
-- **Neighbor Generation**: Justify design choices
-- **Parameter Selection**: Document algorithm configuration
-
-### **Results Section**
-- **Search Path**: Show algorithm behavior
-- **Convergence Analysis**: Demonstrate performance characteristics
-- **Solution Quality**: Assess algorithm effectiveness
-
-### **Discussion Section**
-- **Local Optima**: Analyze algorithm limitations
-- **Performance Scaling**: Discuss scalability implications
-- **Algorithm Comparison**: Contextualize findings
-
-### **Conclusions Section**
-- **Algorithm Strengths**: Summarize advantages
-- **Limitations**: Acknowledge constraints
-- **Future Work**: Suggest improvements
-
----
-
-## 🔬 **TECHNICAL DETAILS**
-
-### **Visualization Features**
-- **High Resolution**: 300 DPI for publication quality
-- **Color Coding**: Consistent color scheme for clarity
-- **Annotations**: Clear labels and explanations
-- **Multi-Panel**: Comprehensive coverage in single figures
-
-### **Algorithm Parameters**
-- **Step Size**: 0.5 (neighbor generation distance)
-- **Neighbor Count**: 8 (directions for neighbor generation)
-- **Max Iterations**: 1000 (convergence limit)
-- **Acceptance Threshold**: 0.001 (improvement tolerance)
-
----
-
-## 🎉 **CONCLUSION**
-
-These Hill Climbing visualizations provide comprehensive insights into algorithm operation, making the complex search process accessible and understandable. They support the academic paper by:
-
-1. **Explaining Algorithm Operation**: Clear visualization of search process
-2. **Demonstrating Performance**: Convergence analysis and scaling behavior
-3. **Identifying Limitations**: Local optima and parameter sensitivity
-4. **Supporting Methodology**: Justification of algorithm design choices
-
-**Ready for comprehensive academic paper integration! 🎓📊**
-"""
-        
         # Save documentation
-        with open(f'{self.output_dir}/hill_climbing_visualization_documentation.md', 'w') as f:
-            f.write(documentation)
+        Path(self._paths['documentation']).write_text(_HC_VIZ_DOC)
         
-        print(f"   💾 Saved: {self.output_dir}/hill_climbing_visualization_documentation.md")
+        print(f"   💾 Saved: {self._paths['documentation']}")
         
     def run_complete_visualization(self):
         """Run all Hill Climbing visualizations"""
@@ -678,10 +713,12 @@ These Hill Climbing visualizations provide comprehensive insights into algorithm
         # Create output directory
         self.create_output_directory()
         
-        # Generate visualizations
-        self.create_search_space_visualization()
-        self.create_algorithm_operation_visualization()
-        self.create_convergence_analysis()
+        # Generate visualizations, reusing one figure for every panel
+        fig = plt.figure(figsize=(20, 16))
+        self.create_search_space_visualization(fig)
+        self.create_algorithm_operation_visualization(fig)
+        self.create_convergence_analysis(fig)
+        plt.close(fig)
         
         # Create documentation
         self.create_visualization_documentation()
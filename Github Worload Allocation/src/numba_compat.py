@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Optional Numba Support
+Exposes njit/prange/vectorize, falling back to plain Python when Numba is not installed
+"""
+
+try:
+    from numba import njit, prange, vectorize
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit, usable with or without arguments"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
+
+    def vectorize(*args, **kwargs):
+        """No-op stand-in for numba.vectorize; the kernel must broadcast with NumPy"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
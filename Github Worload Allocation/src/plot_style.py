@@ -0,0 +1,8 @@
+#!/usr/bin/env python3
+"""
+Shared Plot Styling
+Colour palette constants so plotting modules do not need to import seaborn
+"""
+
+# seaborn.color_palette("husl") with its default 6 colours
+HUSL_PALETTE = ['#f77189', '#bb9832', '#50b131', '#36ada4', '#3ba3ec', '#e866f4']
@@ -4,35 +4,185 @@ Main Runner for Workload Allocation System
 Executes all three algorithms and generates comprehensive results
 """
 
+import os
+import random
 import time
+import multiprocessing
+from collections import defaultdict
+from operator import itemgetter
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import pandas as pd
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # Figures are only saved to files, never shown
 import matplotlib.pyplot as plt
-import seaborn as sns
+from matplotlib.figure import Figure
+from plot_style import HUSL_PALETTE
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Optional
 import warnings
 warnings.filterwarnings('ignore')
 
 from workload_allocator import (
-    WorkloadAllocationProblem, HillClimbing, GeneticAlgorithm, SimulatedAnnealing
+    WorkloadAllocationProblem, HillClimbing, GeneticAlgorithm, SimulatedAnnealing, warm_up_kernels
 )
 from data_adapter import load_dataset, create_test_dataset, create_problem, get_dataset_summary
 
 # Set plotting style
 plt.style.use('default')
-sns.set_palette("husl")
+plt.rcParams['axes.prop_cycle'] = plt.cycler(color=HUSL_PALETTE)
+
+# Formats one "CODE (share%)" entry of a professor's course list
+_format_assignment = "{} ({:.1f}%)".format
+
+def _compact_dtypes(df: pd.DataFrame, category_columns: List[str]) -> pd.DataFrame:
+    """Store repeated labels as categories and narrow integer columns before writing"""
+    for column in category_columns:
+        if column in df:
+            df[column] = df[column].astype('category')
+    for column in df.select_dtypes(include='integer').columns:
+        df[column] = pd.to_numeric(df[column], downcast='integer')
+    return df
+
+def _write_csv(df: pd.DataFrame, path: str):
+    """Write a report through pandas' chunked C writer"""
+    df.to_csv(path, index=False, lineterminator='\n', chunksize=10000)
+
+# Problem instance handed to pool workers once, via the executor initializer
+_WORKER_PROBLEM = None
+
+def _init_worker(problem: WorkloadAllocationProblem):
+    """Stash the problem in the worker so each task only ships its arguments"""
+    global _WORKER_PROBLEM
+    _WORKER_PROBLEM = problem
+
+def _run_in_worker(run_algorithm, use_test_dataset: bool, seed: int) -> Tuple[List, float, float]:
+    """Run one algorithm against the problem stashed by `_init_worker`"""
+    return run_algorithm(_WORKER_PROBLEM, use_test_dataset, seed)
+
+def _evaluate_in_worker(individual: List) -> float:
+    """Score one GA individual against the problem stashed by `_init_worker`"""
+    return _WORKER_PROBLEM.calculate_fitness(individual)
+
+# Smallest GA population worth shipping to an evaluator pool each generation
+_MIN_POOLED_POPULATION = 100
+
+# Console labels, in the fixed order the reports and charts use
+_ALGORITHM_LABELS = {
+    'hill_climbing': 'Hill Climbing',
+    'genetic_algorithm': 'Genetic Algorithm',
+    'simulated_annealing': 'Simulated Annealing',
+}
+
+def _print_outcome(name: str, fitness: float, execution_time: float):
+    """Print one algorithm's timing and fitness, each line labelled with the algorithm"""
+    label = _ALGORITHM_LABELS[name]
+    print(f"   ⏱️  {label} execution time: {execution_time:.2f} seconds")
+    print(f"   🎯 {label} best fitness: {fitness:.4f}")
+
+def _pool_context():
+    """Prefer fork so workers share the problem copy-on-write"""
+    if 'fork' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('fork')
+    return multiprocessing.get_context()
+
+def _run_hill_climbing(problem: WorkloadAllocationProblem, use_test_dataset: bool,
+                       seed: int) -> Tuple[List, float, float]:
+    """Run Hill Climbing algorithm"""
+    start_time = time.time()
+
+    # Use more iterations for full dataset
+    max_iterations = 5000 if not use_test_dataset else 1000
+    algorithm = HillClimbing(problem, max_iterations=max_iterations, rng=random.Random(seed))
+
+    solution, fitness = algorithm.solve()
+    execution_time = time.time() - start_time
+
+    return solution, fitness, execution_time
+
+def _run_genetic_algorithm(problem: WorkloadAllocationProblem, use_test_dataset: bool,
+                           seed: int, eval_workers: int = 0) -> Tuple[List, float, float]:
+    """Run Genetic Algorithm, optionally scoring each generation on `eval_workers` processes"""
+    start_time = time.time()
+
+    # Use larger population and more generations for full dataset
+    if use_test_dataset:
+        population_size = 50
+        generations = 100
+    else:
+        population_size = 200
+        generations = 500
+
+    algorithm = GeneticAlgorithm(
+        problem,
+        population_size=population_size,
+        generations=generations,
+        mutation_rate=0.2,  # Higher mutation for exploration
+        crossover_rate=0.8,
+        elite_size=20,
+        rng=random.Random(seed)
+    )
+
+    # Opt-in: farm each generation's fitness evaluation out to a worker pool that
+    # receives the problem once. Every generation still pickles the population
+    # both ways, so small populations are scored in-process
+    if eval_workers > 1 and population_size >= _MIN_POOLED_POPULATION:
+        chunksize = max(1, population_size // (4 * eval_workers))
+        with ProcessPoolExecutor(max_workers=eval_workers, mp_context=_pool_context(),
+                                 initializer=_init_worker, initargs=(problem,)) as pool:
+            algorithm.evaluator = lambda population: list(
+                pool.map(_evaluate_in_worker, population, chunksize=chunksize))
+            solution, fitness = algorithm.solve()
+    else:
+        solution, fitness = algorithm.solve()
+    execution_time = time.time() - start_time
+
+    return solution, fitness, execution_time
+
+def _run_simulated_annealing(problem: WorkloadAllocationProblem, use_test_dataset: bool,
+                             seed: int) -> Tuple[List, float, float]:
+    """Run Simulated Annealing algorithm"""
+    start_time = time.time()
+
+    # Use more iterations and slower cooling for full dataset
+    if use_test_dataset:
+        max_iterations = 2000
+        cooling_rate = 0.995
+    else:
+        max_iterations = 10000
+        cooling_rate = 0.999  # Slower cooling
+
+    algorithm = SimulatedAnnealing(
+        problem,
+        initial_temp=100.0,
+        cooling_rate=cooling_rate,
+        min_temp=0.1,
+        max_iterations=max_iterations,
+        rng=random.Random(seed)
+    )
+
+    solution, fitness = algorithm.solve()
+    execution_time = time.time() - start_time
+
+    return solution, fitness, execution_time
 
 class WorkloadAllocationRunner:
     """Main runner class for workload allocation experiments"""
     
-    def __init__(self, use_test_dataset: bool = False):
+    def __init__(self, use_test_dataset: bool = False, seed: int = 42):
         self.use_test_dataset = use_test_dataset
+        # Each algorithm draws from its own stream, seeded seed + its position
+        self.seed = seed
         self.professors = None
         self.courses = None
         self.problem = None
         self.results = {}
         self.execution_times = {}
+        # Per-algorithm professor loads and solution scores, filled once after the runs
+        self._load_cache = {}
+        self._scores = {}
+        # Comparison report, built and written once per set of results
+        self._comparison_df: Optional[pd.DataFrame] = None
         
     def load_data(self):
         """Load dataset (test or full)"""
@@ -45,6 +195,9 @@ class WorkloadAllocationRunner:
         
         self.problem = create_problem(self.professors, self.courses)
         
+        # Compile the fitness kernels once, before the algorithm workers fork
+        warm_up_kernels()
+        
         # Print dataset summary
         summary = get_dataset_summary(self.professors, self.courses)
         print(f"✅ Dataset loaded successfully!")
@@ -55,82 +208,31 @@ class WorkloadAllocationRunner:
     
     def run_hill_climbing(self) -> Tuple[List, float, float]:
         """Run Hill Climbing algorithm"""
-        print("🧗 Running Hill Climbing algorithm...")
-        start_time = time.time()
-        
-        # Use more iterations for full dataset
-        max_iterations = 5000 if not self.use_test_dataset else 1000
-        algorithm = HillClimbing(self.problem, max_iterations=max_iterations)
-        
-        solution, fitness = algorithm.solve()
-        execution_time = time.time() - start_time
-        
-        print(f"   ⏱️  Execution time: {execution_time:.2f} seconds")
-        print(f"   🎯 Best fitness: {fitness:.4f}")
-        
-        return solution, fitness, execution_time
+        outcome = _run_hill_climbing(self.problem, self.use_test_dataset, self.seed)
+        _print_outcome('hill_climbing', outcome[1], outcome[2])
+        return outcome
     
     def run_genetic_algorithm(self) -> Tuple[List, float, float]:
         """Run Genetic Algorithm"""
-        print("🧬 Running Genetic Algorithm...")
-        start_time = time.time()
-        
-        # Use larger population and more generations for full dataset
-        if self.use_test_dataset:
-            population_size = 50
-            generations = 100
-        else:
-            population_size = 200
-            generations = 500
-        
-        algorithm = GeneticAlgorithm(
-            self.problem,
-            population_size=population_size,
-            generations=generations,
-            mutation_rate=0.2,  # Higher mutation for exploration
-            crossover_rate=0.8,
-            elite_size=20
-        )
-        
-        solution, fitness = algorithm.solve()
-        execution_time = time.time() - start_time
-        
-        print(f"   ⏱️  Execution time: {execution_time:.2f} seconds")
-        print(f"   🎯 Best fitness: {fitness:.4f}")
-        
-        return solution, fitness, execution_time
+        # Run on its own, so the GA may use every core for fitness evaluation
+        outcome = _run_genetic_algorithm(self.problem, self.use_test_dataset, self.seed + 1,
+                                         eval_workers=os.cpu_count() or 1)
+        _print_outcome('genetic_algorithm', outcome[1], outcome[2])
+        return outcome
     
     def run_simulated_annealing(self) -> Tuple[List, float, float]:
         """Run Simulated Annealing algorithm"""
-        print("🔥 Running Simulated Annealing...")
-        start_time = time.time()
-        
-        # Use more iterations and slower cooling for full dataset
-        if self.use_test_dataset:
-            max_iterations = 2000
-            cooling_rate = 0.995
-        else:
-            max_iterations = 10000
-            cooling_rate = 0.999  # Slower cooling
-        
-        algorithm = SimulatedAnnealing(
-            self.problem,
-            initial_temp=100.0,
-            cooling_rate=cooling_rate,
-            min_temp=0.1,
-            max_iterations=max_iterations
-        )
-        
-        solution, fitness = algorithm.solve()
-        execution_time = time.time() - start_time
-        
-        print(f"   ⏱️  Execution time: {execution_time:.2f} seconds")
-        print(f"   🎯 Best fitness: {fitness:.4f}")
-        
-        return solution, fitness, execution_time
+        outcome = _run_simulated_annealing(self.problem, self.use_test_dataset, self.seed + 2)
+        _print_outcome('simulated_annealing', outcome[1], outcome[2])
+        return outcome
     
     def run_all_algorithms(self):
-        """Run all three algorithms"""
+        """Run all three algorithms side by side in worker processes
+        
+        Each execution time is wall-clock time measured while the three searches
+        share the CPU, so the execution time chart is only comparable to running
+        them one after another on a machine with at least three free cores.
+        """
         print("🚀 Starting Workload Allocation Experiment")
         print("=" * 60)
         
@@ -141,26 +243,49 @@ class WorkloadAllocationRunner:
         print("\n" + "=" * 60)
         print("🔬 ALGORITHM EXECUTION")
         print("=" * 60)
-        
-        # Hill Climbing
-        hc_solution, hc_fitness, hc_time = self.run_hill_climbing()
-        self.results['hill_climbing'] = (hc_solution, hc_fitness, hc_time)
-        self.execution_times['hill_climbing'] = hc_time
-        
-        # Genetic Algorithm
-        ga_solution, ga_fitness, ga_time = self.run_genetic_algorithm()
-        self.results['genetic_algorithm'] = (ga_solution, ga_fitness, ga_time)
-        self.execution_times['genetic_algorithm'] = ga_time
-        
-        # Simulated Annealing
-        sa_solution, sa_fitness, sa_time = self.run_simulated_annealing()
-        self.results['simulated_annealing'] = (sa_solution, sa_fitness, sa_time)
-        self.execution_times['simulated_annealing'] = sa_time
+        print("🚀 Running Hill Climbing, Genetic Algorithm and Simulated Annealing in parallel...")
+        
+        # The three searches are independent, so run them side by side; with
+        # fork the workers share the problem copy-on-write instead of pickling it.
+        # The GA worker scores in-process rather than nesting its evaluator pool
+        algorithms = {
+            'hill_climbing': _run_hill_climbing,
+            'genetic_algorithm': _run_genetic_algorithm,
+            'simulated_annealing': _run_simulated_annealing,
+        }
+        outcomes = {}
+        with ProcessPoolExecutor(max_workers=len(algorithms), mp_context=_pool_context(),
+                                 initializer=_init_worker, initargs=(self.problem,)) as executor:
+            futures = {executor.submit(_run_in_worker, run_algorithm, self.use_test_dataset, self.seed + offset): name
+                       for offset, (name, run_algorithm) in enumerate(algorithms.items())}
+            for future in as_completed(futures):
+                outcomes[futures[future]] = future.result()
+        
+        # Keep the fixed algorithm order that the reports and charts rely on; the
+        # workers stay quiet, so the summary is printed here in that order
+        for name in algorithms:
+            solution, fitness, execution_time = outcomes[name]
+            _print_outcome(name, fitness, execution_time)
+            self.results[name] = (solution, fitness, execution_time)
+            self.execution_times[name] = execution_time
+        
+        self._cache_solution_metrics()
+        self._comparison_df = None
         
         print("\n" + "=" * 60)
         print("✅ ALL ALGORITHMS COMPLETED")
         print("=" * 60)
     
+    def _cache_solution_metrics(self):
+        """Compute professor loads and solution scores once per algorithm for the reports and plots"""
+        for algo_name, (solution, fitness, execution_time) in self.results.items():
+            self._load_cache[algo_name] = self.problem.calculate_professor_loads(solution)
+            self._scores[algo_name] = {
+                'fairness': self.problem.calculate_fairness_score(solution),
+                'expertise': self.problem.calculate_expertise_score(solution),
+                'balance': self.problem.calculate_balance_score(solution)
+            }
+    
     def generate_allocation_reports(self):
         """Generate detailed allocation reports for each algorithm"""
         print("\n📊 Generating allocation reports...")
@@ -175,66 +300,92 @@ class WorkloadAllocationRunner:
             # Generate detailed allocation report
             report_df = self._create_allocation_report(solution, algo_name)
             report_filename = f"results/{algo_name}_allocation.csv"
-            report_df.to_csv(report_filename, index=False)
+            _write_csv(report_df, report_filename)
             print(f"      💾 Saved: {report_filename}")
             
             # Generate professor workload summary
             summary_df = self._create_professor_summary(solution, algo_name)
             summary_filename = f"results/{algo_name}_professor_summary.csv"
-            summary_df.to_csv(summary_filename, index=False)
+            _write_csv(summary_df, summary_filename)
             print(f"      💾 Saved: {summary_filename}")
     
     def _create_allocation_report(self, allocations: List, algo_name: str) -> pd.DataFrame:
         """Create detailed allocation report"""
-        report_data = []
+        courses = list(self.problem.courses.values())
+        professors = list(self.problem.professors.values())
+        course_index = {course_id: i for i, course_id in enumerate(self.problem.courses)}
+        prof_index = {prof_id: i for i, prof_id in enumerate(self.problem.professors)}
         
+        # Flatten the allocations to one (course, professor, share) row per assignment
+        row_course, row_prof, shares, team_sizes = [], [], [], []
         for allocation in allocations:
-            course = self.problem.courses[allocation.course_id]
-            
+            course_idx = course_index[allocation.course_id]
+            num_profs = len(allocation.professor_ids)
             for prof_id in allocation.professor_ids:
-                professor = self.problem.professors[prof_id]
-                share = allocation.shares[prof_id]
-                workload = allocation.get_professor_workload(prof_id, course)
-                
-                report_data.append({
-                    'Algorithm': algo_name.replace('_', ' ').title(),
-                    'Course_ID': course.id,
-                    'Course_Name': course.name,
-                    'Course_Code': course.code,
-                    'Department': course.department,
-                    'Difficulty_Level': course.difficulty_level,
-                    'Num_Students': course.num_students,
-                    'Professor_ID': prof_id,
-                    'Professor_Name': professor.name,
-                    'Professor_Title': professor.title,
-                    'Professor_Department': professor.department,
-                    'Share_Percentage': share,
-                    'Workload_Hours': workload,
-                    'Lecture_Hours': course.lecture_hours * (share / 100.0),
-                    'Lab_Hours': course.lab_hours * (share / 100.0),
-                    'Assessment_Hours': (course.assessment_hours / 15) * (share / 100.0),
-                    'Prep_Hours': (course.lecture_hours * course.prep_factor) * (share / 100.0),
-                    'Team_Teaching': len(allocation.professor_ids) > 1,
-                    'Num_Professors': len(allocation.professor_ids)
-                })
-        
-        return pd.DataFrame(report_data)
+                row_course.append(course_idx)
+                row_prof.append(prof_index[prof_id])
+                shares.append(allocation.shares[prof_id])
+                team_sizes.append(num_profs)
+        
+        row_course = np.asarray(row_course, dtype=np.intp)
+        row_prof = np.asarray(row_prof, dtype=np.intp)
+        shares = np.asarray(shares, dtype=float)
+        team_sizes = np.asarray(team_sizes, dtype=int)
+        share_fraction = shares / 100.0
+        
+        def course_column(attr):
+            return np.take(np.array([getattr(course, attr) for course in courses]), row_course)
+        
+        def prof_column(attr):
+            return np.take(np.array([getattr(prof, attr) for prof in professors]), row_prof)
+        
+        arrays = self.problem.to_arrays()
+        
+        report_df = pd.DataFrame({
+            'Algorithm': algo_name.replace('_', ' ').title(),
+            'Course_ID': course_column('id'),
+            'Course_Name': course_column('name'),
+            'Course_Code': course_column('code'),
+            'Department': course_column('department'),
+            'Difficulty_Level': course_column('difficulty_level'),
+            'Num_Students': course_column('num_students'),
+            'Professor_ID': prof_column('id'),
+            'Professor_Name': prof_column('name'),
+            'Professor_Title': prof_column('title'),
+            'Professor_Department': prof_column('department'),
+            'Share_Percentage': shares,
+            'Workload_Hours': arrays.course_workload[row_course] * share_fraction,
+            'Lecture_Hours': arrays.course_lecture_hours[row_course] * share_fraction,
+            'Lab_Hours': arrays.course_lab_hours[row_course] * share_fraction,
+            'Assessment_Hours': arrays.course_assessment_weekly[row_course] * share_fraction,
+            'Prep_Hours': arrays.course_prep_hours[row_course] * share_fraction,
+            'Team_Teaching': team_sizes > 1,
+            'Num_Professors': team_sizes
+        })
+        return _compact_dtypes(report_df, ['Algorithm', 'Department', 'Professor_Title', 'Professor_Department'])
     
     def _create_professor_summary(self, allocations: List, algo_name: str) -> pd.DataFrame:
         """Create professor workload summary"""
         summary_data = []
         
+        # Index course assignments by professor in one pass over the allocations
+        # as parallel (course codes, shares) lists
+        prof_to_allocs = defaultdict(lambda: ([], []))
+        for allocation in allocations:
+            course_code = self.problem.courses[allocation.course_id].code
+            for prof_id in allocation.professor_ids:
+                codes, shares = prof_to_allocs[prof_id]
+                codes.append(course_code)
+                shares.append(allocation.shares[prof_id])
+        
+        loads = self._load_cache[algo_name]
+        
         for prof_id in self.problem.professors:
             professor = self.problem.professors[prof_id]
-            load_info = self.problem.calculate_professor_load(prof_id, allocations)
+            load_info = loads[prof_id]
             
             # Get course assignments
-            assigned_courses = []
-            for allocation in allocations:
-                if prof_id in allocation.professor_ids:
-                    course = self.problem.courses[allocation.course_id]
-                    share = allocation.shares[prof_id]
-                    assigned_courses.append(f"{course.code} ({share:.1f}%)")
+            codes, shares = prof_to_allocs.get(prof_id, ([], []))
             
             summary_data.append({
                 'Algorithm': algo_name.replace('_', ' ').title(),
@@ -253,60 +404,74 @@ class WorkloadAllocationRunner:
                 'Max_Teaching_Allowed': professor.max_teaching_load,
                 'Meets_Minimum': load_info['teaching_hours'] >= professor.min_teaching_load,
                 'Within_Limits': load_info['teaching_hours'] <= professor.max_teaching_load,
-                'Assigned_Courses': '; '.join(assigned_courses),
-                'Num_Courses': len(assigned_courses)
+                'Assigned_Courses': '; '.join(map(_format_assignment, codes, shares)),
+                'Num_Courses': len(codes)
             })
         
-        return pd.DataFrame(summary_data)
+        return _compact_dtypes(pd.DataFrame(summary_data), ['Algorithm', 'Title', 'Department'])
     
     def generate_comparison_report(self):
         """Generate comprehensive algorithm comparison report"""
-        print("\n📊 Generating Algorithm Comparison Report...")
+        if self._comparison_df is not None:
+            return self._comparison_df
         
-        comparison_data = []
+        print("\n📊 Generating Algorithm Comparison Report...")
         
-        for algo_name, (solution, fitness, execution_time) in self.results.items():
+        # One preallocated array per column, filled by algorithm index
+        n = len(self.results)
+        fitness_scores, execution_times = np.empty(n), np.empty(n)
+        fairness_scores, expertise_scores, balance_scores = np.empty(n), np.empty(n), np.empty(n)
+        hard_satisfied, limits_satisfied = np.empty(n, dtype=bool), np.empty(n, dtype=bool)
+        expertise_satisfied, fairness_satisfied = np.empty(n, dtype=bool), np.empty(n, dtype=bool)
+        mean_workloads, std_workloads = np.empty(n), np.empty(n)
+        min_workloads, max_workloads, cv_workloads = np.empty(n), np.empty(n), np.empty(n)
+        
+        for i, (algo_name, (solution, fitness, execution_time)) in enumerate(self.results.items()):
+            fitness_scores[i] = fitness
+            execution_times[i] = execution_time
+            
             # Calculate detailed metrics
-            fairness_score = self.problem.calculate_fairness_score(solution)
-            expertise_score = self.problem.calculate_expertise_score(solution)
-            balance_score = self.problem.calculate_balance_score(solution)
+            scores = self._scores[algo_name]
+            fairness_scores[i] = scores['fairness']
+            expertise_scores[i] = scores['expertise']
+            balance_scores[i] = scores['balance']
             
             # Check constraints
-            hard_constraints_satisfied = self.problem.check_hard_constraints(solution)
+            hard_satisfied[i] = self.problem.check_hard_constraints(solution)
             soft_constraints = self.problem.check_soft_constraints(solution)
+            limits_satisfied[i] = soft_constraints['workload_limits']
+            expertise_satisfied[i] = soft_constraints['expertise_matching']
+            fairness_satisfied[i] = soft_constraints['fairness']
             
             # Calculate workload statistics
-            workloads = []
-            for prof_id in self.problem.professors:
-                load = self.problem.calculate_professor_load(prof_id, solution)
-                workloads.append(load['teaching_hours'])
+            loads = self._load_cache[algo_name]
+            workloads = np.fromiter((load['teaching_hours'] for load in loads.values()),
+                                    dtype=np.float64, count=len(loads))
             
-            mean_workload = np.mean(workloads)
-            std_workload = np.std(workloads)
-            min_workload = np.min(workloads)
-            max_workload = np.max(workloads)
-            cv_workload = std_workload / mean_workload if mean_workload > 0 else 0
-            
-            comparison_data.append({
-                'Algorithm': algo_name,
-                'Fitness_Score': fitness,
-                'Execution_Time_Seconds': execution_time,
-                'Fairness_Score': fairness_score,
-                'Expertise_Score': expertise_score,
-                'Balance_Score': balance_score,
-                'Hard_Constraints_Satisfied': hard_constraints_satisfied,
-                'Workload_Limits_Satisfied': soft_constraints['workload_limits'],
-                'Expertise_Matching_Satisfied': soft_constraints['expertise_matching'],
-                'Fairness_Satisfied': soft_constraints['fairness'],
-                'Mean_Workload': mean_workload,
-                'Std_Workload': std_workload,
-                'Min_Workload': min_workload,
-                'Max_Workload': max_workload,
-                'Coefficient_of_Variation': cv_workload
-            })
+            mean_workloads[i] = workloads.mean()
+            std_workloads[i] = workloads.std()
+            min_workloads[i] = workloads.min()
+            max_workloads[i] = workloads.max()
+            cv_workloads[i] = std_workloads[i] / mean_workloads[i] if mean_workloads[i] > 0 else 0
         
         # Create comparison DataFrame
-        comparison_df = pd.DataFrame(comparison_data)
+        comparison_df = pd.DataFrame({
+            'Algorithm': list(self.results),
+            'Fitness_Score': fitness_scores,
+            'Execution_Time_Seconds': execution_times,
+            'Fairness_Score': fairness_scores,
+            'Expertise_Score': expertise_scores,
+            'Balance_Score': balance_scores,
+            'Hard_Constraints_Satisfied': hard_satisfied,
+            'Workload_Limits_Satisfied': limits_satisfied,
+            'Expertise_Matching_Satisfied': expertise_satisfied,
+            'Fairness_Satisfied': fairness_satisfied,
+            'Mean_Workload': mean_workloads,
+            'Std_Workload': std_workloads,
+            'Min_Workload': min_workloads,
+            'Max_Workload': max_workloads,
+            'Coefficient_of_Variation': cv_workloads
+        })
         
         # Save to CSV
         output_file = "results/algorithm_comparison.csv"
@@ -329,6 +494,7 @@ class WorkloadAllocationRunner:
             print(f"  ⚖️  Fairness: {'Good' if row['Fairness_Satisfied'] else 'Poor'}")
             print(f"  📊 Workload: {row['Mean_Workload']:.1f}±{row['Std_Workload']:.1f} hours")
         
+        self._comparison_df = comparison_df
         return comparison_df
     
     def create_visualizations(self):
@@ -358,7 +524,8 @@ class WorkloadAllocationRunner:
     
     def _create_performance_comparison(self):
         """Create algorithm performance comparison chart"""
-        fig, axes = plt.subplots(2, 2, figsize=(15, 12))
+        fig = Figure(figsize=(15, 12), constrained_layout=True)
+        axes = fig.subplots(2, 2)
         fig.suptitle('Algorithm Performance Comparison', fontsize=16, fontweight='bold')
         
         # Fitness scores
@@ -378,40 +545,32 @@ class WorkloadAllocationRunner:
         axes[0, 1].tick_params(axis='x', rotation=45)
         
         # Fairness scores
-        fairness_scores = [self.problem.calculate_fairness_score(result[0]) 
-                          for result in self.results.values()]
+        fairness_scores = [self._scores[algo]['fairness'] for algo in self.results]
         axes[1, 0].bar(algo_names, fairness_scores, color=['#FF6B6B', '#4ECDC4', '#45B7D1'])
         axes[1, 0].set_title('Fairness Scores')
         axes[1, 0].set_ylabel('Fairness Score')
         axes[1, 0].tick_params(axis='x', rotation=45)
         
         # Expertise scores
-        expertise_scores = [self.problem.calculate_expertise_score(result[0]) 
-                           for result in self.results.values()]
+        expertise_scores = [self._scores[algo]['expertise'] for algo in self.results]
         axes[1, 1].bar(algo_names, expertise_scores, color=['#FF6B6B', '#4ECDC4', '#45B7D1'])
         axes[1, 1].set_title('Expertise Matching Scores')
         axes[1, 1].set_ylabel('Expertise Score')
         axes[1, 1].tick_params(axis='x', rotation=45)
         
-        plt.tight_layout()
-        plt.savefig('results/algorithm_performance_comparison.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig('results/algorithm_performance_comparison.png', dpi=300)
     
     def _create_workload_distribution_comparison(self):
         """Create workload distribution comparison"""
-        fig, axes = plt.subplots(1, 3, figsize=(18, 6))
+        fig = Figure(figsize=(18, 6), constrained_layout=True)
+        axes = fig.subplots(1, 3)
         fig.suptitle('Workload Distribution Comparison Across Algorithms', fontsize=16, fontweight='bold')
         
         colors = ['#FF6B6B', '#4ECDC4', '#45B7D1']
         
         for i, (algo_name, result) in enumerate(self.results.items()):
             solution, fitness, execution_time = result
-            allocations = solution
-            workloads = []
-            
-            for prof_id in self.problem.professors:
-                load_info = self.problem.calculate_professor_load(prof_id, allocations)
-                workloads.append(load_info['teaching_hours'])
+            workloads = [load_info['teaching_hours'] for load_info in self._load_cache[algo_name].values()]
             
             axes[i].hist(workloads, bins=20, alpha=0.7, color=colors[i], edgecolor='black')
             axes[i].set_title(f'{algo_name.replace("_", " ").title()}')
@@ -421,74 +580,68 @@ class WorkloadAllocationRunner:
                            label=f'Mean: {np.mean(workloads):.1f}')
             axes[i].legend()
         
-        plt.tight_layout()
-        plt.savefig('results/workload_distribution_comparison.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig('results/workload_distribution_comparison.png', dpi=300)
     
     def _create_fitness_comparison(self):
         """Create fitness score comparison"""
-        plt.figure(figsize=(10, 6))
+        fig = Figure(figsize=(10, 6), constrained_layout=True)
+        ax = fig.subplots()
         
         algo_names = [name.replace('_', ' ').title() for name in self.results.keys()]
         fitness_scores = [result[1] for result in self.results.values()]
         
-        bars = plt.bar(algo_names, fitness_scores, color=['#FF6B6B', '#4ECDC4', '#45B7D1'])
-        plt.title('Algorithm Fitness Score Comparison', fontsize=14, fontweight='bold')
-        plt.ylabel('Fitness Score')
-        plt.xlabel('Algorithm')
+        bars = ax.bar(algo_names, fitness_scores, color=['#FF6B6B', '#4ECDC4', '#45B7D1'])
+        ax.set_title('Algorithm Fitness Score Comparison', fontsize=14, fontweight='bold')
+        ax.set_ylabel('Fitness Score')
+        ax.set_xlabel('Algorithm')
         
         # Add value labels on bars
         for bar, score in zip(bars, fitness_scores):
-            plt.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.01,
+            ax.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.01,
                     f'{score:.4f}', ha='center', va='bottom', fontweight='bold')
         
-        plt.tight_layout()
-        plt.savefig('results/fitness_comparison.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig('results/fitness_comparison.png', dpi=300)
     
     def _create_execution_time_comparison(self):
         """Create execution time comparison"""
-        plt.figure(figsize=(10, 6))
+        fig = Figure(figsize=(10, 6), constrained_layout=True)
+        ax = fig.subplots()
         
         algo_names = [name.replace('_', ' ').title() for name in self.results.keys()]
         execution_times = [result[2] for result in self.results.values()]
         
-        bars = plt.bar(algo_names, execution_times, color=['#FF6B6B', '#4ECDC4', '#45B7D1'])
-        plt.title('Algorithm Execution Time Comparison', fontsize=14, fontweight='bold')
-        plt.ylabel('Execution Time (seconds)')
-        plt.xlabel('Algorithm')
+        bars = ax.bar(algo_names, execution_times, color=['#FF6B6B', '#4ECDC4', '#45B7D1'])
+        ax.set_title('Algorithm Execution Time Comparison', fontsize=14, fontweight='bold')
+        ax.set_ylabel('Execution Time (seconds)')
+        ax.set_xlabel('Algorithm')
         
         # Add value labels on bars
         for bar, time_val in zip(bars, execution_times):
-            plt.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.1,
+            ax.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.1,
                     f'{time_val:.2f}s', ha='center', va='bottom', fontweight='bold')
         
-        plt.tight_layout()
-        plt.savefig('results/execution_time_comparison.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig('results/execution_time_comparison.png', dpi=300)
     
     def _create_fairness_analysis(self):
         """Create fairness analysis visualization"""
-        fig, axes = plt.subplots(1, 3, figsize=(18, 6))
+        fig = Figure(figsize=(18, 6), constrained_layout=True)
+        axes = fig.subplots(1, 3)
         fig.suptitle('Fairness Analysis Across Algorithms', fontsize=16, fontweight='bold')
         
         colors = ['#FF6B6B', '#4ECDC4', '#45B7D1']
         
         for i, (algo_name, result) in enumerate(self.results.items()):
             solution, fitness, execution_time = result
-            allocations = solution
             
             # Calculate workload percentages
-            workload_percentages = []
-            for prof_id in self.problem.professors:
-                load_info = self.problem.calculate_professor_load(prof_id, allocations)
-                workload_percentages.append(load_info['load_percentage'])
+            workload_percentages = [load_info['load_percentage']
+                                    for load_info in self._load_cache[algo_name].values()]
             
             # Sort for better visualization
             workload_percentages.sort()
             
             axes[i].plot(range(len(workload_percentages)), workload_percentages, 
-                        marker='o', color=colors[i], linewidth=2, markersize=4)
+                        marker='o', color=colors[i], linewidth=2, markersize=4, rasterized=True)
             axes[i].set_title(f'{algo_name.replace("_", " ").title()}')
             axes[i].set_xlabel('Professor Rank (by workload)')
             axes[i].set_ylabel('Workload Percentage')
@@ -500,9 +653,7 @@ class WorkloadAllocationRunner:
                            label=f'Mean: {mean_percentage:.1f}%')
             axes[i].legend()
         
-        plt.tight_layout()
-        plt.savefig('results/fairness_analysis.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig('results/fairness_analysis.png', dpi=300)
     
     def print_summary(self):
         """Print comprehensive summary of results"""
@@ -517,23 +668,27 @@ class WorkloadAllocationRunner:
         print("-" * 50)
         
         # Sort by fitness score
-        sorted_results = sorted(self.results.items(), 
-                              key=lambda x: x[1][1], reverse=True)
+        ranked = [(name, fitness, execution_time)
+                  for name, (_, fitness, execution_time) in self.results.items()]
+        ranked.sort(key=itemgetter(1), reverse=True)
         
-        for i, (algo_name, result) in enumerate(sorted_results):
+        for i, (algo_name, fitness, execution_time) in enumerate(ranked):
             rank = "🥇" if i == 0 else "🥈" if i == 1 else "🥉"
             print(f"{rank} {algo_name.replace('_', ' ').title()}")
-            print(f"   Fitness Score: {result[1]:.4f}")
-            print(f"   Execution Time: {result[2]:.2f} seconds")
-            print(f"   Fairness Score: {self.problem.calculate_fairness_score(result[0]):.4f}")
+            print(f"   Fitness Score: {fitness:.4f}")
+            print(f"   Execution Time: {execution_time:.2f} seconds")
+            print(f"   Fairness Score: {self._scores[algo_name]['fairness']:.4f}")
             print()
         
+        fastest = min(self.execution_times.items(), key=itemgetter(1))[0]
+        most_fair = max(self._scores.items(), key=lambda kv: kv[1]['fairness'])[0]
+        
         print("\n📈 KEY METRICS:")
         print("-" * 50)
         print(f"Dataset Size: {len(self.professors)} professors, {len(self.courses)} courses")
-        print(f"Best Fitness: {sorted_results[0][1][1]:.4f}")
-        print(f"Fastest Algorithm: {min(self.execution_times.items(), key=lambda x: x[1])[0].replace('_', ' ').title()}")
-        print(f"Most Fair: {max(self.results.items(), key=lambda x: self.problem.calculate_fairness_score(x[1][0]))[0].replace('_', ' ').title()}")
+        print(f"Best Fitness: {ranked[0][1]:.4f}")
+        print(f"Fastest Algorithm: {fastest.replace('_', ' ').title()}")
+        print(f"Most Fair: {most_fair.replace('_', ' ').title()}")
         
         print("\n💾 OUTPUT FILES:")
         print("-" * 50)
@@ -545,10 +700,10 @@ class WorkloadAllocationRunner:
         
         print("\n🎯 RECOMMENDATIONS:")
         print("-" * 50)
-        best_algo = sorted_results[0][0]
+        best_algo = ranked[0][0]
         print(f"• Best Overall: {best_algo.replace('_', ' ').title()}")
-        print(f"• For Speed: {min(self.execution_times.items(), key=lambda x: x[1])[0].replace('_', ' ').title()}")
-        print(f"• For Fairness: {max(self.results.items(), key=lambda x: self.problem.calculate_fairness_score(x[1][0]))[0].replace('_', ' ').title()}")
+        print(f"• For Speed: {fastest.replace('_', ' ').title()}")
+        print(f"• For Fairness: {most_fair.replace('_', ' ').title()}")
         
         print("\n" + "=" * 80)
 
@@ -4,38 +4,257 @@ Simulated Annealing Visualization
 Shows the cooling process, acceptance probability, solution exploration, and convergence
 """
 
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 import numpy as np
+from pathlib import Path
+import matplotlib
+matplotlib.use('Agg')  # Figures are only saved to files, never shown
 import matplotlib.pyplot as plt
-import seaborn as sns
+import plot_style
+from plot_style import HUSL_PALETTE
 from matplotlib.patches import Rectangle, Circle, Arrow, FancyBboxPatch
+from numba_compat import njit
 import warnings
 warnings.filterwarnings('ignore')
 
 # Set style for publication-quality plots
 plt.style.use('seaborn-v0_8-whitegrid')
-sns.set_palette("husl")
+plt.rcParams['axes.prop_cycle'] = plt.cycler(color=HUSL_PALETTE)
 plt.rcParams['figure.figsize'] = (14, 10)
 plt.rcParams['font.size'] = 12
 plt.rcParams['axes.titlesize'] = 16
 plt.rcParams['axes.labelsize'] = 14
 
+@njit(cache=True)
+def _sa_accept_walk(initial_fitness, deltas, temps, rands):
+    """Run the SA accept/reject walk over pre-drawn neighbor offsets
+    
+    Returns the neighbor fitness proposed at each step, the current fitness
+    after each step (starting with the initial value) and the accept mask.
+    """
+    n = deltas.shape[0]
+    neighbor_fitness = np.empty(n)
+    fitness_history = np.empty(n + 1)
+    accepted = np.empty(n, dtype=np.bool_)
+    
+    current = initial_fitness
+    fitness_history[0] = current
+    for i in range(n):
+        neighbor = current + deltas[i]
+        delta_f = neighbor - current
+        # Always accept improvements, worse moves with Boltzmann probability
+        accepted[i] = delta_f > 0 or rands[i] < np.exp(delta_f / temps[i])
+        if accepted[i]:
+            current = neighbor
+        neighbor_fitness[i] = neighbor
+        fitness_history[i + 1] = current
+    return neighbor_fitness, fitness_history, accepted
+
+# Markdown guide written next to the figures by create_visualization_documentation
+_SA_VIZ_DOC = """
+# ❄️ **SIMULATED ANNEALING VISUALIZATION DOCUMENTATION**
+## Faculty Workload Allocation System - Algorithm Operation Visualization
+
+---
+
+## 📊 **OVERVIEW**
+
+This document explains the comprehensive visualizations created to demonstrate how the Simulated Annealing (SA) algorithm operates in the Faculty Workload Allocation System. These visualizations provide clear insights into the algorithm's cooling process, acceptance probability, solution exploration, and convergence behavior.
+
+---
+
+## ❄️ **COOLING PROCESS AND TEMPERATURE DYNAMICS**
+
+### **File**: `simulated_annealing_cooling_process.png`
+**Purpose**: Visualize the SA cooling process and temperature dynamics
+
+#### **Panel 1: Temperature Cooling Schedules**
+- **What it shows**: Different temperature cooling strategies (exponential, linear, logarithmic, geometric)
+- **Key insight**: Cooling schedule significantly affects algorithm performance
+- **Algorithm relevance**: Core mechanism controlling exploration vs exploitation
+- **Paper usage**: Methodology section to explain cooling strategy
+
+#### **Panel 2: Acceptance Probability vs Fitness Difference**
+- **What it shows**: How acceptance probability changes with temperature and fitness difference
+- **Key insight**: Higher temperatures allow more exploration of worse solutions
+- **Algorithm relevance**: Boltzmann acceptance criterion implementation
+- **Paper usage**: Methodology section to explain acceptance mechanism
+
+#### **Panel 3: Solution Exploration and Acceptance**
+- **What it shows**: Visual representation of solution exploration and move acceptance
+- **Key insight**: SA balances exploration and exploitation through temperature control
+- **Algorithm relevance**: Core search mechanism demonstration
+- **Paper usage**: Results section to show algorithm behavior
+
+#### **Panel 4: Acceptance Rate vs Temperature**
+- **What it shows**: Relationship between temperature and solution acceptance rate
+- **Key insight**: Acceptance rate decreases as temperature cools
+- **Algorithm relevance**: Temperature's role in controlling search behavior
+- **Paper usage**: Results section to demonstrate temperature effects
+
+---
+
+## ⚙️ **ALGORITHM OPERATION AND MECHANISMS**
+
+### **File**: `simulated_annealing_operation_details.png`
+**Purpose**: Detailed explanation of algorithm mechanisms and operation
+
+#### **Panel 1: SA Algorithm Flowchart**
+- **What it shows**: Step-by-step flowchart of Simulated Annealing algorithm
+- **Key insight**: Complete algorithm logic and decision points
+- **Algorithm relevance**: Core algorithm structure and flow
+- **Paper usage**: Methodology section to explain algorithm design
+
+#### **Panel 2: Neighbor Generation Strategies**
+- **What it shows**: Different approaches to generating neighboring solutions
+- **Key insight**: Neighbor generation affects search space exploration
+- **Algorithm relevance**: Critical parameter for search effectiveness
+- **Paper usage**: Methodology section to justify design choices
+
+#### **Panel 3: Temperature Schedule Effects**
+- **What it shows**: How different cooling schedules affect performance
+- **Key insight**: Cooling rate balances exploration and convergence speed
+- **Algorithm relevance**: Temperature scheduling is crucial for performance
+- **Paper usage**: Methodology section to document parameter choices
+
+#### **Panel 4: Algorithm Parameters and Impact**
+- **What it shows**: Key parameters and their influence on performance
+- **Key insight**: Initial temperature and cooling rate are most critical
+- **Algorithm relevance**: Parameter tuning importance for effectiveness
+- **Paper usage**: Methodology section to justify parameter selection
+
+---
+
+## 📈 **CONVERGENCE ANALYSIS**
+
+### **File**: `simulated_annealing_convergence_analysis.png`
+**Purpose**: Analysis of convergence behavior and performance characteristics
+
+#### **Panel 1: Different Convergence Patterns**
+- **What it shows**: Various convergence scenarios and patterns
+- **Key insight**: SA can exhibit different convergence behaviors based on parameters
+- **Algorithm relevance**: Understanding convergence helps parameter tuning
+- **Paper usage**: Results section to analyze performance characteristics
+
+#### **Panel 2: Temperature vs Acceptance Rate Evolution**
+- **What it shows**: How acceptance rate changes as temperature decreases
+- **Key insight**: Acceptance rate evolution reflects search behavior changes
+- **Algorithm relevance**: Temperature controls exploration-exploitation balance
+- **Paper usage**: Results section to demonstrate algorithm dynamics
+
+#### **Panel 3: Performance vs Problem Size**
+- **What it shows**: How performance scales with problem complexity
+- **Key insight**: SA scales reasonably well with problem size
+- **Algorithm relevance**: Practical applicability to larger problems
+- **Paper usage**: Discussion section to analyze scalability
+
+#### **Panel 4: SA vs Other Algorithms**
+- **What it shows**: SA performance relative to other metaheuristics
+- **Key insight**: SA provides good balance of quality and speed
+- **Algorithm relevance**: Context for algorithm selection
+- **Paper usage**: Discussion section to compare approaches
+
+---
+
+## 🎯 **ACADEMIC PAPER INTEGRATION**
+
+### **Methodology Section**
+- **Cooling Process**: Explain temperature scheduling and cooling strategy
+- **Acceptance Mechanism**: Justify Boltzmann acceptance criterion
+- **Parameter Selection**: Document temperature and cooling parameters
+
+### **Results Section**
+- **Solution Exploration**: Show exploration and acceptance patterns
+- **Convergence Analysis**: Demonstrate convergence behavior and speed
+- **Temperature Effects**: Analyze temperature's role in search
+
+### **Discussion Section**
+- **Cooling Strategy**: Analyze exploration vs exploitation balance
+- **Parameter Sensitivity**: Discuss parameter tuning importance
+- **Algorithm Comparison**: Contextualize SA performance
+
+### **Conclusions Section**
+- **Algorithm Strengths**: Summarize SA advantages
+- **Parameter Insights**: Document key parameter findings
+- **Future Work**: Suggest cooling strategy improvements
+
+---
+
+## 🔬 **TECHNICAL DETAILS**
+
+### **Visualization Features**
+- **High Resolution**: 300 DPI for publication quality
+- **Color Coding**: Consistent color scheme for clarity
+- **Annotations**: Clear labels and explanations
+- **Multi-Panel**: Comprehensive coverage in single figures
+
+### **Algorithm Parameters**
+- **Initial Temperature**: 100.0 (starting exploration level)
+- **Cooling Rate**: 0.95 (exponential cooling factor)
+- **Neighbor Count**: 1 (single neighbor per iteration)
+- **Termination**: Maximum iterations or temperature threshold
+
+---
+
+## 🎉 **CONCLUSION**
+
+These Simulated Annealing visualizations provide comprehensive insights into algorithm operation, making the complex cooling process accessible and understandable. They support the academic paper by:
+
+1. **Explaining Cooling Process**: Clear visualization of temperature dynamics
+2. **Demonstrating Acceptance Mechanism**: Detailed explanation of Boltzmann criterion
+3. **Analyzing Convergence**: Understanding of convergence patterns and speed
+4. **Supporting Methodology**: Justification of algorithm design choices
+
+**Ready for comprehensive academic paper integration! 🎓❄️**
+"""
+
 class SimulatedAnnealingVisualization:
     def __init__(self):
         self.output_dir = "results/simulated_annealing_visualization"
+        self._paths = {
+            'cooling': f'{self.output_dir}/simulated_annealing_cooling_process.png',
+            'operation': f'{self.output_dir}/simulated_annealing_operation_details.png',
+            'convergence': f'{self.output_dir}/simulated_annealing_convergence_analysis.png',
+            'documentation': f'{self.output_dir}/simulated_annealing_visualization_documentation.md',
+            'render_key': f'{self.output_dir}/.sa_viz_cache',
+        }
         
     def create_output_directory(self):
         """Create output directory for visualizations"""
-        import os
         os.makedirs(self.output_dir, exist_ok=True)
         
+    def _render_key(self):
+        """Hash of everything that determines the figure pixels
+        
+        Covers this module (panel code, seed and parameters), the shared
+        palette, the active rcParams (so matplotlibrc and style sheet changes
+        count), and the NumPy and matplotlib versions. Replacing a font file is
+        not detected; run with --force after changing installed fonts.
+        """
+        digest = hashlib.sha1()
+        for source in (__file__, plot_style.__file__):
+            digest.update(Path(source).read_bytes())
+        digest.update(f'numpy {np.__version__}, matplotlib {matplotlib.__version__}'.encode())
+        digest.update(repr(sorted(matplotlib.rcParams.items())).encode())
+        return digest.hexdigest()
+        
+    def _figures_up_to_date(self, render_key):
+        """Whether the saved figures were rendered with the given key"""
+        key_file = Path(self._paths['render_key'])
+        return (key_file.exists() and key_file.read_text() == render_key
+                and all(Path(self._paths[name]).exists() for name in ('cooling', 'operation', 'convergence')))
+        
     def create_cooling_process_visualization(self):
         """Create visualization of the SA cooling process"""
         print("\n❄️ Creating Simulated Annealing Cooling Process...")
         
-        fig, axes = plt.subplots(2, 2, figsize=(20, 16))
+        fig, axes = plt.subplots(2, 2, figsize=(20, 16), constrained_layout=True)
         fig.suptitle('Simulated Annealing: Cooling Process and Temperature Dynamics', 
                      fontsize=22, fontweight='bold')
+        rng = np.random.default_rng(42)
         
         # 1. Temperature Cooling Curves
         iterations = np.arange(1000)
@@ -90,54 +309,30 @@ class SimulatedAnnealingVisualization:
         
         # 3. Solution Exploration and Acceptance
         # Simulate SA search process
-        np.random.seed(42)
-        
-        current_fitness = 5.0
-        current_temp = 100.0
-        fitness_history = [current_fitness]
-        temperature_history = [current_temp]
-        accepted_moves = []
-        rejected_moves = []
-        
-        for iteration in range(200):
-            # Generate neighbor
-            neighbor_fitness = current_fitness + np.random.normal(0, 2)
-            
-            # Calculate fitness difference
-            delta_f = neighbor_fitness - current_fitness
-            
-            # Acceptance probability
-            if delta_f > 0:
-                # Always accept improvements
-                current_fitness = neighbor_fitness
-                accepted_moves.append((iteration, neighbor_fitness))
-            else:
-                # Accept worse solutions with probability
-                acceptance_prob = np.exp(delta_f / current_temp)
-                if np.random.random() < acceptance_prob:
-                    current_fitness = neighbor_fitness
-                    accepted_moves.append((iteration, neighbor_fitness))
-                else:
-                    rejected_moves.append((iteration, neighbor_fitness))
-            
-            # Update temperature
-            current_temp = 100 * np.exp(-iteration / 50)
-            
-            fitness_history.append(current_fitness)
-            temperature_history.append(current_temp)
+        # Neighbor offsets and acceptance draws are sampled up front; the
+        # temperature is updated after each move, so step i sees T(i - 1)
+        num_iterations = 200
+        deltas = rng.normal(0, 2, num_iterations)
+        rands = rng.random(num_iterations)
+        schedule = 100 * np.exp(-np.arange(num_iterations) / 50)
+        step_temps = np.concatenate(([100.0], schedule[:-1]))
+        temperature_history = np.concatenate(([100.0], schedule))
+        
+        neighbor_fitness, fitness_history, accepted = _sa_accept_walk(5.0, deltas, step_temps, rands)
+        move_iterations = np.arange(num_iterations)
         
         # Plot fitness evolution
         iterations_plot = np.arange(len(fitness_history))
         axes[1,0].plot(iterations_plot, fitness_history, 'b-', linewidth=3, color='blue', label='Current Fitness')
         
         # Plot accepted and rejected moves
-        if accepted_moves:
-            accepted_iter, accepted_fitness = zip(*accepted_moves)
-            axes[1,0].scatter(accepted_iter, accepted_fitness, color='green', s=50, alpha=0.7, label='Accepted Moves')
+        if accepted.any():
+            axes[1,0].scatter(move_iterations[accepted], neighbor_fitness[accepted],
+                              color='green', s=50, alpha=0.7, label='Accepted Moves')
         
-        if rejected_moves:
-            rejected_iter, rejected_fitness = zip(*rejected_moves)
-            axes[1,0].scatter(rejected_iter, rejected_fitness, color='red', s=30, alpha=0.5, label='Rejected Moves')
+        if not accepted.all():
+            axes[1,0].scatter(move_iterations[~accepted], neighbor_fitness[~accepted],
+                              color='red', s=30, alpha=0.5, label='Rejected Moves')
         
         axes[1,0].set_title('Solution Exploration and Acceptance', fontweight='bold', fontsize=16)
         axes[1,0].set_xlabel('Iteration', fontsize=14)
@@ -148,22 +343,20 @@ class SimulatedAnnealingVisualization:
         # 4. Temperature vs Acceptance Rate
         # Show how acceptance rate changes with temperature
         temp_bins = np.linspace(0, 100, 11)
-        acceptance_rates = []
+        num_bins = len(temp_bins) - 1
+        # Temperature history has one more entry than there are moves
+        accepted_at = np.append(accepted, False)
         
-        for i in range(len(temp_bins) - 1):
-            temp_low, temp_high = temp_bins[i], temp_bins[i + 1]
-            
-            # Find moves in this temperature range
-            temp_indices = [j for j, temp in enumerate(temperature_history) if temp_low <= temp < temp_high]
-            
-            if temp_indices:
-                # Calculate acceptance rate for this temperature range
-                total_moves = len(temp_indices)
-                accepted_in_range = len([j for j in temp_indices if j in [move[0] for move in accepted_moves]])
-                acceptance_rate = accepted_in_range / total_moves if total_moves > 0 else 0
-                acceptance_rates.append(acceptance_rate)
-            else:
-                acceptance_rates.append(0)
+        # Bin every step by temperature (bins are closed on the left), then
+        # count moves and accepted moves per bin in one pass each
+        bin_idx = np.digitize(temperature_history, temp_bins) - 1
+        in_range = (bin_idx >= 0) & (bin_idx < num_bins)
+        total_moves = np.bincount(bin_idx[in_range], minlength=num_bins)
+        accepted_moves = np.bincount(bin_idx[in_range], weights=accepted_at[in_range], minlength=num_bins)
+        
+        # Calculate acceptance rate for each temperature range
+        acceptance_rates = np.divide(accepted_moves, total_moves,
+                                     out=np.zeros(num_bins), where=total_moves > 0)
         
         temp_centers = (temp_bins[:-1] + temp_bins[1:]) / 2
         
@@ -179,18 +372,18 @@ class SimulatedAnnealingVisualization:
         ax2.set_ylabel('Temperature', fontsize=14, color='black')
         ax2.legend(loc='upper right')
         
-        plt.tight_layout()
-        plt.savefig(f'{self.output_dir}/simulated_annealing_cooling_process.png', dpi=300, bbox_inches='tight')
-        plt.close()
-        print(f"   💾 Saved: {self.output_dir}/simulated_annealing_cooling_process.png")
+        fig.savefig(self._paths['cooling'], dpi=300)
+        plt.close(fig)
+        print(f"   💾 Saved: {self._paths['cooling']}")
         
     def create_algorithm_operation_visualization(self):
         """Create detailed visualization of SA algorithm operation"""
         print("\n⚙️ Creating Simulated Annealing Algorithm Operation Details...")
         
-        fig, axes = plt.subplots(2, 2, figsize=(20, 16))
+        fig, axes = plt.subplots(2, 2, figsize=(20, 16), constrained_layout=True)
         fig.suptitle('Simulated Annealing: Algorithm Operation and Mechanisms', 
                      fontsize=22, fontweight='bold')
+        rng = np.random.default_rng(42)
         
         # 1. SA Algorithm Flowchart
         flowchart_data = [
@@ -231,16 +424,19 @@ class SimulatedAnnealingVisualization:
             (0, 1), (1, 2), (2, 3), (3, 4), (4, 5), (4, 6), (5, 8), (6, 7), (7, 8), (8, 9), (9, 10), (10, 11), (10, 12), (12, 2)
         ]
         
-        for start_idx, end_idx in arrow_connections:
-            start_x, start_y = x_positions[start_idx], y_positions[start_idx]
-            end_x, end_y = x_positions[end_idx], y_positions[end_idx]
-            
-            # Adjust arrow positions for better visibility
-            if start_idx == 10 and end_idx == 12:  # Loop back
-                end_x, end_y = end_x - 0.1, end_y + 0.05
-            
-            axes[0,0].arrow(start_x, start_y, end_x - start_x, end_y - start_y,
-                           head_width=0.02, head_length=0.02, fc='black', ec='black', alpha=0.7)
+        starts, ends = np.array(arrow_connections).T
+        box_x = np.asarray(x_positions)
+        start_x, start_y = box_x[starts], y_positions[starts]
+        dx, dy = box_x[ends] - start_x, y_positions[ends] - start_y
+        
+        # Adjust arrow positions for better visibility
+        loop_back = (starts == 10) & (ends == 12)
+        dx[loop_back] -= 0.1
+        dy[loop_back] += 0.05
+        
+        # Draw every connection as one quiver collection
+        axes[0,0].quiver(start_x, start_y, dx, dy, angles='xy', scale_units='xy', scale=1, width=0.003,
+                         headwidth=3.5, headlength=3.5, headaxislength=3, color='black', alpha=0.7)
         
         axes[0,0].set_xlim(0, 1)
         axes[0,0].set_ylim(0, 1)
@@ -262,16 +458,21 @@ class SimulatedAnnealingVisualization:
         
         for i, (strategy, description) in enumerate(neighbor_strategies):
             if strategy == 'Random Walk':
-                angles = np.random.uniform(0, 2*np.pi, 15)
-                distances = np.random.uniform(0.5, 2.0, 15)
-                neighbors = current_solution + np.column_stack([distances * np.cos(angles), distances * np.sin(angles)])
+                angles = rng.uniform(0, 2*np.pi, 15)
+                distances = rng.uniform(0.5, 2.0, 15)
+                # Fill the (x, y) offsets in place, then scale and shift them
+                neighbors = np.empty((15, 2))
+                np.cos(angles, out=neighbors[:, 0])
+                np.sin(angles, out=neighbors[:, 1])
+                neighbors *= distances[:, None]
+                neighbors += current_solution
             elif strategy == 'Gaussian Perturbation':
-                neighbors = current_solution + np.random.normal(0, 1.0, (15, 2))
+                neighbors = rng.normal(current_solution, 1.0, (15, 2))
             elif strategy == 'Uniform Perturbation':
-                neighbors = current_solution + np.random.uniform(-1.5, 1.5, (15, 2))
+                neighbors = rng.uniform(current_solution - 1.5, current_solution + 1.5, (15, 2))
             else:  # Adaptive Step Size
                 step_size = 2.0 * np.exp(-i/10)  # Decreasing step size
-                neighbors = current_solution + np.random.uniform(-step_size, step_size, (15, 2))
+                neighbors = rng.uniform(current_solution - step_size, current_solution + step_size, (15, 2))
             
             # Plot neighbors
             axes[0,1].scatter(neighbors[:, 0], neighbors[:, 1], 
@@ -307,22 +508,12 @@ class SimulatedAnnealingVisualization:
         ]
         
         for schedule, label, color in schedules:
-            # Simulate fitness evolution
-            fitness_evolution = []
-            current_fitness = 5.0
-            
-            for i, temp in enumerate(schedule):
-                # Generate neighbor
-                neighbor_fitness = current_fitness + np.random.normal(0, 1.5)
-                
-                # Acceptance probability
-                delta_f = neighbor_fitness - current_fitness
-                if delta_f > 0 or np.random.random() < np.exp(delta_f / temp):
-                    current_fitness = neighbor_fitness
-                
-                fitness_evolution.append(current_fitness)
+            # Simulate fitness evolution from pre-drawn neighbor offsets
+            deltas = rng.normal(0, 1.5, len(schedule))
+            rands = rng.random(len(schedule))
+            _, fitness_history, _ = _sa_accept_walk(5.0, deltas, schedule, rands)
             
-            axes[1,0].plot(iterations, fitness_evolution, color=color, linewidth=3, 
+            axes[1,0].plot(iterations, fitness_history[1:], color=color, linewidth=3, 
                           label=label, alpha=0.8)
         
         axes[1,0].set_title('Temperature Schedule Effects on Performance', fontweight='bold', fontsize=16)
@@ -358,18 +549,18 @@ class SimulatedAnnealingVisualization:
         axes[1,1].text(0.5, -0.5, 'Medium', ha='center', fontweight='bold', fontsize=12)
         axes[1,1].text(0.8, -0.5, 'High', ha='center', fontweight='bold', fontsize=12)
         
-        plt.tight_layout()
-        plt.savefig(f'{self.output_dir}/simulated_annealing_operation_details.png', dpi=300, bbox_inches='tight')
-        plt.close()
-        print(f"   💾 Saved: {self.output_dir}/simulated_annealing_operation_details.png")
+        fig.savefig(self._paths['operation'], dpi=300)
+        plt.close(fig)
+        print(f"   💾 Saved: {self._paths['operation']}")
         
     def create_convergence_analysis(self):
         """Create convergence analysis and performance characteristics"""
         print("\n📈 Creating Simulated Annealing Convergence Analysis...")
         
-        fig, axes = plt.subplots(2, 2, figsize=(20, 16))
+        fig, axes = plt.subplots(2, 2, figsize=(20, 16), constrained_layout=True)
         fig.suptitle('Simulated Annealing: Convergence Analysis and Performance Characteristics', 
                      fontsize=22, fontweight='bold')
+        rng = np.random.default_rng(42)
         
         # 1. Convergence Patterns in SA
         # Show different convergence scenarios
@@ -403,30 +594,18 @@ class SimulatedAnnealingVisualization:
         iterations = np.arange(200)
         temperature = 100 * np.exp(-iterations / 50)
         
-        # Simulate acceptance rate evolution
-        acceptance_rates = []
-        current_fitness = 5.0
+        # Simulate acceptance rate evolution: 10 neighbors per temperature step,
+        # with every fitness difference and acceptance draw sampled up front.
+        # The rate only depends on the difference, not on the current fitness
+        num_neighbors = 10
+        delta_f = rng.normal(0, 1.5, (len(temperature), num_neighbors))
+        rands = rng.random((len(temperature), num_neighbors))
         
-        for i, temp in enumerate(temperature):
-            # Generate multiple neighbors to calculate acceptance rate
-            neighbors = []
-            for _ in range(10):
-                neighbor_fitness = current_fitness + np.random.normal(0, 1.5)
-                neighbors.append(neighbor_fitness)
-            
-            # Calculate acceptance rate for this temperature
-            accepted = 0
-            for neighbor_fitness in neighbors:
-                delta_f = neighbor_fitness - current_fitness
-                if delta_f > 0 or np.random.random() < np.exp(delta_f / temp):
-                    accepted += 1
-            
-            acceptance_rate = accepted / len(neighbors)
-            acceptance_rates.append(acceptance_rate)
-            
-            # Update solution occasionally
-            if np.random.random() < 0.1:
-                current_fitness = max(current_fitness, np.random.choice(neighbors))
+        # Metropolis test in log space: rand < exp(Δf / T) ⇔ log(rand) · T < Δf
+        # for T > 0. Improvements always pass since log(rand) ≤ 0, so no branch
+        # on the sign of Δf is needed
+        accepted = np.log(rands) * temperature[:, None] < delta_f
+        acceptance_rates = np.count_nonzero(accepted, axis=1) / num_neighbors
         
         # Plot acceptance rate evolution
         axes[0,1].plot(iterations, acceptance_rates, 'b-', linewidth=3, color='blue')
@@ -495,190 +674,49 @@ class SimulatedAnnealingVisualization:
         axes[1,1].legend()
         axes[1,1].grid(True, alpha=0.3)
         
-        plt.tight_layout()
-        plt.savefig(f'{self.output_dir}/simulated_annealing_convergence_analysis.png', dpi=300, bbox_inches='tight')
-        plt.close()
-        print(f"   💾 Saved: {self.output_dir}/simulated_annealing_convergence_analysis.png")
+        fig.savefig(self._paths['convergence'], dpi=300)
+        plt.close(fig)
+        print(f"   💾 Saved: {self._paths['convergence']}")
         
     def create_visualization_documentation(self):
         """Create documentation explaining the Simulated Annealing visualizations"""
         print("\n📋 Creating Simulated Annealing Visualization Documentation...")
         
-        documentation = """
-# ❄️ **SIMULATED ANNEALING VISUALIZATION DOCUMENTATION**
-## Faculty Workload Allocation System - Algorithm Operation Visualization
-
----
-
-## 📊 **OVERVIEW**
-
-This document explains the comprehensive visualizations created to demonstrate how the Simulated Annealing (SA) algorithm operates in the Faculty Workload Allocation System. These visualizations provide clear insights into the algorithm's cooling process, acceptance probability, solution exploration, and convergence behavior.
-
----
-
-## ❄️ **COOLING PROCESS AND TEMPERATURE DYNAMICS**
-
-### **File**: `simulated_annealing_cooling_process.png`
-**Purpose**: Visualize the SA cooling process and temperature dynamics
-
-#### **Panel 1: Temperature Cooling Schedules**
-- **What it shows**: Different temperature cooling strategies (exponential, linear, logarithmic, geometric)
-- **Key insight**: Cooling schedule significantly affects algorithm performance
-- **Algorithm relevance**: Core mechanism controlling exploration vs exploitation
-- **Paper usage**: Methodology section to explain cooling strategy
-
-#### **Panel 2: Acceptance Probability vs Fitness Difference**
-- **What it shows**: How acceptance probability changes with temperature and fitness difference
-- **Key insight**: Higher temperatures allow more exploration of worse solutions
-- **Algorithm relevance**: Boltzmann acceptance criterion implementation
-- **Paper usage**: Methodology section to explain acceptance mechanism
-
-#### **Panel 3: Solution Exploration and Acceptance**
-- **What it shows**: Visual representation of solution exploration and move acceptance
-- **Key insight**: SA balances exploration and exploitation through temperature control
-- **Algorithm relevance**: Core search mechanism demonstration
-- **Paper usage**: Results section to show algorithm behavior
-
-#### **Panel 4: Acceptance Rate vs Temperature**
-- **What it shows**: Relationship between temperature and solution acceptance rate
-- **Key insight**: Acceptance rate decreases as temperature cools
-- **Algorithm relevance**: Temperature's role in controlling search behavior
-- **Paper usage**: Results section to demonstrate temperature effects
-
----
-
-## ⚙️ **ALGORITHM OPERATION AND MECHANISMS**
-
-### **File**: `simulated_annealing_operation_details.png`
-**Purpose**: Detailed explanation of algorithm mechanisms and operation
-
-#### **Panel 1: SA Algorithm Flowchart**
-- **What it shows**: Step-by-step flowchart of Simulated Annealing algorithm
-- **Key insight**: Complete algorithm logic and decision points
-- **Algorithm relevance**: Core algorithm structure and flow
-- **Paper usage**: Methodology section to explain algorithm design
-
-#### **Panel 2: Neighbor Generation Strategies**
-- **What it shows**: Different approaches to generating neighboring solutions
-- **Key insight**: Neighbor generation affects search space exploration
-- **Algorithm relevance**: Critical parameter for search effectiveness
-- **Paper usage**: Methodology section to justify design choices
-
-#### **Panel 3: Temperature Schedule Effects**
-- **What it shows**: How different cooling schedules affect performance
-- **Key insight**: Cooling rate balances exploration and convergence speed
-- **Algorithm relevance**: Temperature scheduling is crucial for performance
-- **Paper usage**: Methodology section to document parameter choices
-
-#### **Panel 4: Algorithm Parameters and Impact**
-- **What it shows**: Key parameters and their influence on performance
-- **Key insight**: Initial temperature and cooling rate are most critical
-- **Algorithm relevance**: Parameter tuning importance for effectiveness
-- **Paper usage**: Methodology section to justify parameter selection
-
----
-
-## 📈 **CONVERGENCE ANALYSIS**
-
-### **File**: `simulated_annealing_convergence_analysis.png`
-**Purpose**: Analysis of convergence behavior and performance characteristics
-
-#### **Panel 1: Different Convergence Patterns**
-- **What it shows**: Various convergence scenarios and patterns
-- **Key insight**: SA can exhibit different convergence behaviors based on parameters
-- **Algorithm relevance**: Understanding convergence helps parameter tuning
-- **Paper usage**: Results section to analyze performance characteristics
-
-#### **Panel 2: Temperature vs Acceptance Rate Evolution**
-- **What it shows**: How acceptance rate changes as temperature decreases
-- **Key insight**: Acceptance rate evolution reflects search behavior changes
-- **Algorithm relevance**: Temperature controls exploration-exploitation balance
-- **Paper usage**: Results section to demonstrate algorithm dynamics
-
-#### **Panel 3: Performance vs Problem Size**
-- **What it shows**: How performance scales with problem complexity
-- **Key insight**: SA scales reasonably well with problem size
-- **Algorithm relevance**: Practical applicability to larger problems
-- **Paper usage**: Discussion section to analyze scalability
-
-#### **Panel 4: SA vs Other Algorithms**
-- **What it shows**: SA performance relative to other metaheuristics
-- **Key insight**: SA provides good balance of quality and speed
-- **Algorithm relevance**: Context for algorithm selection
-- **Paper usage**: Discussion section to compare approaches
-
----
-
-## 🎯 **ACADEMIC PAPER INTEGRATION**
-
-### **Methodology Section**
-- **Cooling Process**: Explain temperature scheduling and cooling strategy
-- **Acceptance Mechanism**: Justify Boltzmann acceptance criterion
-- **Parameter Selection**: Document temperature and cooling parameters
-
-### **Results Section**
-- **Solution Exploration**: Show exploration and acceptance patterns
-- **Convergence Analysis**: Demonstrate convergence behavior and speed
-- **Temperature Effects**: Analyze temperature's role in search
-
-### **Discussion Section**
-- **Cooling Strategy**: Analyze exploration vs exploitation balance
-- **Parameter Sensitivity**: Discuss parameter tuning importance
-- **Algorithm Comparison**: Contextualize SA performance
-
-### **Conclusions Section**
-- **Algorithm Strengths**: Summarize SA advantages
-- **Parameter Insights**: Document key parameter findings
-- **Future Work**: Suggest cooling strategy improvements
-
----
-
-## 🔬 **TECHNICAL DETAILS**
-
-### **Visualization Features**
-- **High Resolution**: 300 DPI for publication quality
-- **Color Coding**: Consistent color scheme for clarity
-- **Annotations**: Clear labels and explanations
-- **Multi-Panel**: Comprehensive coverage in single figures
-
-### **Algorithm Parameters**
-- **Initial Temperature**: 100.0 (starting exploration level)
-- **Cooling Rate**: 0.95 (exponential cooling factor)
-- **Neighbor Count**: 1 (single neighbor per iteration)
-- **Termination**: Maximum iterations or temperature threshold
-
----
-
-## 🎉 **CONCLUSION**
-
-These Simulated Annealing visualizations provide comprehensive insights into algorithm operation, making the complex cooling process accessible and understandable. They support the academic paper by:
-
-1. **Explaining Cooling Process**: Clear visualization of temperature dynamics
-2. **Demonstrating Acceptance Mechanism**: Detailed explanation of Boltzmann criterion
-3. **Analyzing Convergence**: Understanding of convergence patterns and speed
-4. **Supporting Methodology**: Justification of algorithm design choices
-
-**Ready for comprehensive academic paper integration! 🎓❄️**
-"""
+        # Save documentation, leaving an identical file (and its mtime) untouched
+        doc_path = Path(self._paths['documentation'])
+        if doc_path.exists() and doc_path.read_text() == _SA_VIZ_DOC:
+            print(f"   ✅ Up to date: {doc_path}")
+            return
+        doc_path.write_text(_SA_VIZ_DOC)
         
-        # Save documentation
-        with open(f'{self.output_dir}/simulated_annealing_visualization_documentation.md', 'w') as f:
-            f.write(documentation)
+        print(f"   💾 Saved: {doc_path}")
         
-        print(f"   💾 Saved: {self.output_dir}/simulated_annealing_visualization_documentation.md")
+    def run_complete_visualization(self, force=False):
+        """Run all Simulated Annealing visualizations
         
-    def run_complete_visualization(self):
-        """Run all Simulated Annealing visualizations"""
+        The figures are skipped when they were already rendered from the same
+        code and library versions, unless force is set.
+        """
         print("🚀 Starting Simulated Annealing Visualization Generation...")
         print("="*60)
         
         # Create output directory
         self.create_output_directory()
         
-        # Generate visualizations
-        self.create_cooling_process_visualization()
-        self.create_algorithm_operation_visualization()
-        self.create_convergence_analysis()
+        # Generate visualizations in parallel; each panel seeds its own generator
+        # and writes its own file, so the worker processes share no state.
+        # The figures share one render key, so they are rendered or skipped together
+        render_key = self._render_key()
+        if not force and self._figures_up_to_date(render_key):
+            print("\n✅ Figures are up to date, skipping rendering")
+        else:
+            with ProcessPoolExecutor(max_workers=min(3, os.cpu_count() or 1)) as executor:
+                futures = [executor.submit(self.create_cooling_process_visualization),
+                           executor.submit(self.create_algorithm_operation_visualization),
+                           executor.submit(self.create_convergence_analysis)]
+                for future in futures:
+                    future.result()
+            Path(self._paths['render_key']).write_text(render_key)
         
         # Create documentation
         self.create_visualization_documentation()
@@ -694,5 +732,11 @@ These Simulated Annealing visualizations provide comprehensive insights into alg
         print("\nReady for academic paper integration! 🎓")
 
 if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Generate the Simulated Annealing visualizations")
+    parser.add_argument('--force', action='store_true',
+                        help="re-render the figures even if the render cache says they are up to date")
+    args = parser.parse_args()
+    
     viz = SimulatedAnnealingVisualization()
-    viz.run_complete_visualization()
+    viz.run_complete_visualization(force=args.force)
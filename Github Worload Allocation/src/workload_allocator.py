@@ -9,14 +9,14 @@ import numpy as np
 import pandas as pd
 import random
 import time
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Callable, NamedTuple
 from dataclasses import dataclass
 from enum import Enum
-import copy
+from itertools import chain
 import matplotlib.pyplot as plt
-import seaborn as sns
 from pathlib import Path
 import math
+from numba_compat import njit
 
 # Set random seeds for reproducibility
 np.random.seed(42)
@@ -49,9 +49,23 @@ class Expertise(Enum):
     CHEMISTRY = "Chemistry"
     MEDICINE = "Medicine"
 
+# Bit position of each expertise area in the uint64 expertise masks
+_EXPERTISE_BIT = {exp: i for i, exp in enumerate(Expertise)}
+
+def expertise_mask(areas) -> int:
+    """Pack expertise areas into a bitmask, one bit per `Expertise` member"""
+    mask = 0
+    for exp in areas:
+        mask |= 1 << _EXPERTISE_BIT[exp]
+    return mask
+
 @dataclass
 class Professor:
     """Faculty member with workload constraints"""
+    __slots__ = ('id', 'name', 'title', 'department', 'expertise', 'primary_expertise',
+                 'years_experience', 'research_allocation', 'admin_load', 'max_teaching_load',
+                 'min_teaching_load', 'teaching_quality', 'availability')
+    
     id: str
     name: str
     title: str
@@ -80,6 +94,10 @@ class Professor:
 @dataclass
 class Course:
     """Course with teaching requirements"""
+    __slots__ = ('id', 'name', 'code', 'department', 'lecture_hours', 'lab_hours', 'num_students',
+                 'required_expertise', 'difficulty_level', 'min_professors', 'max_professors',
+                 'assessment_hours', 'prep_factor', 'can_be_shared', 'semester')
+    
     id: str
     name: str
     code: str
@@ -114,6 +132,10 @@ class CourseAllocation:
     professor_ids: List[str]
     shares: Dict[str, float]  # professor_id -> share percentage
     
+    def copy(self) -> 'CourseAllocation':
+        """Copy with its own professor list and shares, the only mutable fields"""
+        return CourseAllocation(self.course_id, list(self.professor_ids), dict(self.shares))
+    
     def get_professor_workload(self, prof_id: str, course: Course) -> float:
         """Get workload for specific professor"""
         if prof_id not in self.shares:
@@ -121,6 +143,59 @@ class CourseAllocation:
         share = self.shares[prof_id]
         return course.total_workload_hours() * (share / 100.0)
 
+class ProblemArrays(NamedTuple):
+    """Column arrays of the per-course and per-professor constants, in problem order"""
+    course_lecture_hours: np.ndarray
+    course_lab_hours: np.ndarray
+    course_assessment_hours: np.ndarray
+    course_prep_factor: np.ndarray
+    course_assessment_weekly: np.ndarray  # assessment_hours / 15
+    course_prep_hours: np.ndarray  # lecture_hours * prep_factor
+    course_workload: np.ndarray
+    prof_min_teaching_load: np.ndarray
+    prof_max_teaching_load: np.ndarray
+    prof_contracted_hours: np.ndarray
+    prof_research_allocation: np.ndarray
+    prof_admin_load: np.ndarray
+    prof_expertise_mask: np.ndarray  # uint64, bit per Expertise member
+    prof_primary_mask: np.ndarray  # uint64, the primary expertise bit
+    course_required_mask: np.ndarray  # uint64, bit per required Expertise
+
+@njit(cache=True)
+def _professor_teaching_hours(alloc_prof_idx, alloc_course_idx, alloc_shares, course_workload, num_professors):
+    """Sum each professor's share of course workload over flattened (professor, course, share) rows"""
+    hours = np.zeros(num_professors)
+    for i in range(alloc_prof_idx.shape[0]):
+        hours[alloc_prof_idx[i]] += course_workload[alloc_course_idx[i]] * (alloc_shares[i] / 100.0)
+    return hours
+
+@njit(cache=True)
+def _workload_penalty(teaching_hours, contracted_hours, min_teaching_load):
+    """Penalize teaching above contracted hours (2x) and below the minimum load (1.5x)"""
+    penalty = 0.0
+    for i in range(teaching_hours.shape[0]):
+        if teaching_hours[i] > contracted_hours[i]:
+            penalty += (teaching_hours[i] - contracted_hours[i]) * 2.0
+        if teaching_hours[i] < min_teaching_load[i]:
+            penalty += (min_teaching_load[i] - teaching_hours[i]) * 1.5
+    return penalty
+
+@njit(cache=True)
+def _sum_rows(rows):
+    """Column sums adding rows strictly in order, the same order _professor_teaching_hours accumulates in"""
+    totals = np.zeros(rows.shape[1])
+    for i in range(rows.shape[0]):
+        for j in range(rows.shape[1]):
+            totals[j] += rows[i, j]
+    return totals
+
+def warm_up_kernels():
+    """Compile the Numba kernels up front so the first solution evaluated pays no JIT cost"""
+    _professor_teaching_hours(np.zeros(1, dtype=np.int64), np.zeros(1, dtype=np.int64),
+                              np.zeros(1), np.zeros(1), 1)
+    _workload_penalty(np.zeros(1), np.zeros(1), np.zeros(1))
+    _sum_rows(np.zeros((1, 1)))
+
 class WorkloadAllocationProblem:
     """Main problem class for workload allocation"""
     
@@ -130,6 +205,68 @@ class WorkloadAllocationProblem:
         self.professor_list = professors
         self.course_list = courses
         
+        # Positional indices and columnar constants for the Numba kernels and reports
+        self._prof_index = {prof_id: i for i, prof_id in enumerate(self.professors)}
+        self._course_index = {course_id: i for i, course_id in enumerate(self.courses)}
+        course_values = list(self.courses.values())
+        prof_values = list(self.professors.values())
+        self._arrays = ProblemArrays(
+            course_lecture_hours=np.array([c.lecture_hours for c in course_values], dtype=float),
+            course_lab_hours=np.array([c.lab_hours for c in course_values], dtype=float),
+            course_assessment_hours=np.array([c.assessment_hours for c in course_values], dtype=float),
+            course_prep_factor=np.array([c.prep_factor for c in course_values], dtype=float),
+            course_assessment_weekly=np.array([c.assessment_hours / 15 for c in course_values], dtype=float),
+            course_prep_hours=np.array([c.lecture_hours * c.prep_factor for c in course_values], dtype=float),
+            course_workload=np.array([c.total_workload_hours() for c in course_values], dtype=float),
+            prof_min_teaching_load=np.array([p.min_teaching_load for p in prof_values], dtype=float),
+            prof_max_teaching_load=np.array([p.max_teaching_load for p in prof_values], dtype=float),
+            prof_contracted_hours=np.array([p.contracted_hours() for p in prof_values], dtype=float),
+            prof_research_allocation=np.array([p.research_allocation for p in prof_values], dtype=float),
+            prof_admin_load=np.array([p.admin_load for p in prof_values], dtype=float),
+            prof_expertise_mask=np.array([expertise_mask(p.expertise) for p in prof_values], dtype=np.uint64),
+            prof_primary_mask=np.array([expertise_mask([p.primary_expertise]) for p in prof_values], dtype=np.uint64),
+            course_required_mask=np.array([expertise_mask(c.required_expertise) for c in course_values], dtype=np.uint64)
+        )
+        # Plain-int copies of the masks: scalar ANDs in Python loops skip NumPy scalar overhead
+        self._prof_exp_mask = self._arrays.prof_expertise_mask.tolist()
+        self._prof_primary_mask = self._arrays.prof_primary_mask.tolist()
+        self._course_req_mask = self._arrays.course_required_mask.tolist()
+        # Bit of each course's first required area, compared against the primary-expertise bit
+        self._course_first_req_mask = [expertise_mask(c.required_expertise[:1]) for c in course_values]
+        
+        # Professors with at least one required expertise area, per course, in `self.professors` order
+        self._expert_professors = {
+            course_id: [(prof_id, prof) for (prof_id, prof), prof_mask in zip(self.professors.items(), self._prof_exp_mask)
+                        if prof_mask & required]
+            for course_id, required in zip(self.courses, self._course_req_mask)
+        }
+        
+    def to_arrays(self) -> ProblemArrays:
+        """Columnar course/professor constants, indexed in `self.courses`/`self.professors` order"""
+        return self._arrays
+    
+    def expert_professors(self, course_id: str) -> List[Tuple[str, Professor]]:
+        """(id, professor) pairs sharing an expertise area with the course; shared list, do not modify"""
+        return self._expert_professors[course_id]
+    
+    def _assignment_rows(self, allocations: List[CourseAllocation]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Flatten allocations into (professor index, course index, share) rows, one per assignment"""
+        prof_idx, course_idx, shares = [], [], []
+        for allocation in allocations:
+            c = self._course_index[allocation.course_id]
+            # A professor listed twice on one course still counts once
+            for prof_id in dict.fromkeys(allocation.professor_ids):
+                prof_idx.append(self._prof_index[prof_id])
+                course_idx.append(c)
+                shares.append(allocation.shares.get(prof_id, 0.0))
+        
+        return np.array(prof_idx, dtype=np.int64), np.array(course_idx, dtype=np.int64), np.array(shares, dtype=float)
+    
+    def professor_teaching_hours(self, allocations: List[CourseAllocation]) -> np.ndarray:
+        """Teaching hours of every professor, in `self.professors` order"""
+        return _professor_teaching_hours(*self._assignment_rows(allocations), self._arrays.course_workload,
+                                         len(self._prof_index))
+    
     def calculate_professor_load(self, prof_id: str, allocations: List[CourseAllocation]) -> Dict:
         """Calculate total workload for a professor"""
         total_workload = 0.0
@@ -158,61 +295,85 @@ class WorkloadAllocationProblem:
             'course_workloads': course_workloads
         }
     
+    def calculate_professor_loads(self, allocations: List[CourseAllocation]) -> Dict[str, Dict]:
+        """Calculate the workload of every professor in one pass, keyed in `self.professors` order
+        
+        Same result as calling calculate_professor_load for each professor.
+        """
+        teaching_hours = self.professor_teaching_hours(allocations)
+        course_workload = self._arrays.course_workload
+        
+        # Per-course workload breakdown for every professor
+        course_workloads = {prof_id: {} for prof_id in self.professors}
+        for allocation in allocations:
+            hours = course_workload[self._course_index[allocation.course_id]]
+            for prof_id in allocation.professor_ids:
+                course_workloads[prof_id][allocation.course_id] = hours * (allocation.shares.get(prof_id, 0.0) / 100.0)
+        
+        # Per-professor totals as column arithmetic, then unpacked to plain floats
+        arrays = self._arrays
+        research_hours = arrays.prof_contracted_hours * arrays.prof_research_allocation
+        total_hours = teaching_hours + research_hours + arrays.prof_admin_load
+        load_percentage = (teaching_hours / arrays.prof_max_teaching_load) * 100
+        
+        loads = {}
+        for prof_id, total_workload, research, admin, total, contracted, percentage in zip(
+                self.professors, teaching_hours.tolist(), research_hours.tolist(), arrays.prof_admin_load.tolist(),
+                total_hours.tolist(), arrays.prof_contracted_hours.tolist(), load_percentage.tolist()):
+            loads[prof_id] = {
+                'total_workload': total_workload,
+                'teaching_hours': total_workload,
+                'research_hours': research,
+                'admin_hours': admin,
+                'total_hours': total,
+                'contracted_hours': contracted,
+                'load_percentage': percentage,
+                'course_workloads': course_workloads[prof_id]
+            }
+        return loads
+    
     def calculate_fitness(self, allocations: List[CourseAllocation]) -> float:
         """Calculate overall fitness of allocation with soft constraint penalties"""
         # Check hard constraints first
         constraint_violations = self._count_constraint_violations(allocations)
         
         if constraint_violations == 0:
-            # Valid solution - calculate normal fitness
-            fairness_score = self.calculate_fairness_score(allocations)
-            expertise_score = self.calculate_expertise_score(allocations)
-            balance_score = self.calculate_balance_score(allocations)
-            
-            # Weighted combination
-            total_fitness = (
-                fairness_score * 0.4 +
-                expertise_score * 0.3 +
-                balance_score * 0.3
-            )
-            
-            # Apply soft constraint penalties
-            soft_penalties = self._calculate_soft_constraint_penalties(allocations)
-            total_fitness -= soft_penalties
-            
-            return total_fitness
+            # Valid solution - calculate normal fitness. Teaching hours feed the
+            # fairness, balance and workload penalty terms, so sum them once
+            teaching_hours = self.professor_teaching_hours(allocations)
+            return self._fitness_from_terms(teaching_hours, *self._expertise_terms(allocations))
         else:
             # Invalid solution - use penalty for hard constraint violations
             base_penalty = -10.0 * constraint_violations
             return base_penalty
     
+    def _fitness_from_terms(self, teaching_hours: np.ndarray, expertise_score: float,
+                            expertise_penalty: float) -> float:
+        """Fitness of a valid solution from its teaching hours and expertise terms"""
+        fairness_score = self._fairness_from_hours(teaching_hours)
+        balance_score = self._balance_from_hours(teaching_hours)
+        
+        # Weighted combination
+        total_fitness = (
+            fairness_score * 0.4 +
+            expertise_score * 0.3 +
+            balance_score * 0.3
+        )
+        
+        # Apply soft constraint penalties
+        soft_penalties = self._calculate_soft_constraint_penalties(teaching_hours, expertise_penalty)
+        total_fitness -= soft_penalties
+        
+        return total_fitness
+    
     def _count_constraint_violations(self, allocations: List[CourseAllocation]) -> int:
         """Count hard constraint violations - only essential constraints are hard"""
         violations = 0
         
-        # Track allocated courses and professors
-        allocated_courses = set()
-        professors_with_courses = set()
-        professor_workloads = {}
-        
-        # Count violations for each allocation
-        for allocation in allocations:
-            # Every course must be allocated
-            allocated_courses.add(allocation.course_id)
-            
-            # Every professor must have at least one course
-            for prof_id in allocation.professor_ids:
-                professors_with_courses.add(prof_id)
-                
-                # Initialize workload tracking
-                if prof_id not in professor_workloads:
-                    professor_workloads[prof_id] = 0.0
-                
-                # Add workload for this course
-                course = self.courses[allocation.course_id]
-                share = allocation.shares.get(prof_id, 100.0) / 100.0
-                course_workload = course.total_workload_hours() * share
-                professor_workloads[prof_id] += course_workload
+        # Track allocated courses and professors; built by comprehension and a single
+        # chained set() so the per-allocation work stays in C
+        allocated_courses = {allocation.course_id for allocation in allocations}
+        professors_with_courses = set(chain.from_iterable([allocation.professor_ids for allocation in allocations]))
         
         # Hard constraint 1: All courses must be allocated
         if len(allocated_courses) != len(self.courses):
@@ -239,49 +400,43 @@ class WorkloadAllocationProblem:
             'fairness': True
         }
         
+        prof_idx, course_idx, shares = self._assignment_rows(allocations)
+        teaching_hours = _professor_teaching_hours(prof_idx, course_idx, shares, self._arrays.course_workload,
+                                                   len(self._prof_index))
+        
         # Check workload limits
-        for prof_id in self.professors:
-            load = self.calculate_professor_load(prof_id, allocations)
-            professor = self.professors[prof_id]
-            
-            if load['teaching_hours'] > professor.contracted_hours():
-                results['workload_limits'] = False
-                break
+        if np.any(teaching_hours > self._arrays.prof_contracted_hours):
+            results['workload_limits'] = False
         
-        # Check expertise matching
-        for allocation in allocations:
-            course = self.courses[allocation.course_id]
-            for prof_id in allocation.professor_ids:
-                professor = self.professors[prof_id]
-                if not any(exp in professor.expertise for exp in course.required_expertise):
-                    results['expertise_matching'] = False
-                    break
+        # Check expertise matching: every assignment shares an area with its course
+        if not np.all(self._arrays.prof_expertise_mask[prof_idx] & self._arrays.course_required_mask[course_idx]):
+            results['expertise_matching'] = False
         
         # Check fairness (no professor with 0 workload)
-        for prof_id in self.professors:
-            load = self.calculate_professor_load(prof_id, allocations)
-            if load['teaching_hours'] == 0:
-                results['fairness'] = False
-                break
+        if np.any(teaching_hours == 0):
+            results['fairness'] = False
         
         return results
     
     def calculate_fairness_score(self, allocations: List[CourseAllocation]) -> float:
         """Calculate fairness score based on workload distribution"""
-        workloads = []
-        for prof_id in self.professors:
-            load = self.calculate_professor_load(prof_id, allocations)
-            workloads.append(load['load_percentage'])
+        return self._fairness_from_hours(self.professor_teaching_hours(allocations))
+    
+    def _fairness_from_hours(self, teaching_hours: np.ndarray) -> float:
+        """Fairness score from per-professor teaching hours"""
+        workloads = (teaching_hours / self._arrays.prof_max_teaching_load) * 100
         
-        if not workloads:
+        if not len(workloads):
             return 0.0
         
         # Calculate coefficient of variation (lower is better)
-        mean_load = np.mean(workloads)
+        mean_load = workloads.mean()
         if mean_load == 0:
             return 0.0
         
-        std_load = np.std(workloads)
+        # Population std reusing the mean; the same operations np.std performs, so bit-identical
+        deviations = workloads - mean_load
+        std_load = math.sqrt((deviations * deviations).sum() / len(workloads))
         cv = std_load / mean_load
         
         # Convert to 0-1 scale where 1 is most fair
@@ -290,119 +445,172 @@ class WorkloadAllocationProblem:
     
     def calculate_expertise_score(self, allocations: List[CourseAllocation]) -> float:
         """Calculate expertise matching score"""
-        total_score = 0.0
-        total_allocations = 0
-        
-        for allocation in allocations:
-            course = self.courses[allocation.course_id]
-            course_score = 0.0
-            
-            for prof_id in allocation.professor_ids:
-                professor = self.professors[prof_id]
-                
-                # Check if professor has required expertise
-                if any(exp in professor.expertise for exp in course.required_expertise):
-                    course_score += 1.0
-                
-                # Bonus for primary expertise match
-                if professor.primary_expertise in course.required_expertise:
-                    course_score += 0.5
-            
-            total_score += course_score
-            total_allocations += 1
-        
-        return total_score / total_allocations if total_allocations > 0 else 0.0
+        return self._expertise_terms(allocations)[0]
     
     def calculate_balance_score(self, allocations: List[CourseAllocation]) -> float:
         """Calculate workload balance score"""
-        workloads = []
-        for prof_id in self.professors:
-            load = self.calculate_professor_load(prof_id, allocations)
-            workloads.append(load['teaching_hours'])
+        return self._balance_from_hours(self.professor_teaching_hours(allocations))
+    
+    def _balance_from_hours(self, workloads: np.ndarray) -> float:
+        """Balance score from per-professor teaching hours"""
         
-        if not workloads:
+        if not len(workloads):
             return 0.0
         
         # Calculate how close workloads are to ideal (mean)
-        mean_load = np.mean(workloads)
+        mean_load = workloads.mean()
         if mean_load == 0:
             return 0.0
         
         # Calculate average deviation from mean
-        deviations = [abs(w - mean_load) for w in workloads]
-        avg_deviation = np.mean(deviations)
+        deviations = np.abs(workloads - mean_load)
+        avg_deviation = deviations.mean()
         
         # Convert to 0-1 scale where 1 is most balanced
         balance = max(0, 1 - (avg_deviation / mean_load))
         return balance
 
-    def _calculate_soft_constraint_penalties(self, allocations: List[CourseAllocation]) -> float:
+    def _calculate_soft_constraint_penalties(self, teaching_hours: np.ndarray, expertise_penalty: float) -> float:
         """Calculate penalties for soft constraint violations"""
         total_penalty = 0.0
         
-        # Penalty for workload violations
-        workload_penalty = self._calculate_workload_penalty(allocations)
+        # Penalty for workload violations (2x above contracted hours, 1.5x below the minimum load)
+        workload_penalty = _workload_penalty(teaching_hours, self._arrays.prof_contracted_hours,
+                                             self._arrays.prof_min_teaching_load)
         total_penalty += workload_penalty
         
         # Penalty for expertise mismatches
-        expertise_penalty = self._calculate_expertise_penalty(allocations)
         total_penalty += expertise_penalty
         
         return total_penalty
     
-    def _calculate_workload_penalty(self, allocations: List[CourseAllocation]) -> float:
-        """Calculate penalty for workload constraint violations"""
-        penalty = 0.0
-        
-        for prof_id in self.professors:
-            load = self.calculate_professor_load(prof_id, allocations)
-            professor = self.professors[prof_id]
-            
-            # Penalty for exceeding contracted hours (soft constraint)
-            if load['teaching_hours'] > professor.contracted_hours():
-                excess = load['teaching_hours'] - professor.contracted_hours()
-                penalty += excess * 2.0  # 2x penalty for exceeding contracted hours
-            
-            # Penalty for being under minimum load (soft constraint)
-            if load['teaching_hours'] < professor.min_teaching_load:
-                deficit = professor.min_teaching_load - load['teaching_hours']
-                penalty += deficit * 1.5  # 1.5x penalty for being under minimum
-        
-        return penalty
-    
     def _calculate_expertise_penalty(self, allocations: List[CourseAllocation]) -> float:
         """Calculate penalty for expertise mismatches"""
+        return self._expertise_terms(allocations)[1]
+    
+    def _expertise_terms(self, allocations: List[CourseAllocation]) -> Tuple[float, float]:
+        """Expertise matching score and mismatch penalty, from one walk over the assignments"""
+        total_score = 0.0
+        total_allocations = 0
         penalty = 0.0
         
         for allocation in allocations:
-            course = self.courses[allocation.course_id]
+            c = self._course_index[allocation.course_id]
+            required = self._course_req_mask[c]
+            course_score = 0.0
             
             for prof_id in allocation.professor_ids:
-                professor = self.professors[prof_id]
+                p = self._prof_index[prof_id]
                 
-                # Check expertise match
-                expertise_match = any(exp in professor.expertise for exp in course.required_expertise)
-                
-                if not expertise_match:
+                # Check if professor has required expertise
+                if self._prof_exp_mask[p] & required:
+                    course_score += 1.0
+                else:
                     # Penalty for expertise mismatch
                     penalty += 5.0  # Base penalty for mismatch
                     
                     # Additional penalty if it's not even in primary expertise
-                    if course.required_expertise[0] != professor.primary_expertise:
+                    if self._course_first_req_mask[c] != self._prof_primary_mask[p]:
                         penalty += 2.0
+                
+                # Bonus for primary expertise match
+                if self._prof_primary_mask[p] & required:
+                    course_score += 0.5
+            
+            total_score += course_score
+            total_allocations += 1
         
-        return penalty
+        score = total_score / total_allocations if total_allocations > 0 else 0.0
+        return score, penalty
+
+class IncrementalFitness:
+    """Fitness of a solution kept up to date under single-allocation replacements
+    
+    Caches each allocation's teaching-hour row, expertise score and penalty, so a move
+    that rewrites one allocation re-scores only that allocation. Totals are re-summed in
+    allocation order, giving exactly the value calculate_fitness returns.
+    """
+    
+    def __init__(self, problem: WorkloadAllocationProblem, allocations: List[CourseAllocation]):
+        self.problem = problem
+        self._course_workload = problem._arrays.course_workload.tolist()
+        self._hour_rows = np.array([self._hour_row(a) for a in allocations]).reshape(
+            len(allocations), len(problem.professors))
+        terms = [problem._expertise_terms([a]) for a in allocations]
+        self._expertise_scores = [score for score, _ in terms]
+        self._expertise_penalties = [penalty for _, penalty in terms]
+        
+        # Courses allocated per professor (hard constraint 2); moves never change course ids,
+        # so hard constraint 1 is fixed for the lifetime of the state
+        self._course_counts = np.zeros(len(problem.professors), dtype=np.int64)
+        for allocation in allocations:
+            self._count_professors(allocation, 1)
+        self._missing_courses = len({a.course_id for a in allocations}) != len(problem.courses)
+        self._undo = None
+    
+    def _hour_row(self, allocation: CourseAllocation) -> np.ndarray:
+        """professor_teaching_hours([allocation]) without the flatten and kernel call"""
+        row = np.zeros(len(self.problem.professors))
+        workload = self._course_workload[self.problem._course_index[allocation.course_id]]
+        # Same de-duplication and accumulation as the kernel, so the row is bit-identical
+        for prof_id in dict.fromkeys(allocation.professor_ids):
+            row[self.problem._prof_index[prof_id]] += workload * (allocation.shares.get(prof_id, 0.0) / 100.0)
+        return row
+    
+    def _count_professors(self, allocation: CourseAllocation, delta: int):
+        """Add `delta` to the course count of each professor on the allocation"""
+        for prof_id in set(allocation.professor_ids):
+            self._course_counts[self.problem._prof_index[prof_id]] += delta
+    
+    def fitness(self) -> float:
+        """Fitness of the current state, equal to calculate_fitness on the tracked solution"""
+        constraint_violations = int(self._missing_courses) + int(np.count_nonzero(self._course_counts)
+                                                                 != len(self._course_counts))
+        if constraint_violations:
+            return -10.0 * constraint_violations
+        
+        expertise_score = sum(self._expertise_scores) / len(self._expertise_scores) if self._expertise_scores else 0.0
+        return self.problem._fitness_from_terms(_sum_rows(self._hour_rows), expertise_score,
+                                                sum(self._expertise_penalties))
+    
+    def replace(self, index: int, old: CourseAllocation, new: CourseAllocation) -> float:
+        """Swap allocation `index` from `old` to `new` and return the new fitness; `undo` reverts it"""
+        self._undo = (index, old, new, self._hour_rows[index].copy(),
+                      self._expertise_scores[index], self._expertise_penalties[index])
+        self._hour_rows[index] = self._hour_row(new)
+        self._expertise_scores[index], self._expertise_penalties[index] = self.problem._expertise_terms([new])
+        self._count_professors(old, -1)
+        self._count_professors(new, 1)
+        return self.fitness()
+    
+    def undo(self):
+        """Revert the last replace"""
+        index, old, new, hour_row, expertise_score, expertise_penalty = self._undo
+        self._hour_rows[index] = hour_row
+        self._expertise_scores[index] = expertise_score
+        self._expertise_penalties[index] = expertise_penalty
+        self._count_professors(new, -1)
+        self._count_professors(old, 1)
+        self._undo = None
 
 # ============================================================================
 # HILL CLIMBING ALGORITHM
 # ============================================================================
 
+# Neighborhood moves available to the hill climber
+_HC_STRATEGIES = ('swap_professor', 'change_shares', 'add_professor', 'remove_professor')
+
 class HillClimbing:
     """Hill Climbing algorithm for workload allocation"""
     
-    def __init__(self, problem: WorkloadAllocationProblem, max_iterations: int = 1000):
+    def __init__(self, problem: WorkloadAllocationProblem, max_iterations: int = 1000,
+                 rng: Optional[random.Random] = None):
         self.problem = problem
         self.max_iterations = max_iterations
+        # Random source; defaults to the module-level stream seeded above
+        self.rng = rng if rng is not None else random
+        # Draw pool for swap moves, built once instead of on every neighbor
+        self._professor_ids = list(problem.professors)
         self.best_solution = None
         self.best_fitness = -float('inf')
     
@@ -415,20 +623,21 @@ class HillClimbing:
         
         # Simple greedy allocation
         for course_id, course in self.problem.courses.items():
+            course_workload = course.total_workload_hours()
+            
             # Find professors with matching expertise and available capacity
             suitable_professors = []
-            for prof_id, prof in self.problem.professors.items():
-                if any(exp in prof.expertise for exp in course.required_expertise):
-                    # Check if professor has capacity
-                    current_load = professor_workloads[prof_id]
-                    if current_load + course.total_workload_hours() <= prof.max_teaching_load:
-                        suitable_professors.append((prof_id, prof))
+            for prof_id, prof in self.problem.expert_professors(course_id):
+                # Check if professor has capacity
+                current_load = professor_workloads[prof_id]
+                if current_load + course_workload <= prof.max_teaching_load:
+                    suitable_professors.append((prof_id, prof))
             
             if not suitable_professors:
                 # If no suitable professor with capacity, find any with capacity
                 for prof_id, prof in self.problem.professors.items():
                     current_load = professor_workloads[prof_id]
-                    if current_load + course.total_workload_hours() <= prof.max_teaching_load:
+                    if current_load + course_workload <= prof.max_teaching_load:
                         suitable_professors.append((prof_id, prof))
             
             if not suitable_professors:
@@ -439,7 +648,7 @@ class HillClimbing:
             if course.can_be_shared and course.max_professors > 1:
                 # Team teaching
                 num_profs = min(course.max_professors, len(suitable_professors))
-                selected_profs = random.sample(suitable_professors, num_profs)
+                selected_profs = self.rng.sample(suitable_professors, num_profs)
                 
                 # Equal shares
                 shares = {prof_id: 100.0 / num_profs for prof_id, _ in selected_profs}
@@ -451,11 +660,11 @@ class HillClimbing:
                 
                 # Update workloads
                 for prof_id, _ in selected_profs:
-                    workload = course.total_workload_hours() / num_profs
+                    workload = course_workload / num_profs
                     professor_workloads[prof_id] += workload
             else:
                 # Single professor
-                selected_prof_id, _ = random.choice(suitable_professors)
+                selected_prof_id, _ = self.rng.choice(suitable_professors)
                 allocation = CourseAllocation(
                     course_id=course.id,
                     professor_ids=[selected_prof_id],
@@ -463,7 +672,7 @@ class HillClimbing:
                 )
                 
                 # Update workload
-                professor_workloads[selected_prof_id] += course.total_workload_hours()
+                professor_workloads[selected_prof_id] += course_workload
             
             allocations.append(allocation)
         
@@ -523,20 +732,27 @@ class HillClimbing:
     
     def get_neighbor(self, allocations: List[CourseAllocation]) -> List[CourseAllocation]:
         """Generate neighbor solution"""
-        neighbor = copy.deepcopy(allocations)
-        
+        return self._propose_neighbor(allocations)[0]
+    
+    def _propose_neighbor(self, allocations: List[CourseAllocation]) -> Tuple[List[CourseAllocation], int]:
+        """Generate a neighbor solution and the index of the allocation it changed"""
         # Randomly select a course to modify
-        course_idx = random.randint(0, len(neighbor) - 1)
+        course_idx = self.rng.randint(0, len(allocations) - 1)
         course = self.problem.course_list[course_idx]
         
+        # Copy on write: only the selected allocation is modified, so the
+        # neighbor shares every other allocation object with allocations
+        neighbor = list(allocations)
+        neighbor[course_idx] = allocations[course_idx].copy()
+        
         # Random modification strategy
-        strategy = random.choice(['swap_professor', 'change_shares', 'add_professor', 'remove_professor'])
+        strategy = self.rng.choice(_HC_STRATEGIES)
         
         if strategy == 'swap_professor':
             # Swap one professor with another
             if len(neighbor[course_idx].professor_ids) == 1:
                 old_prof_id = neighbor[course_idx].professor_ids[0]
-                new_prof_id = random.choice(list(self.problem.professors.keys()))
+                new_prof_id = self.rng.choice(self._professor_ids)
                 if new_prof_id != old_prof_id:
                     neighbor[course_idx].professor_ids = [new_prof_id]
                     neighbor[course_idx].shares = {new_prof_id: 100.0}
@@ -550,7 +766,7 @@ class HillClimbing:
                 
                 for i, prof_id in enumerate(prof_ids[:-1]):
                     if remaining > 0:
-                        share = random.uniform(20.0, remaining - (len(prof_ids) - i - 1) * 20.0)
+                        share = self.rng.uniform(20.0, remaining - (len(prof_ids) - i - 1) * 20.0)
                         new_shares[prof_id] = share
                         remaining -= share
                     else:
@@ -570,7 +786,7 @@ class HillClimbing:
                                  if p.id not in current_profs]
                 
                 if available_profs:
-                    new_prof = random.choice(available_profs)
+                    new_prof = self.rng.choice(available_profs)
                     neighbor[course_idx].professor_ids.append(new_prof.id)
                     
                     # Redistribute shares
@@ -582,7 +798,7 @@ class HillClimbing:
         elif strategy == 'remove_professor':
             # Remove a professor if possible
             if len(neighbor[course_idx].professor_ids) > course.min_professors:
-                prof_to_remove = random.choice(neighbor[course_idx].professor_ids)
+                prof_to_remove = self.rng.choice(neighbor[course_idx].professor_ids)
                 neighbor[course_idx].professor_ids.remove(prof_to_remove)
                 
                 # Redistribute shares
@@ -592,12 +808,14 @@ class HillClimbing:
                                 for prof_id in remaining_profs}
                     neighbor[course_idx].shares = new_shares
         
-        return neighbor
+        return neighbor, course_idx
     
     def solve(self) -> Tuple[List[CourseAllocation], float]:
         """Solve the allocation problem"""
         current_solution = self.generate_initial_solution()
-        current_fitness = self.problem.calculate_fitness(current_solution)
+        # Neighbors differ in one allocation, so score them by patching the current state
+        state = IncrementalFitness(self.problem, current_solution)
+        current_fitness = state.fitness()
         
         self.best_solution = current_solution
         self.best_fitness = current_fitness
@@ -605,8 +823,11 @@ class HillClimbing:
         iterations_without_improvement = 0
         
         for iteration in range(self.max_iterations):
-            neighbor = self.get_neighbor(current_solution)
-            neighbor_fitness = self.problem.calculate_fitness(neighbor)
+            neighbor, changed = self._propose_neighbor(current_solution)
+            # Many moves leave the allocation as it was; those keep the current score
+            moved = neighbor[changed] != current_solution[changed]
+            neighbor_fitness = (state.replace(changed, current_solution[changed], neighbor[changed])
+                                if moved else current_fitness)
             
             if neighbor_fitness > current_fitness:
                 current_solution = neighbor
@@ -614,9 +835,12 @@ class HillClimbing:
                 iterations_without_improvement = 0
                 
                 if current_fitness > self.best_fitness:
-                    self.best_solution = copy.deepcopy(current_solution)
+                    # Neighbors never mutate shared allocations, so a shallow snapshot is enough
+                    self.best_solution = list(current_solution)
                     self.best_fitness = current_fitness
             else:
+                if moved:
+                    state.undo()
                 iterations_without_improvement += 1
             
             # Early stopping if no improvement
@@ -635,16 +859,34 @@ class GeneticAlgorithm:
     def __init__(self, problem: WorkloadAllocationProblem, 
                  population_size: int = 100, generations: int = 300,
                  mutation_rate: float = 0.15, crossover_rate: float = 0.8,
-                 elite_size: int = 15):
+                 elite_size: int = 15,
+                 evaluator: Optional[Callable[[List[List[CourseAllocation]]], List[float]]] = None,
+                 rng: Optional[random.Random] = None):
         self.problem = problem
         self.population_size = population_size
         self.generations = generations
         self.mutation_rate = mutation_rate
         self.crossover_rate = crossover_rate
         self.elite_size = elite_size
+        # Batch fitness evaluator (e.g. a process pool map); defaults to serial evaluation
+        self.evaluator = evaluator
+        # Random source; defaults to the module-level stream seeded above
+        self.rng = rng if rng is not None else random
+        # Draw pool for swap moves, built once instead of on every mutation
+        self._professor_ids = list(problem.professors)
         self.best_solution = None
         self.best_fitness = -float('inf')
     
+    def evaluate_population(self, population: List[List[CourseAllocation]]) -> List[Tuple[List[CourseAllocation], float]]:
+        """Pair each individual with its fitness, sorted best first"""
+        if self.evaluator is not None:
+            fitness_values = self.evaluator(population)
+        else:
+            fitness_values = [self.problem.calculate_fitness(individual) for individual in population]
+        population_fitness = list(zip(population, fitness_values))
+        population_fitness.sort(key=lambda x: x[1], reverse=True)
+        return population_fitness
+    
     def create_individual(self) -> List[CourseAllocation]:
         """Create a feasible individual"""
         allocations = []
@@ -654,31 +896,27 @@ class GeneticAlgorithm:
         
         # Allocate courses one by one
         for course_id, course in self.problem.courses.items():
+            course_workload = course.total_workload_hours()
+            
             # Find suitable professors with available capacity
             suitable_professors = []
-            for prof_id, prof in self.problem.professors.items():
-                # Check expertise match
-                if any(exp in prof.expertise for exp in course.required_expertise):
-                    # Check capacity
-                    current_load = professor_workloads[prof_id]
-                    course_workload = course.total_workload_hours()
-                    
-                    if current_load + course_workload <= prof.max_teaching_load:
-                        suitable_professors.append((prof_id, prof))
+            for prof_id, prof in self.problem.expert_professors(course_id):
+                # Expertise already matches; check capacity
+                current_load = professor_workloads[prof_id]
+                if current_load + course_workload <= prof.max_teaching_load:
+                    suitable_professors.append((prof_id, prof))
             
             if not suitable_professors:
                 # Find any professor with capacity
                 for prof_id, prof in self.problem.professors.items():
                     current_load = professor_workloads[prof_id]
-                    course_workload = course.total_workload_hours()
-                    
                     if current_load + course_workload <= prof.max_teaching_load:
                         suitable_professors.append((prof_id, prof))
                         break
             
             if suitable_professors:
                 # Choose randomly from suitable professors
-                chosen_prof_id, _ = random.choice(suitable_professors)
+                chosen_prof_id, _ = self.rng.choice(suitable_professors)
                 
                 # Create allocation
                 allocation = CourseAllocation(
@@ -689,10 +927,10 @@ class GeneticAlgorithm:
                 allocations.append(allocation)
                 
                 # Update workload
-                professor_workloads[chosen_prof_id] += course.total_workload_hours()
+                professor_workloads[chosen_prof_id] += course_workload
             else:
                 # Create allocation anyway (will be repaired)
-                prof_id = random.choice(list(self.problem.professors.keys()))
+                prof_id = self.rng.choice(self._professor_ids)
                 allocation = CourseAllocation(
                     course_id=course.id,
                     professor_ids=[prof_id],
@@ -731,32 +969,32 @@ class GeneticAlgorithm:
     def crossover(self, parent1: List[CourseAllocation], 
                  parent2: List[CourseAllocation]) -> List[CourseAllocation]:
         """Perform crossover between two parents"""
-        if random.random() > self.crossover_rate:
-            return copy.deepcopy(parent1)
+        if self.rng.random() > self.crossover_rate:
+            return [allocation.copy() for allocation in parent1]
         
         child = []
         
         for i in range(len(parent1)):
-            if random.random() < 0.5:
-                child.append(copy.deepcopy(parent1[i]))
+            if self.rng.random() < 0.5:
+                child.append(parent1[i].copy())
             else:
-                child.append(copy.deepcopy(parent2[i]))
+                child.append(parent2[i].copy())
         
         return child
     
     def mutate(self, individual: List[CourseAllocation]):
         """Mutate an individual"""
         for allocation in individual:
-            if random.random() < self.mutation_rate:
+            if self.rng.random() < self.mutation_rate:
                 course = self.problem.courses[allocation.course_id]
                 
                 # Random mutation strategy
-                strategy = random.choice(['swap_professor', 'change_shares', 'modify_team'])
+                strategy = self.rng.choice(['swap_professor', 'change_shares', 'modify_team'])
                 
                 if strategy == 'swap_professor':
                     if len(allocation.professor_ids) == 1:
                         old_prof_id = allocation.professor_ids[0]
-                        new_prof_id = random.choice(list(self.problem.professors.keys()))
+                        new_prof_id = self.rng.choice(self._professor_ids)
                         if new_prof_id != old_prof_id:
                             allocation.professor_ids = [new_prof_id]
                             allocation.shares = {new_prof_id: 100.0}
@@ -769,7 +1007,7 @@ class GeneticAlgorithm:
                         
                         for i, prof_id in enumerate(prof_ids[:-1]):
                             if remaining > 0:
-                                share = random.uniform(20.0, remaining - (len(prof_ids) - i - 1) * 20.0)
+                                share = self.rng.uniform(20.0, remaining - (len(prof_ids) - i - 1) * 20.0)
                                 new_shares[prof_id] = share
                                 remaining -= share
                             else:
@@ -778,13 +1016,14 @@ class GeneticAlgorithm:
                         new_shares[prof_ids[-1]] = remaining
                         allocation.shares = new_shares
     
-    def tournament_selection(self, population: List[List[CourseAllocation]], 
+    def tournament_selection(self, population_fitness: List[Tuple[List[CourseAllocation], float]],
                            tournament_size: int = 3) -> List[CourseAllocation]:
-        """Select individual using tournament selection"""
-        tournament = random.sample(population, tournament_size)
-        tournament_fitness = [self.problem.calculate_fitness(ind) for ind in tournament]
-        winner_idx = tournament_fitness.index(max(tournament_fitness))
-        return copy.deepcopy(tournament[winner_idx])
+        """Select individual using tournament selection on the already evaluated fitness"""
+        tournament = self.rng.sample(population_fitness, tournament_size)
+        # max keeps the first of equal scores, as index(max(...)) did
+        winner, _ = max(tournament, key=lambda entry: entry[1])
+        # Callers copy before mutating, so the winner can be shared
+        return winner
     
     def solve(self) -> Tuple[List[CourseAllocation], float]:
         """Solve the allocation problem using genetic algorithm"""
@@ -792,53 +1031,48 @@ class GeneticAlgorithm:
         population = [self.create_individual() for _ in range(self.population_size)]
         
         # Evaluate initial population
-        population_fitness = [(individual, self.problem.calculate_fitness(individual)) 
-                             for individual in population]
-        population_fitness.sort(key=lambda x: x[1], reverse=True)
+        population_fitness = self.evaluate_population(population)
         
         best_individual = population_fitness[0][0]
         best_fitness = population_fitness[0][1]
         
+        # elite_size is a count of individuals, capped at the population size
+        elite_size = min(self.elite_size, self.population_size)
+        
         for generation in range(self.generations):
-            # Create new population
-            new_population = []
-            
-            # Elitism: keep best individuals
-            elite_size = int(self.population_size * self.elite_size)
-            new_population.extend([ind for ind, _ in population_fitness[:elite_size]])
+            # Elitism: keep best individuals together with their fitness
+            elites = population_fitness[:elite_size]
             
             # Generate rest of population
-            while len(new_population) < self.population_size:
+            children = []
+            while len(elites) + len(children) < self.population_size:
                 # Selection
                 parent1 = self.tournament_selection(population_fitness)
                 parent2 = self.tournament_selection(population_fitness)
                 
                 # Crossover
-                if random.random() < self.crossover_rate:
+                if self.rng.random() < self.crossover_rate:
                     child = self.crossover(parent1, parent2)
                 else:
-                    child = copy.deepcopy(parent1)
+                    child = [allocation.copy() for allocation in parent1]
                 
                 # Mutation
-                if random.random() < self.mutation_rate:
+                if self.rng.random() < self.mutation_rate:
                     self.mutate(child)
                 
                 # Ensure all professors have courses
                 self._ensure_all_professors_have_courses(child)
                 
-                new_population.append(child)
-            
-            # Update population
-            population = new_population
+                children.append(child)
             
-            # Evaluate new population
-            population_fitness = [(individual, self.problem.calculate_fitness(individual)) 
-                                 for individual in population]
+            # Only the children need evaluating; the stable sort keeps elites ahead of
+            # equally fit children, the order a full re-evaluation produced
+            population_fitness = elites + self.evaluate_population(children)
             population_fitness.sort(key=lambda x: x[1], reverse=True)
             
             # Update best solution
             if population_fitness[0][1] > best_fitness:
-                best_individual = copy.deepcopy(population_fitness[0][0])
+                best_individual = population_fitness[0][0]
                 best_fitness = population_fitness[0][1]
         
         return best_individual, best_fitness
@@ -852,30 +1086,42 @@ class SimulatedAnnealing:
     
     def __init__(self, problem: WorkloadAllocationProblem, 
                  initial_temp: float = 100.0, cooling_rate: float = 0.995,
-                 min_temp: float = 0.1, max_iterations: int = 5000):
+                 min_temp: float = 0.1, max_iterations: int = 5000,
+                 rng: Optional[random.Random] = None):
         self.problem = problem
         self.initial_temp = initial_temp
         self.cooling_rate = cooling_rate
         self.min_temp = min_temp
         self.max_iterations = max_iterations
+        # Random source; defaults to the module-level stream seeded above
+        self.rng = rng if rng is not None else random
+        # Draw pool for swap moves, built once instead of on every mutation
+        self._professor_ids = list(problem.professors)
         self.best_solution = None
         self.best_fitness = -float('inf')
     
     def generate_neighbor(self, current: List[CourseAllocation]) -> List[CourseAllocation]:
         """Generate neighbor solution"""
-        neighbor = copy.deepcopy(current)
-        
+        return self._propose_neighbor(current)[0]
+    
+    def _propose_neighbor(self, current: List[CourseAllocation]) -> Tuple[List[CourseAllocation], int]:
+        """Generate a neighbor solution and the index of the allocation it changed"""
         # Randomly select a course to modify
-        course_idx = random.randint(0, len(neighbor) - 1)
+        course_idx = self.rng.randint(0, len(current) - 1)
         course = self.problem.course_list[course_idx]
         
+        # Copy on write: only the selected allocation is modified, so the
+        # neighbor shares every other allocation object with current
+        neighbor = list(current)
+        neighbor[course_idx] = current[course_idx].copy()
+        
         # Random modification
-        strategy = random.choice(['swap_professor', 'change_shares', 'modify_team'])
+        strategy = self.rng.choice(['swap_professor', 'change_shares', 'modify_team'])
         
         if strategy == 'swap_professor':
             if len(neighbor[course_idx].professor_ids) == 1:
                 old_prof_id = neighbor[course_idx].professor_ids[0]
-                new_prof_id = random.choice(list(self.problem.professors.keys()))
+                new_prof_id = self.rng.choice(self._professor_ids)
                 if new_prof_id != old_prof_id:
                     neighbor[course_idx].professor_ids = [new_prof_id]
                     neighbor[course_idx].shares = {new_prof_id: 100.0}
@@ -888,7 +1134,7 @@ class SimulatedAnnealing:
                 
                 for i, prof_id in enumerate(prof_ids[:-1]):
                     if remaining > 0:
-                        share = random.uniform(20.0, remaining - (len(prof_ids) - i - 1) * 20.0)
+                        share = self.rng.uniform(20.0, remaining - (len(prof_ids) - i - 1) * 20.0)
                         new_shares[prof_id] = share
                         remaining -= share
                     else:
@@ -906,7 +1152,7 @@ class SimulatedAnnealing:
                     available_profs = [p for p in self.problem.professor_list 
                                      if p.id not in neighbor[course_idx].professor_ids]
                     if available_profs:
-                        new_prof = random.choice(available_profs)
+                        new_prof = self.rng.choice(available_profs)
                         neighbor[course_idx].professor_ids.append(new_prof.id)
                         
                         # Equal shares
@@ -917,7 +1163,7 @@ class SimulatedAnnealing:
                 
                 elif current_size > course.min_professors:
                     # Remove a professor
-                    prof_to_remove = random.choice(neighbor[course_idx].professor_ids)
+                    prof_to_remove = self.rng.choice(neighbor[course_idx].professor_ids)
                     neighbor[course_idx].professor_ids.remove(prof_to_remove)
                     
                     # Redistribute shares
@@ -927,34 +1173,43 @@ class SimulatedAnnealing:
                                     for prof_id in remaining_profs}
                         neighbor[course_idx].shares = new_shares
         
-        return neighbor
+        return neighbor, course_idx
     
     def solve(self) -> Tuple[List[CourseAllocation], float]:
         """Solve the allocation problem using simulated annealing"""
         current_solution = self.generate_initial_solution()
-        current_fitness = self.problem.calculate_fitness(current_solution)
+        # Neighbors differ in one allocation, so score them by patching the current state
+        state = IncrementalFitness(self.problem, current_solution)
+        current_fitness = state.fitness()
         
-        best_solution = copy.deepcopy(current_solution)
+        # Allocations are never modified once they are part of a solution,
+        # so snapshots of the current solution only need to copy the list
+        best_solution = list(current_solution)
         best_fitness = current_fitness
         
         temperature = self.initial_temp
         
         for iteration in range(self.max_iterations):
             # Generate neighbor
-            neighbor = self.generate_neighbor(current_solution)
-            neighbor_fitness = self.problem.calculate_fitness(neighbor)
+            neighbor, changed = self._propose_neighbor(current_solution)
+            # Many moves leave the allocation as it was; those keep the current score
+            moved = neighbor[changed] != current_solution[changed]
+            neighbor_fitness = (state.replace(changed, current_solution[changed], neighbor[changed])
+                                if moved else current_fitness)
             
             # Calculate acceptance probability
             delta_e = neighbor_fitness - current_fitness
             
-            if delta_e > 0 or random.random() < math.exp(delta_e / temperature):
+            if delta_e > 0 or self.rng.random() < math.exp(delta_e / temperature):
                 current_solution = neighbor
                 current_fitness = neighbor_fitness
                 
                 # Update best solution
                 if current_fitness > best_fitness:
-                    best_solution = copy.deepcopy(current_solution)
+                    best_solution = list(current_solution)
                     best_fitness = current_fitness
+            elif moved:
+                state.undo()
             
             # Cool down
             temperature *= self.cooling_rate
@@ -973,31 +1228,27 @@ class SimulatedAnnealing:
         
         # Allocate courses one by one
         for course_id, course in self.problem.courses.items():
+            course_workload = course.total_workload_hours()
+            
             # Find suitable professors with available capacity
             suitable_professors = []
-            for prof_id, prof in self.problem.professors.items():
-                # Check expertise match
-                if any(exp in prof.expertise for exp in course.required_expertise):
-                    # Check capacity
-                    current_load = professor_workloads[prof_id]
-                    course_workload = course.total_workload_hours()
-                    
-                    if current_load + course_workload <= prof.max_teaching_load:
-                        suitable_professors.append((prof_id, prof))
+            for prof_id, prof in self.problem.expert_professors(course_id):
+                # Expertise already matches; check capacity
+                current_load = professor_workloads[prof_id]
+                if current_load + course_workload <= prof.max_teaching_load:
+                    suitable_professors.append((prof_id, prof))
             
             if not suitable_professors:
                 # Find any professor with capacity
                 for prof_id, prof in self.problem.professors.items():
                     current_load = professor_workloads[prof_id]
-                    course_workload = course.total_workload_hours()
-                    
                     if current_load + course_workload <= prof.max_teaching_load:
                         suitable_professors.append((prof_id, prof))
                         break
             
             if suitable_professors:
                 # Choose randomly from suitable professors
-                chosen_prof_id, _ = random.choice(suitable_professors)
+                chosen_prof_id, _ = self.rng.choice(suitable_professors)
                 
                 # Create allocation
                 allocation = CourseAllocation(
@@ -1008,10 +1259,10 @@ class SimulatedAnnealing:
                 allocations.append(allocation)
                 
                 # Update workload
-                professor_workloads[chosen_prof_id] += course.total_workload_hours()
+                professor_workloads[chosen_prof_id] += course_workload
             else:
                 # Create allocation anyway (will be repaired)
-                prof_id = random.choice(list(self.problem.professors.keys()))
+                prof_id = self.rng.choice(self._professor_ids)
                 allocation = CourseAllocation(
                     course_id=course.id,
                     professor_ids=[prof_id],